@@ -0,0 +1,4 @@
+"""
+Benchmark scripts for the pricing and dispatch engines.
+Run from the repository root, e.g. `python -m benchmarks.pricing_batch`.
+"""
@@ -0,0 +1,59 @@
+"""
+Benchmark: AcceptanceEstimator on a synthetic offer history with known
+per-segment sigmoids (vehicle x weather x zone). Measures the streaming
+(recursive) update rate, the vectorized batch refit time, and how close each
+recovers the true k and M0.
+
+    python -m benchmarks.acceptance_fit --events 3000000 --zones 20
+"""
+import argparse
+import time
+
+import numpy as np
+
+from logistics_engine.acceptance_estimator import AcceptanceEstimator, segment_key
+from logistics_engine.pricing_engine import VehicleType
+
+def generate_history(n: int, zones: int, seed: int = 17):
+    """(segment keys, true (k, M0) per key, event codes, margins, accepted)."""
+    rng = np.random.default_rng(seed)
+    keys = [segment_key(v, w, z) for v in VehicleType for w in (False, True) for z in range(zones)]
+    truth = np.column_stack([rng.uniform(0.08, 0.3, len(keys)), rng.uniform(10.0, 35.0, len(keys))])
+    codes = rng.integers(len(keys), size=n)
+    margins = rng.uniform(-10.0, 70.0, n)
+    k, midpoint = truth[codes, 0], truth[codes, 1]
+    accepted = rng.random(n) < 1 / (1 + np.exp(-k * (margins - midpoint)))
+    return keys, truth, codes, margins, accepted
+
+def errors(estimator: AcceptanceEstimator, keys, truth):
+    fitted = np.array([estimator.parameters(key)[:2] for key in keys])
+    return (np.abs(fitted[:, 0] - truth[:, 0]) / truth[:, 0]).max(), np.abs(fitted[:, 1] - truth[:, 1]).max()
+
+def run(n: int, zones: int, stream_events: int):
+    keys, truth, codes, margins, accepted = generate_history(n, zones)
+
+    online = AcceptanceEstimator(forgetting=1.0)
+    m = min(stream_events, n)
+    events = [keys[c] for c in codes[:m]]
+    start = time.perf_counter()
+    online.observe_many(events, margins[:m].tolist(), accepted[:m].tolist())
+    online_s = time.perf_counter() - start
+    k_err, m_err = errors(online, keys, truth)
+    print(f"streaming {m:>10,} events | {m / online_s:>10,.0f} events/s | "
+          f"max k error {k_err:6.1%} | max M0 error {m_err:5.2f}")
+
+    batch = AcceptanceEstimator()
+    start = time.perf_counter()
+    batch.refit(codes, margins, accepted, keys=keys)
+    refit_s = time.perf_counter() - start
+    k_err, m_err = errors(batch, keys, truth)
+    print(f"refit     {n:>10,} events | {refit_s:>8.2f} s total | "
+          f"max k error {k_err:6.1%} | max M0 error {m_err:5.2f} ({len(keys)} segments)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark acceptance-sigmoid estimation")
+    parser.add_argument("--events", type=int, default=3_000_000)
+    parser.add_argument("--zones", type=int, default=20)
+    parser.add_argument("--stream-events", type=int, default=300_000, help="Events fed through observe()")
+    args = parser.parse_args()
+    run(args.events, args.zones, args.stream_events)
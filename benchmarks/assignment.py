@@ -0,0 +1,52 @@
+"""
+Benchmark: global batch assignment (AssignmentEngine) at N orders x M drivers.
+Reports solve time, orders/s, total match score and how many orders the
+per-order greedy ranking would send to an already-claimed top driver.
+
+    python -m benchmarks.assignment --shapes 100x1000 1000x10000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from logistics_engine.assignment import AssignmentEngine
+from logistics_engine.driver_fleet import DriverFleet
+from logistics_engine.pricing_engine import MoveRequest, VehicleType
+from benchmarks.spatial_dispatch import generate_metro_fleet
+
+def run(n_orders: int, n_drivers: int, methods):
+    drivers, side_km = generate_metro_fleet(n_drivers)
+    for d in drivers:
+        d.is_busy = False
+    fleet = DriverFleet.from_drivers(drivers)
+    origins = np.random.default_rng(5).uniform(0.0, side_km, (n_orders, 2))
+    orders = [MoveRequest(10.0, VehicleType.VAN, origin_km=(float(x), float(y))) for x, y in origins]
+    engine = AssignmentEngine()
+
+    distance = np.hypot(fleet.x_km[None, :] - origins[:, :1], fleet.y_km[None, :] - origins[:, 1:])
+    scores = engine.dispatcher.score_drivers(fleet.rating[None, :], distance, fleet.days_in_system[None, :])
+    greedy_top = scores.argmax(axis=1)
+    collisions = n_orders - len(np.unique(greedy_top))
+
+    for method in methods:
+        start = time.perf_counter()
+        cascades = engine.assign(orders, fleet, method=method)
+        solve_s = time.perf_counter() - start
+        primary = [c[0] for c in cascades if c]
+        index = {driver_id: i for i, driver_id in enumerate(fleet.ids)}
+        total = sum(scores[o, index[c[0]]] for o, c in enumerate(cascades) if c)
+        used = [d for c in cascades for d in c]
+        assert len(used) == len(set(used)), "cascades must not share drivers"
+        print(f"{n_orders:>5} x {n_drivers:<6} {method:<6} | solve {solve_s*1e3:8.1f} ms | "
+              f"{n_orders / solve_s:9,.0f} orders/s | primary score {total:9.2f} | "
+              f"matched {len(primary)}/{n_orders} | greedy collisions {collisions}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batch order->driver assignment")
+    parser.add_argument("--shapes", nargs="+", default=["100x1000", "1000x10000"])
+    parser.add_argument("--methods", nargs="+", default=["dense", "sparse"])
+    args = parser.parse_args()
+    for shape in args.shapes:
+        n, m = (int(v) for v in shape.lower().split("x"))
+        run(n, m, args.methods)
@@ -0,0 +1,84 @@
+"""
+Benchmark: many concurrent order cascades on one asyncio event loop.
+Orders arrive uniformly over --arrival-s and each ranks its k nearest free
+drivers (GridIndex) on a metro fleet. With production timings (10 s batches,
+answers within 15 s) a cascade lives up to 30 s, so ~8k orders are in flight
+at the peak. Reports admission lag (arrival -> first batch sent) and
+escalation latency (batch expiry -> next batch sent) on the shared loop.
+
+    python -m benchmarks.async_cascade --orders 10000 --arrival-s 15
+"""
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from logistics_engine.async_dispatch import CascadeOrchestrator, FakeOfferTransport
+from benchmarks.spatial_dispatch import generate_metro_fleet
+from logistics_engine.driver_fleet import DriverFleet
+from logistics_engine.pricing_engine import MoveRequest, VehicleType
+from logistics_engine.spatial_index import GridIndex
+
+def run(n_orders: int, n_drivers: int, k: int, arrival_s: float, batch_timeout_s: float,
+        max_latency_s: float, accept: float):
+    drivers, side_km = generate_metro_fleet(n_drivers)
+    fleet = DriverFleet.from_drivers(drivers)
+    index = GridIndex.from_drivers(fleet, cell_km=1.0)
+    rng = np.random.default_rng(4)
+    origins = rng.uniform(0.0, side_km, (n_orders, 2))
+    arrivals = np.sort(rng.uniform(0.0, arrival_s, n_orders))
+
+    transport = FakeOfferTransport(lambda price: accept, max_latency_s=max_latency_s, seed=4)
+    orchestrator = CascadeOrchestrator(transport=transport, batch_timeout_s=batch_timeout_s)
+    dispatcher = orchestrator.dispatcher
+    order = MoveRequest(12.0, VehicleType.VAN)
+
+    admission_lag, in_flight, peak = [], 0, 0
+
+    async def one(i: int, t0: float):
+        nonlocal in_flight, peak
+        loop = asyncio.get_running_loop()
+        await asyncio.sleep(t0 + arrivals[i] - loop.time())
+        admission_lag.append(loop.time() - t0 - arrivals[i])
+        in_flight += 1
+        peak = max(peak, in_flight)
+        candidates = dispatcher.nearby_drivers(index, fleet, tuple(origins[i]), k=k)
+        result = await orchestrator.dispatch(f"o{i}", order, candidates)
+        in_flight -= 1
+        return result
+
+    async def main():
+        t0 = asyncio.get_running_loop().time()
+        return await asyncio.gather(*(one(i, t0) for i in range(n_orders)))
+
+    start = time.perf_counter()
+    results = asyncio.run(main())
+    wall = time.perf_counter() - start
+
+    filled = [r for r in results if r.driver_id]
+    escalations = np.array([lat for r in results for lat in r.escalation_latency_s]) * 1e3
+    attempts = np.bincount([r.attempt for r in filled], minlength=4)[1:]
+    lag = np.array(admission_lag) * 1e3
+    print(f"{n_orders:,} orders over {arrival_s:g}s (peak {peak:,} in flight), {n_drivers:,} drivers (k={k}): "
+          f"wall {wall:.2f}s, "
+          f"filled {len(filled):,}, by attempt {attempts.tolist()}, "
+          f"offers sent {transport.sent:,}, cancelled {transport.cancelled:,}")
+    print(f"admission lag: p50 {np.percentile(lag, 50):.1f} ms, p99 {np.percentile(lag, 99):.1f} ms, "
+          f"max {lag.max():.1f} ms")
+    if escalations.size:
+        print(f"escalation latency: p50 {np.percentile(escalations, 50):.1f} ms, "
+              f"p99 {np.percentile(escalations, 99):.1f} ms, max {escalations.max():.1f} ms "
+              f"({escalations.size:,} escalations)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the asyncio cascade orchestrator")
+    parser.add_argument("--orders", type=int, default=10_000)
+    parser.add_argument("--drivers", type=int, default=20_000)
+    parser.add_argument("--k", type=int, default=50, help="Nearest free drivers per order")
+    parser.add_argument("--arrival-s", type=float, default=15.0, help="Window over which orders arrive")
+    parser.add_argument("--batch-timeout", type=float, default=10.0)
+    parser.add_argument("--max-latency", type=float, default=15.0, help="Slowest driver answer (s)")
+    parser.add_argument("--accept", type=float, default=0.05)
+    args = parser.parse_args()
+    run(args.orders, args.drivers, args.k, args.arrival_s, args.batch_timeout, args.max_latency, args.accept)
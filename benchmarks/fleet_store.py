@@ -0,0 +1,57 @@
+"""
+Benchmark: List[Driver] dataclasses vs the columnar DriverFleet store.
+Reports memory held by the pool (tracemalloc), top-2-batch ranking latency
+and busy/free toggling cost.
+
+    python -m benchmarks.fleet_store --fleet-sizes 10000 100000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+
+from logistics_engine.dispatch_engine import DispatchEngine
+from logistics_engine.driver_fleet import DriverFleet
+from benchmarks.rank_topk import generate_fleet
+
+def measure_memory(build):
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current
+
+def time_first_two_batches(dispatcher, pool, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        batches = [batch for _, batch in zip(range(2), dispatcher.iter_batches(pool))]
+    return (time.perf_counter() - start) / repeats, batches
+
+def run(n: int, repeats: int = 5):
+    dispatcher = DispatchEngine()
+    drivers, list_bytes = measure_memory(lambda: generate_fleet(n))
+    fleet, fleet_bytes = measure_memory(lambda: DriverFleet.from_drivers(drivers))
+
+    list_s, list_batches = time_first_two_batches(dispatcher, drivers, repeats)
+    fleet_s, fleet_batches = time_first_two_batches(dispatcher, fleet, repeats)
+    assert [d.id for b in list_batches for d in b] == [d.id for b in fleet_batches for d in b]
+
+    ids = [d.id for d in drivers]
+    picks = np.random.default_rng(0).integers(0, n, 10_000)
+    start = time.perf_counter()
+    for i in picks:
+        fleet.set_busy(ids[i], not fleet.is_busy[i])
+    toggle_us = (time.perf_counter() - start) / len(picks) * 1e6
+
+    print(f"{n:>8,} drivers | memory list {list_bytes/1e6:7.2f} MB vs fleet {fleet_bytes/1e6:6.2f} MB | "
+          f"rank list {list_s*1e3:7.2f} ms vs fleet {fleet_s*1e3:6.2f} ms | toggle {toggle_us:.2f} us")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the columnar driver store")
+    parser.add_argument("--fleet-sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+    for size in args.fleet_sizes:
+        run(size)
@@ -0,0 +1,71 @@
+"""
+Benchmark / regression guard for cold-start cost. Each command runs in a
+fresh interpreter several times; the median wall time is reported next to a
+bare `python -c pass` so the numbers show what the code itself adds. Also
+checks that the pure-Python quote path never loads NumPy or matplotlib.
+
+    python -m benchmarks.import_time --runs 15 --max-cli-ms 80
+Exits 1 when the quote CLI overhead exceeds --max-cli-ms or a heavy module leaks in.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("numpy", "matplotlib")
+
+COMMANDS = {
+    "python -c pass": ["-c", "pass"],
+    "import logistics_engine": ["-c", "import logistics_engine"],
+    "import pricing_engine": ["-c", "import logistics_engine.pricing_engine"],
+    "import dispatch_engine": ["-c", "import logistics_engine.dispatch_engine"],
+    "quote CLI": ["-m", "logistics_engine", "quote", "15", "--vehicle", "TRUCK", "--attempt", "2"],
+    "import numpy (reference)": ["-c", "import numpy"],
+}
+
+LEAK_CHECK = (
+    "import sys, json, logistics_engine as le\n"
+    "le.quote(le.MoveRequest(15.0, le.VehicleType.VAN), attempt_number=2)\n"
+    "le.DispatchEngine().create_batches(le.DispatchEngine().rank_drivers([le.Driver('D1', 'A', 4.5, 2.0, 3)]))\n"
+    f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+)
+
+def time_command(args, runs: int) -> float:
+    """Median wall time (ms) of `python <args>` in a fresh process."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(samples)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Cold-start / import-time benchmark")
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--max-cli-ms", type=float, default=80.0,
+                        help="Budget for the quote CLI on top of a bare interpreter start")
+    args = parser.parse_args(argv)
+
+    timings = {label: time_command(cmd, args.runs) for label, cmd in COMMANDS.items()}
+    bare = timings["python -c pass"]
+    for label, ms in timings.items():
+        print(f"{label:<28} {ms:7.1f} ms  (+{ms - bare:6.1f} ms over a bare interpreter)")
+
+    leaked = json.loads(subprocess.run([sys.executable, "-c", LEAK_CHECK], check=True,
+                                       capture_output=True, text=True).stdout)
+    failures = []
+    if leaked:
+        failures.append(f"scalar quote / rank path imported {', '.join(leaked)}")
+    overhead = timings["quote CLI"] - bare
+    if overhead > args.max_cli_ms:
+        failures.append(f"quote CLI adds {overhead:.1f} ms (> {args.max_cli_ms:.0f} ms budget)")
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    if not failures:
+        print(f"OK: quote CLI adds {overhead:.1f} ms, no heavy imports on the scalar path")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
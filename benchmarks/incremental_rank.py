@@ -0,0 +1,92 @@
+"""
+Benchmark: incremental DriverRanking vs re-ranking the whole fleet per order.
+Between consecutive orders a few drivers change state: the previous winner
+turns busy, a couple of drivers finish jobs, a handful move or get re-rated,
+and now and then a new driver ages out of the cold-start boost.
+
+    python -m benchmarks.incremental_rank --fleet-sizes 10000 100000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.rank_topk import generate_fleet
+from logistics_engine.dispatch_engine import DispatchEngine
+from logistics_engine.driver_ranking import DriverRanking
+
+def update_stream(drivers, orders: int, seed: int = 5):
+    """Per order: (winner, freed ids, [(id, field, value)]) — deterministic for both paths."""
+    rng = np.random.default_rng(seed)
+    ids = [d.id for d in drivers]
+    stream = []
+    for _ in range(orders):
+        changes = [(ids[i], "location_km", round(float(rng.exponential(6.0)), 2))
+                   for i in rng.integers(len(ids), size=5)]
+        changes += [(ids[i], "rating", round(float(rng.uniform(3.0, 5.0)), 1))
+                    for i in rng.integers(len(ids), size=1)]
+        if rng.random() < 0.1:
+            changes.append((ids[int(rng.integers(len(ids)))], "days_in_system", 7))
+        freed = [ids[i] for i in rng.integers(len(ids), size=2)]
+        stream.append((freed, changes))
+    return stream
+
+def apply_full(drivers, by_id, dispatcher, stream, rank):
+    for freed, changes in stream:
+        for driver_id in freed:
+            by_id[driver_id].is_busy = False
+        for driver_id, field, value in changes:
+            setattr(by_id[driver_id], field, value)
+        head = rank(drivers)
+        if head:
+            head[0].is_busy = True  # the winner
+
+def apply_incremental(ranking, stream, batch_size):
+    for freed, changes in stream:
+        for driver_id in freed:
+            ranking.set_free(driver_id)
+        for driver_id, field, value in changes:
+            ranking.update(driver_id, **{field: value})
+        head = ranking.top_k(2 * batch_size)
+        if head:
+            ranking.set_busy(head[0].id)
+
+def run(n: int, orders: int):
+    dispatcher = DispatchEngine()
+    stream = update_stream(generate_fleet(n), orders)
+
+    def full_sort(ds):
+        return dispatcher.rank_drivers(ds)[:2 * dispatcher.batch_size]
+
+    def vectorized_top_k(ds):
+        cascade = dispatcher.iter_batches(ds)
+        return [d for _, batch in zip(range(2), cascade) for d in batch]
+
+    timings = {}
+    for label, rank in (("sort", full_sort), ("topk", vectorized_top_k)):
+        drivers = generate_fleet(n)
+        by_id = {d.id: d for d in drivers}
+        start = time.perf_counter()
+        apply_full(drivers, by_id, dispatcher, stream, rank)
+        timings[label] = (time.perf_counter() - start) / orders * 1e6
+
+    twins = generate_fleet(n)
+    start = time.perf_counter()
+    ranking = DriverRanking.from_drivers(twins, dispatcher)
+    build_ms = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    apply_incremental(ranking, stream, dispatcher.batch_size)
+    incr_us = (time.perf_counter() - start) / orders * 1e6
+
+    assert [d.id for d in ranking.top_k(20)] == [d.id for d in dispatcher.rank_drivers(drivers)[:20]]
+    print(f"{n:>8,} drivers | rank_drivers {timings['sort']:7.0f} us/order | "
+          f"iter_batches {timings['topk']:6.0f} us/order | incremental {incr_us:4.0f} us/order | "
+          f"initial build {build_ms:4.0f} ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark incremental driver ranking")
+    parser.add_argument("--fleet-sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--orders", type=int, default=200)
+    args = parser.parse_args()
+    for size in args.fleet_sizes:
+        run(size, args.orders)
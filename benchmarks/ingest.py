@@ -0,0 +1,36 @@
+"""
+Benchmark: streaming JSONL ingest throughput and peak memory vs input size.
+Peak traced memory should stay flat as the input grows (bounded by chunk size).
+
+    python -m benchmarks.ingest --sizes 100000 1000000
+"""
+import argparse
+import os
+import tempfile
+import tracemalloc
+
+from logistics_engine.market_simulator import synthetic_fleet
+from logistics_engine.order_ingest import process_stream, write_synthetic_requests
+
+def run(n: int, chunk_size: int, tmp: str):
+    source = os.path.join(tmp, f"orders_{n}.jsonl.gz")
+    write_synthetic_requests(source, n, seed=1)
+    fleet = synthetic_fleet(1_000)
+
+    stats = process_stream(source, os.path.join(tmp, "out.csv"), fleet, chunk_size)
+
+    tracemalloc.start()
+    process_stream(source, os.path.join(tmp, "out.jsonl"), fleet, chunk_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{n:>10,} records | {stats.records_per_s:10,.0f} records/s (CSV) | "
+          f"peak traced memory {peak / 1e6:6.2f} MB (chunk {chunk_size:,})")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark streaming order ingest")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            run(size, args.chunk_size, tmp)
@@ -0,0 +1,54 @@
+"""
+Benchmark: the price-surface paths (scalar calculate_price and
+calculate_prices_batch, both reading the precomputed factor tables) against
+the direct computation from the rates, with surface validation.
+
+    python -m benchmarks.price_surface --sizes 100000 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.pricing_batch import generate_orders
+from logistics_engine.pricing_engine import MoveRequest, PricingEngine, VehicleType, validate_price_surface
+from logistics_engine.rounding import round_cents
+
+def direct_prices(pricer: PricingEngine, distance_km, vehicle_codes, is_bad_weather, attempt_numbers) -> np.ndarray:
+    """The per-call computation the surface replaces: rate lookup, weather branch, surge power."""
+    base = np.array([pricer.base_rates[vehicle] for vehicle in VehicleType])
+    price = base[vehicle_codes] + (distance_km * 2.0)
+    price = np.where(is_bad_weather, price * pricer.weather_multiplier, price)
+    return round_cents(price * pricer.surge_rate ** (attempt_numbers - 1.0))
+
+def run(n: int):
+    pricer = PricingEngine()
+    columns = generate_orders(n)
+
+    start = time.perf_counter()
+    batch = pricer.calculate_prices_batch(*columns)
+    batch_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    direct = direct_prices(pricer, *columns)
+    direct_s = time.perf_counter() - start
+
+    vehicles = list(VehicleType)
+    sample = min(n, 100_000)
+    orders = [(MoveRequest(float(d), vehicles[int(v)], bool(w)), int(a))
+              for d, v, w, a in zip(*(column[:sample] for column in columns))]
+    start = time.perf_counter()
+    scalar = np.array([pricer.calculate_price(order, attempt) for order, attempt in orders])
+    scalar_ns = (time.perf_counter() - start) / sample * 1e9
+
+    mismatches = int(np.count_nonzero(batch != direct)) + int(np.count_nonzero(scalar != batch[:sample]))
+    print(f"{n:>9,} orders | batch {batch_s*1e3:7.1f} ms | direct {direct_s*1e3:7.1f} ms | "
+          f"scalar {scalar_ns:5.0f} ns/order | mismatched rows: {mismatches}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the precomputed price surface")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+    print(f"Surface validation: max deviation {validate_price_surface(PricingEngine()):.2f} over the distance grid")
+    for size in args.sizes:
+        run(size)
@@ -0,0 +1,47 @@
+"""
+Benchmark: scalar PricingEngine.calculate_price loop vs calculate_prices_batch.
+
+    python -m benchmarks.pricing_batch --sizes 10000 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from logistics_engine.pricing_engine import PricingEngine, MoveRequest, VehicleType, VEHICLE_CODES
+
+def generate_orders(n: int, seed: int = 42):
+    """Synthetic open-order book in columnar form."""
+    rng = np.random.default_rng(seed)
+    distance_km = np.round(rng.uniform(0.5, 80.0, n), 1)
+    vehicle_codes = rng.integers(0, len(VehicleType), n)
+    is_bad_weather = rng.random(n) < 0.2
+    attempt_numbers = rng.integers(1, 4, n)
+    return distance_km, vehicle_codes, is_bad_weather, attempt_numbers
+
+def run(n: int):
+    pricer = PricingEngine()
+    distance_km, vehicle_codes, is_bad_weather, attempt_numbers = generate_orders(n)
+    vehicles = list(VEHICLE_CODES)
+    orders = [MoveRequest(float(d), vehicles[v], bool(w))
+              for d, v, w in zip(distance_km, vehicle_codes, is_bad_weather)]
+    attempts = attempt_numbers.tolist()
+
+    start = time.perf_counter()
+    scalar = [pricer.calculate_price(o, a) for o, a in zip(orders, attempts)]
+    scalar_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = pricer.calculate_prices_batch(distance_km, vehicle_codes, is_bad_weather, attempt_numbers)
+    batch_s = time.perf_counter() - start
+
+    mismatches = int(np.count_nonzero(batch != np.array(scalar)))
+    print(f"{n:>9,} orders | scalar {scalar_s*1e3:9.1f} ms | batch {batch_s*1e3:7.2f} ms | "
+          f"speedup {scalar_s / batch_s:6.1f}x | mismatches {mismatches}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batch pricing")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size)
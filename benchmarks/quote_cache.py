@@ -0,0 +1,61 @@
+"""
+Benchmark: quote-cache hit rate and pricing time saved under form-filling traffic.
+Customers re-query a small set of popular (distance bucket, vehicle, weather)
+quotes; request popularity is Zipf-distributed.
+
+    python -m benchmarks.quote_cache --requests 200000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from logistics_engine.pricing_engine import PricingEngine, MoveRequest, VehicleType
+from logistics_engine.quote_cache import CachedPricingEngine, CachedCostModel, QuoteCache
+from logistics_engine.cost_model import LogisticPricingModel, MoveRequest as CostRequest
+
+def traffic(n: int, distinct: int = 20_000, seed: int = 9):
+    rng = np.random.default_rng(seed)
+    popular = rng.zipf(1.3, n) % distinct
+    base = np.random.default_rng(seed + 1)
+    distance = np.round(base.exponential(15.0, distinct) + 0.5, 1)
+    vehicle = base.integers(len(VehicleType), size=distinct)
+    weather = base.random(distinct) < 0.2
+    return popular, distance, vehicle, weather
+
+def timed(fn, items):
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return time.perf_counter() - start
+
+def run(n: int, maxsize: int, ttl_s: float):
+    popular, distance, vehicle, weather = traffic(n)
+    vehicles = list(VehicleType)
+    orders = [MoveRequest(float(distance[i]), vehicles[vehicle[i]], bool(weather[i])) for i in popular]
+
+    pricer = PricingEngine()
+    cached = CachedPricingEngine(pricer, QuoteCache(maxsize, ttl_s))
+    direct_s = timed(pricer.calculate_price, orders)
+    cached_s = timed(cached.calculate_price, orders)
+    s = cached.cache.stats()
+    print(f"PricingEngine   | {n:,} quotes | hit rate {s['hit_rate']:.1%} | evictions {s['evictions']:,} | "
+          f"direct {direct_s*1e3:7.1f} ms | cached {cached_s*1e3:7.1f} ms")
+
+    cost_requests = [CostRequest(float(distance[i]), 1 + int(vehicle[i]), 2 * int(weather[i]), 1, 50.0)
+                     for i in popular]
+    model = LogisticPricingModel()
+    cached_model = CachedCostModel(model, QuoteCache(maxsize, ttl_s))
+    direct_s = timed(lambda r: model.optimize_price_for_target_acceptance(r, 0.9), cost_requests)
+    cached_s = timed(lambda r: cached_model.optimize_price_for_target_acceptance(r, 0.9), cost_requests)
+    s = cached_model.cache.stats()
+    print(f"ver1 cost model | {n:,} quotes | hit rate {s['hit_rate']:.1%} | evictions {s['evictions']:,} | "
+          f"direct {direct_s*1e3:7.1f} ms | cached {cached_s*1e3:7.1f} ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the quote cache")
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--maxsize", type=int, default=5_000)
+    parser.add_argument("--ttl", type=float, default=60.0)
+    args = parser.parse_args()
+    run(args.requests, args.maxsize, args.ttl)
@@ -0,0 +1,63 @@
+"""
+Benchmark: ShardedDispatcher throughput vs shard count on one synthetic
+metro. A share of the orders comes from a downtown hotspot, which loads one
+shard more than the others; with a tight fleet (e.g. --drivers 20000
+--hotspot-share 0.5) that shard drains and borrows from its neighbours.
+
+Reports wall-clock orders/s and the critical-path rate (orders / compute time
+of the busiest shard), which is what the service reaches once every shard has
+a core of its own; on a machine with fewer cores than shards only the latter scales.
+
+    python -m benchmarks.sharded_dispatch --shards 1 2 4 8 --drivers 100000 --orders 20000
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from logistics_engine.driver_fleet import DriverFleet
+from logistics_engine.sharded_dispatch import ShardConfig, ShardedDispatcher
+from logistics_engine.snapshot import OrderBook, synthetic_fleet_columns, synthetic_order_columns
+
+def hotspot_orders(n: int, hotspot_share: float, metro_km: float = 50.0, seed: int = 1) -> OrderBook:
+    columns = synthetic_order_columns(n, seed, metro_km)
+    rng = np.random.default_rng(seed)
+    hot = rng.random(n) < hotspot_share
+    columns["origin_x_km"][hot] = np.clip(rng.normal(0.3 * metro_km, 2.0, hot.sum()), 0.0, metro_km)
+    columns["origin_y_km"][hot] = np.clip(rng.normal(0.3 * metro_km, 2.0, hot.sum()), 0.0, metro_km)
+    return OrderBook(**columns)
+
+def run(shards: int, fleet_columns, book: OrderBook, baseline=None):
+    fleet = DriverFleet.from_columns({name: values.copy() for name, values in fleet_columns.items()})
+    start = time.perf_counter()
+    service = ShardedDispatcher(fleet, shards, config=ShardConfig(seed=7)).start()
+    startup_s = time.perf_counter() - start
+    try:
+        report = service.dispatch(book)
+    finally:
+        service.close()
+    s = report.summary()
+    rate = s["critical_path_orders_per_s"]
+    speedup = f"x{rate / baseline:4.1f}" if baseline else "  -  "
+    print(f"{shards:>3} shards | startup {startup_s:5.2f}s | wall {s['orders_per_s']:>8,.0f} orders/s | "
+          f"critical path {rate:>8,.0f} orders/s {speedup} | filled {s['filled']:,} "
+          f"({s['borrowed']:,} borrowed) | unfilled {s['unfilled']:,}", flush=True)
+    return rate
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark region-sharded dispatch scaling")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--drivers", type=int, default=100_000)
+    parser.add_argument("--orders", type=int, default=20_000)
+    parser.add_argument("--hotspot-share", type=float, default=0.3)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPU(s); {args.drivers:,} drivers, {args.orders:,} orders "
+          f"({args.hotspot_share:.0%} from a hotspot)")
+    fleet_columns = synthetic_fleet_columns(args.drivers, seed=0)
+    book = hotspot_orders(args.orders, args.hotspot_share)
+    baseline = None
+    for shards in args.shards:
+        rate = run(shards, fleet_columns, book, baseline)
+        baseline = baseline or rate
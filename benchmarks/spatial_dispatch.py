@@ -0,0 +1,61 @@
+"""
+Benchmark: whole-fleet ranking vs spatial candidate retrieval (GridIndex).
+Driver density is held constant while the metro area grows, so per-order work
+on the spatial path should stay flat as the fleet grows.
+
+    python -m benchmarks.spatial_dispatch --fleet-sizes 10000 100000
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+from logistics_engine.dispatch_engine import DispatchEngine, Driver
+from logistics_engine.driver_fleet import DriverFleet
+from logistics_engine.spatial_index import GridIndex
+
+DRIVERS_PER_KM2 = 5.0
+
+def generate_metro_fleet(n: int, seed: int = 11):
+    rng = np.random.default_rng(seed)
+    side_km = math.sqrt(n / DRIVERS_PER_KM2)
+    xy = rng.uniform(0.0, side_km, (n, 2))
+    ratings = np.round(rng.uniform(3.0, 5.0, n), 1)
+    days = rng.integers(0, 400, n)
+    busy = rng.random(n) < 0.3
+    drivers = [Driver(f"D{i}", f"Driver {i}", float(r), 0.0, int(d), bool(b), (float(x), float(y)))
+               for i, (r, d, b, (x, y)) in enumerate(zip(ratings, days, busy, xy))]
+    return drivers, side_km
+
+def run(n: int, orders: int = 200, k: int = 50):
+    dispatcher = DispatchEngine()
+    drivers, side_km = generate_metro_fleet(n)
+    fleet = DriverFleet.from_drivers(drivers)
+    index = GridIndex.from_drivers(fleet, cell_km=1.0)
+    origins = np.random.default_rng(3).uniform(0.0, side_km, (orders, 2))
+
+    # Whole-fleet path: distance to every driver, then top-K ranking over the fleet
+    start = time.perf_counter()
+    for x, y in origins:
+        fleet.location_km[:] = np.hypot(fleet.x_km - x, fleet.y_km - y)
+        next(dispatcher.iter_batches(fleet))
+    full_us = (time.perf_counter() - start) / orders * 1e6
+
+    # Spatial path: only the k nearest free drivers are scored
+    start = time.perf_counter()
+    for x, y in origins:
+        candidates = dispatcher.nearby_drivers(index, fleet, (x, y), k=k)
+        next(dispatcher.iter_batches(candidates))
+    near_us = (time.perf_counter() - start) / orders * 1e6
+
+    print(f"{n:>8,} drivers ({side_km:5.1f} km side) | whole fleet {full_us:8.0f} us/order | "
+          f"k={k} nearest {near_us:6.0f} us/order")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark spatial candidate retrieval")
+    parser.add_argument("--fleet-sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--k", type=int, default=50)
+    args = parser.parse_args()
+    for size in args.fleet_sizes:
+        run(size, k=args.k)
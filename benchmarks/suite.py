@@ -0,0 +1,261 @@
+"""
+Reproducible benchmark suite for the pricing and dispatch engines.
+
+Every case builds its synthetic fleet / order stream from a fixed seed, times
+individual calls into a LatencyHistogram until a time budget is spent, then
+measures peak Python memory of one extra call under tracemalloc (kept out of
+the timed loop). The timing is split into several repeats: results hold the
+median over repeats, the best repeat (fastest, which background load can
+only make worse) and each metric's spread ((max - min) / median). `compare`
+judges the best repeats and only flags changes larger than both the
+threshold and the noise either file measured.
+
+    python -m benchmarks.suite run --sizes 100 10000 1000000 --repeats 5 --output bench.json
+    python -m benchmarks.suite compare baseline.json bench.json --threshold 0.15
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.pricing_batch import generate_orders
+from benchmarks.rank_topk import generate_fleet
+from logistics_engine.dispatch_engine import DispatchEngine
+from logistics_engine.instrumentation import LatencyHistogram
+from logistics_engine.pricing_engine import PricingEngine, MoveRequest, VEHICLE_CODES
+from logistics_engine.cost_model import LogisticPricingModel, MoveRequest as CostRequest
+
+def _move_requests(n: int, seed: int):
+    distance_km, vehicle_codes, is_bad_weather, attempt_numbers = generate_orders(n, seed)
+    vehicles = list(VEHICLE_CODES)
+    orders = [MoveRequest(float(d), vehicles[v], bool(w))
+              for d, v, w in zip(distance_km, vehicle_codes, is_bad_weather)]
+    return orders, attempt_numbers.tolist()
+
+def _cost_requests(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    return [CostRequest(float(d), int(w), int(f), int(h), float(m)) for d, w, f, h, m in zip(
+        np.round(rng.uniform(0.5, 80.0, n), 1), rng.integers(1, 5, n), rng.integers(0, 10, n),
+        rng.integers(0, 4, n), np.round(rng.uniform(0.0, 80.0, n), 1))]
+
+# --- Cases: setup(size, seed) -> (op(i), items per op) ---
+def case_calculate_price(size: int, seed: int):
+    pricer = PricingEngine()
+    orders, attempts = _move_requests(size, seed)
+    return (lambda i: pricer.calculate_price(orders[i % size], attempts[i % size])), 1
+
+def case_optimize_price(size: int, seed: int):
+    model = LogisticPricingModel()
+    requests = _cost_requests(size, seed)
+    return (lambda i: model.optimize_price_for_target_acceptance(requests[i % size], 0.85)), 1
+
+def case_rank_and_batch(size: int, seed: int):
+    dispatcher = DispatchEngine()
+    drivers = generate_fleet(size, seed)
+    return (lambda i: dispatcher.create_batches(dispatcher.rank_drivers(drivers))), size
+
+def case_dispatch_cycle(size: int, seed: int):
+    """One order end to end: rank, batch, price every attempt until a (seeded) acceptance, release a driver."""
+    dispatcher = DispatchEngine()
+    pricer = PricingEngine()
+    drivers = generate_fleet(size, seed)
+    orders, _ = _move_requests(1024, seed)
+    rng = np.random.default_rng(seed)
+    accept_draws = rng.random((1 << 16, 3))
+    busy_pool = []
+
+    def op(i: int):
+        order = orders[i % len(orders)]
+        for attempt, batch in enumerate(dispatcher.create_batches(dispatcher.rank_drivers(drivers)), 1):
+            pricer.calculate_price(order, attempt_number=attempt)
+            if batch and accept_draws[i % len(accept_draws), attempt - 1] < 0.6:
+                batch[0].is_busy = True
+                busy_pool.append(batch[0])
+                break
+        if len(busy_pool) > 1:
+            busy_pool.pop(0).is_busy = False  # a job finishes, fleet utilisation stays flat
+
+    return op, size
+
+CASES = {
+    "pricing.calculate_price": case_calculate_price,
+    "ver1.optimize_price_for_target_acceptance": case_optimize_price,
+    "dispatch.rank_drivers+create_batches": case_rank_and_batch,
+    "dispatch.end_to_end_cycle": case_dispatch_cycle,
+}
+
+def _timed_repeat(op, first_op: int, min_time_s: float, max_ops: int, min_ops: int) -> LatencyHistogram:
+    histogram = LatencyHistogram()
+    clock = time.perf_counter_ns
+    deadline = clock() + int(min_time_s * 1e9)
+    ops = 0
+    while ops < max_ops and (ops < min_ops or clock() < deadline):
+        start = clock()
+        op(first_op + ops)
+        histogram.record(clock() - start)
+        ops += 1
+    return histogram
+
+def measure(op, items_per_op: int, min_time_s: float, max_ops: int, repeats: int = 5, min_ops: int = 3) -> dict:
+    """
+    Splits the time budget into `repeats` timed runs (after one warm-up call) and
+    reports the median of each metric, the best repeat (max throughput, min
+    latency) and the metric's relative spread over the repeats.
+    """
+    op(0)  # warm-up: caches, lazy imports, first-touch allocations
+    per_repeat = []
+    ops = 1
+    for _ in range(repeats):
+        histogram = _timed_repeat(op, ops, min_time_s / repeats, max(1, max_ops // repeats),
+                                  max(1, -(-min_ops // repeats)))
+        ops += histogram.count
+        total_s = histogram.total / 1e9
+        per_repeat.append({
+            "ops_per_s": histogram.count / total_s if total_s else float("inf"),
+            "mean_us": histogram.mean() / 1e3,
+            "p50_us": histogram.percentile(50) / 1e3,
+            "p99_us": histogram.percentile(99) / 1e3,
+            "max_us": histogram.max / 1e3,
+        })
+    tracemalloc.start()
+    op(ops)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {"ops": ops - 1, "repeats": repeats}
+    best, spread = {}, {}
+    for metric in per_repeat[0]:
+        values = np.array([r[metric] for r in per_repeat])
+        result[metric] = float(np.median(values))
+        best[metric] = float(values.max() if COMPARED_METRICS.get(metric, False) else values.min())
+        spread[metric] = float((values.max() - values.min()) / result[metric]) if result[metric] else 0.0
+    result["items_per_s"] = result["ops_per_s"] * items_per_op
+    result["peak_mem_kb"] = peak / 1024
+    result["best"] = best
+    result["spread"] = spread
+    return result
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def run_suite(sizes, cases, seed: int, min_time_s: float, max_ops: int, repeats: int = 5) -> dict:
+    results = []
+    for name in cases:
+        for size in sizes:
+            setup_start = time.perf_counter()
+            op, items = CASES[name](size, seed)
+            setup_s = time.perf_counter() - setup_start
+            row = {"case": name, "size": size, "setup_s": setup_s, **measure(op, items, min_time_s, max_ops, repeats)}
+            results.append(row)
+            print(f"{name:<42} n={size:>9,} | {row['ops']:>7,} ops | {row['ops_per_s']:>11,.1f} ops/s | "
+                  f"p50 {row['p50_us']:>11,.1f} us | p99 {row['p99_us']:>11,.1f} us | "
+                  f"spread {row['spread']['ops_per_s']:>5.1%} | peak {row['peak_mem_kb']:>10,.0f} KiB", flush=True)
+    return {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git_commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": seed,
+            "min_time_s": min_time_s,
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+# Metric -> True when higher is better
+COMPARED_METRICS = {"ops_per_s": True, "p50_us": False, "p99_us": False, "peak_mem_kb": False}
+
+def compare(baseline: dict, candidate: dict, threshold: float, tail_threshold: float = 0.25,
+            min_abs_us: float = 2.0, noise_factor: float = 1.0, min_tail_samples: int = 1000) -> list:
+    """
+    Returns (case, size, metric, old, new, relative change) for every regression.
+    p99 is noisier than the other metrics, so it gets its own tail_threshold;
+    latency changes smaller than min_abs_us are ignored as timer noise. A change
+    must also exceed noise_factor x the larger spread measured over the repeats of
+    either run. Timing metrics compare the best repeats (files from before
+    repeats existed fall back to their single value and count as noise-free).
+    p99 is skipped when a repeat has fewer than min_tail_samples calls in either
+    run, since it then is little more than the slowest call.
+    """
+    old_rows = {(r["case"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for row in candidate["results"]:
+        old = old_rows.get((row["case"], row["size"]))
+        if old is None:
+            continue
+        samples = min(r["ops"] / r.get("repeats", 1) for r in (old, row))
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            if metric == "p99_us" and samples < min_tail_samples:
+                continue
+            old_value = old.get("best", {}).get(metric, old[metric])
+            new_value = row.get("best", {}).get(metric, row[metric])
+            if not old_value:
+                continue
+            if metric.endswith("_us") and abs(new_value - old_value) < min_abs_us:
+                continue
+            change = (new_value - old_value) / old_value
+            noise = max(old.get("spread", {}).get(metric, 0.0), row.get("spread", {}).get(metric, 0.0))
+            limit = max(tail_threshold if metric == "p99_us" else threshold, noise_factor * noise)
+            if (-change if higher_is_better else change) > limit:
+                regressions.append((row["case"], row["size"], metric, old_value, new_value, change))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite for the pricing and dispatch engines")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_cmd = commands.add_parser("run", help="Run the suite and write a JSON results file")
+    run_cmd.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 1_000_000])
+    run_cmd.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    run_cmd.add_argument("--seed", type=int, default=2024)
+    run_cmd.add_argument("--min-time", type=float, default=1.0, help="Timing budget per case and size (s)")
+    run_cmd.add_argument("--max-ops", type=int, default=100_000)
+    run_cmd.add_argument("--repeats", type=int, default=5, help="Timed repeats per case (median + spread)")
+    run_cmd.add_argument("--output", default="bench_results.json")
+
+    compare_cmd = commands.add_parser("compare", help="Flag regressions between two result files")
+    compare_cmd.add_argument("baseline")
+    compare_cmd.add_argument("candidate")
+    compare_cmd.add_argument("--threshold", type=float, default=0.10, help="Relative change that counts as a regression")
+    compare_cmd.add_argument("--tail-threshold", type=float, default=0.25, help="Same, for p99 latency")
+    compare_cmd.add_argument("--min-abs-us", type=float, default=2.0, help="Ignore latency changes below this")
+    compare_cmd.add_argument("--min-tail-samples", type=int, default=1000,
+                             help="Calls per repeat needed before p99 is compared")
+    compare_cmd.add_argument("--noise-factor", type=float, default=1.0,
+                             help="Changes within this multiple of the measured spread are noise")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        report = run_suite(args.sizes, args.cases, args.seed, args.min_time, args.max_ops, args.repeats)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+    regressions = compare(baseline, candidate, args.threshold, args.tail_threshold, args.min_abs_us,
+                          args.noise_factor, args.min_tail_samples)
+    print(f"{baseline['meta']['git_commit']} -> {candidate['meta']['git_commit']} "
+          f"(threshold {args.threshold:.0%})")
+    for case, size, metric, old, new, change in regressions:
+        print(f"REGRESSION {case:<42} n={size:>9,} {metric:<12} {old:>14,.1f} -> {new:>14,.1f} ({change:+.1%})")
+    if not regressions:
+        print("No regressions.")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
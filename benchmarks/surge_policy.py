@@ -0,0 +1,82 @@
+"""
+Benchmark: solved surge-escalation policies vs the fixed surge_rate step.
+For several time-to-acceptance targets: solve time, how many segments each
+schedule keeps within the target, and the expected cost where both do. Then a
+Monte Carlo check of the analytic model on sample segments and the per-call
+cost of the public lookups (policy price, segment, full policy).
+
+    python -m benchmarks.surge_policy --targets 8 15 30
+"""
+import argparse
+import time
+
+import numpy as np
+
+from logistics_engine.pricing_engine import MoveRequest, VehicleType
+from logistics_engine.surge_policy import SurgePolicyTable
+
+def simulate(table: SurgePolicyTable, req: MoveRequest, n_candidates: int, cascades: int, seed: int = 3):
+    """Empirical mean cost / time / fill of the segment's policy (same per-driver model, sampled)."""
+    rng = np.random.default_rng(seed)
+    policy = table.policy(req, n_candidates)
+    segment = table.segment(req, n_candidates)
+    base = table.pricer.calculate_price(MoveRequest(segment.model_distance_km, req.vehicle_type, req.is_bad_weather), 1)
+    k, m0 = table.acceptance_params(req.vehicle_type, req.is_bad_weather)
+    cost = np.zeros(cascades)
+    tta = np.zeros(cascades)
+    open_ = np.ones(cascades, dtype=bool)
+    for multiplier, size in zip(policy.multipliers, policy.batch_sizes):
+        p = 1 / (1 + np.exp(-k * (base * (multiplier - table.driver_cost_share) - m0)))
+        accepts = rng.random((cascades, size)) < p
+        first = np.where(accepts, rng.uniform(0, table.batch_timeout_s, (cascades, size)), np.inf).min(axis=1)
+        won = open_ & np.isfinite(first)
+        cost[won] = multiplier * base
+        tta[won] += first[won]
+        tta[open_ & ~won] += table.batch_timeout_s
+        open_ &= ~won
+    cost[open_] = table.unfilled_penalty_share * base
+    return policy, cost.mean(), tta.mean(), 1 - open_.mean()
+
+def run(target: float):
+    table = SurgePolicyTable(target_tta_s=target).solve()
+    fixed_ok = table.fixed_tta_s <= target + 1e-9
+    both = fixed_ok & table.feasible
+    saving = (table.fixed_cost[both] - table.expected_cost[both]) / table.fixed_cost[both]
+    print(f"target {target:4.0f}s | solved {table.feasible.size:,} segments in {table.solve_time_s:5.2f}s | "
+          f"within target: policy {table.feasible.mean():6.1%}, fixed surge {fixed_ok.mean():6.1%} | "
+          f"cost vs fixed where both meet it: {-saving.mean():+6.2%} (max {-saving.max():+6.2%})")
+    return table
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark surge-escalation policies")
+    parser.add_argument("--targets", type=float, nargs="+", default=[8.0, 15.0, 30.0])
+    parser.add_argument("--cascades", type=int, default=200_000, help="Monte Carlo cascades per sample segment")
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    tables = [run(target) for target in args.targets]
+    table = tables[0]
+
+    print("Monte Carlo check (analytic vs sampled):")
+    for req, n in ((MoveRequest(12.0, VehicleType.VAN, False), 30), (MoveRequest(40.0, VehicleType.TRUCK, True), 8),
+                   (MoveRequest(3.0, VehicleType.MINI_TRUCK, False), 200)):
+        policy, cost, tta, fill = simulate(table, req, n, args.cascades)
+        print(f"   {req.vehicle_type.name:<10} {req.distance_km:5.1f} km, {n:>3} candidates, batches "
+              f"{policy.batch_sizes} x {policy.multipliers}: cost ${policy.expected_cost:.2f} / ${cost:.2f}, "
+              f"E[TTA] {policy.expected_tta_s:.2f}s / {tta:.2f}s, fill {policy.fill_probability:.2%} / {fill:.2%}")
+
+    rng = np.random.default_rng(0)
+    vehicles = list(VehicleType)
+    orders = [MoveRequest(float(d), vehicles[v], bool(w)) for d, v, w in zip(
+        np.round(rng.exponential(15.0, 1024) + 0.5, 1), rng.integers(3, size=1024), rng.random(1024) < 0.2)]
+    candidates = rng.integers(0, 300, 1024).tolist()
+    attempts = rng.integers(1, 4, 1024).tolist()
+    for label, price in (("PricingEngine.calculate_price", lambda i: table.pricer.calculate_price(orders[i], attempts[i])),
+                         ("SurgePolicyTable.calculate_price",
+                          lambda i: table.calculate_price(orders[i], attempts[i], candidates[i])),
+                         ("SurgePolicyTable.segment", lambda i: table.segment(orders[i], candidates[i])),
+                         ("SurgePolicyTable.policy", lambda i: table.policy(orders[i], candidates[i]))):
+        start = time.perf_counter()
+        for i in range(args.lookups):
+            price(i & 1023)
+        print(f"{label:<34} {(time.perf_counter() - start) / args.lookups * 1e6:6.2f} us/call")
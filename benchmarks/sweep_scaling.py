@@ -0,0 +1,31 @@
+"""
+Benchmark: Monte Carlo sweep throughput vs worker count.
+Ideal scaling is linear in cores until the pool is wider than the machine.
+
+    python -m benchmarks.sweep_scaling --workers 1 2 4 8
+"""
+import argparse
+import os
+import tempfile
+
+from logistics_engine.market_simulator import MarketConfig
+from logistics_engine.sweep import run_sweep
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark sweep scaling")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count()])
+    parser.add_argument("--replications", type=int, default=40)
+    args = parser.parse_args()
+
+    grid = {"surge_rate": [1.10, 1.15, 1.20], "new_driver_bonus": [0.25, 0.5]}
+    market = MarketConfig(n_drivers=500, duration_s=3600.0, order_rate_per_s=0.05)
+    total = 6 * args.replications
+    baseline = None
+    print(f"{os.cpu_count()} CPUs available")
+    for workers in args.workers:
+        with tempfile.TemporaryDirectory() as tmp:
+            wall = run_sweep(grid, args.replications, os.path.join(tmp, "sweep.csv"), market,
+                             workers=workers, reps_per_task=5)
+        baseline = baseline or wall
+        print(f"{workers:>3} workers | {wall:6.2f}s | {total / wall:7.1f} replications/s | "
+              f"speedup {baseline / wall:4.2f}x")
@@ -0,0 +1,49 @@
+"""
+Benchmark: per-request optimize_price_for_target_acceptance vs the array version
+over a request table.
+
+    python -m benchmarks.target_acceptance --sizes 10000 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from logistics_engine.cost_model import LogisticPricingModel, MoveRequest, REQUEST_DTYPE
+
+def generate_request_table(n: int, seed: int = 3) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    table = np.empty(n, dtype=REQUEST_DTYPE)
+    table['distance_km'] = np.round(rng.exponential(15.0, n) + 0.5, 1)
+    table['num_workers'] = rng.integers(1, 5, n)
+    table['total_floors'] = rng.integers(0, 9, n)
+    table['num_heavy_items'] = rng.integers(0, 4, n)
+    table['walking_distance_m'] = np.round(rng.uniform(0, 200, n))
+    return table
+
+def run(n: int, scalar_limit: int = 200_000):
+    model = LogisticPricingModel()
+    table = generate_request_table(n)
+
+    start = time.perf_counter()
+    quotes = model.optimize_prices_for_target_acceptance_batch(table, target_prob=0.9)
+    batch_s = time.perf_counter() - start
+
+    # The scalar loop is timed on a prefix and extrapolated for very large tables
+    m = min(n, scalar_limit)
+    requests = [MoveRequest(*row) for row in table[:m].tolist()]
+    start = time.perf_counter()
+    scalar = [model.optimize_price_for_target_acceptance(r, target_prob=0.9) for r in requests]
+    scalar_s = (time.perf_counter() - start) * n / m
+
+    assert np.array_equal([q["final_price"] for q in scalar], quotes['final_price'][:m])
+    print(f"{n:>9,} requests | per-request {scalar_s*1e3:9.1f} ms{'*' if m < n else ' '} | "
+          f"array {batch_s*1e3:7.1f} ms | speedup {scalar_s / batch_s:6.1f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark vectorized target-acceptance pricing")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size)
+    print("* extrapolated from the first 200,000 requests")
@@ -0,0 +1,51 @@
+"""
+One import for the pricing, dispatch and simulation engines.
+
+    import logistics_engine as le
+    le.quote(le.MoveRequest(15.0, le.VehicleType.VAN), attempt_number=2)
+
+Importing the package loads nothing else: each public name is imported from
+its module on first access, and NumPy / matplotlib only load once a
+vectorized or plotting feature runs. The scalar quote path never loads them.
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    # Unified pricing API (market price + cost model)
+    "MoveRequest": "api",
+    "Quote": "api",
+    "Pricer": "api",
+    "quote": "api",
+    # Engines
+    "VehicleType": "pricing_engine",
+    "PricingEngine": "pricing_engine",
+    "LogisticPricingModel": "cost_model",
+    "Driver": "dispatch_engine",
+    "DispatchEngine": "dispatch_engine",
+    "DriverFleet": "driver_fleet",
+    "DriverRanking": "driver_ranking",
+    "GridIndex": "spatial_index",
+    "QuoteCache": "quote_cache",
+    "AcceptanceEstimator": "acceptance_estimator",
+    "SurgePolicyTable": "surge_policy",
+    "ExposureLedger": "exposure",
+    # Runtimes and tooling
+    "CascadeOrchestrator": "async_dispatch",
+    "ShardedDispatcher": "sharded_dispatch",
+    "MarketSimulator": "market_simulator",
+    "MarketConfig": "market_simulator",
+    "Instrumentation": "instrumentation",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # No copy in globals(): once loaded, import_module is a sys.modules lookup
+    return getattr(importlib.import_module(f".{module}", __name__), name)
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,71 @@
+"""
+Lean command line for the engines. Only `quote` runs in-process on the pure
+Python path; the other commands import their (heavier) modules on demand.
+
+    python -m logistics_engine quote 15 --vehicle TRUCK --weather --attempt 2
+    python -m logistics_engine plot --output acceptance_curve.png
+    python -m logistics_engine simulate --scenario bad_weather
+    python -m logistics_engine market --drivers 5000 --hours 2
+"""
+import argparse
+import sys
+
+# Subcommands that hand their arguments to one of the package's script modules
+SCRIPTS = {"simulate": "simulation", "market": "market_simulator", "sweep": "sweep", "snapshot": "snapshot"}
+
+def _quote(args) -> int:
+    from .api import MoveRequest, quote
+    from .pricing_engine import VehicleType
+
+    req = MoveRequest(args.distance_km, VehicleType[args.vehicle], args.weather, num_workers=args.workers,
+                      total_floors=args.floors, num_heavy_items=args.heavy_items, walking_distance_m=args.walk_m)
+    result = quote(req, args.attempt, args.target)
+    if args.json:
+        import json
+        from dataclasses import asdict
+        print(json.dumps(asdict(result)))
+    else:
+        print(f"Price (attempt {result.attempt_number}): ${result.price:.2f}")
+        print(f"Operational cost: ${result.operational_cost:.2f}  "
+              f"Price for {result.target_acceptance:.0%} acceptance: ${result.target_price:.2f}")
+    return 0
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in SCRIPTS:
+        import runpy
+        sys.argv = [SCRIPTS[argv[0]]] + argv[1:]
+        runpy.run_module(f"logistics_engine.{SCRIPTS[argv[0]]}", run_name="__main__", alter_sys=True)
+        return 0
+
+    parser = argparse.ArgumentParser(prog="python -m logistics_engine", description="Pricing and dispatch engines")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    q = commands.add_parser("quote", help="Price one order")
+    q.add_argument("distance_km", type=float)
+    q.add_argument("--vehicle", choices=["MINI_TRUCK", "VAN", "TRUCK"], default="VAN")
+    q.add_argument("--weather", action="store_true", help="Bad weather")
+    q.add_argument("--attempt", type=int, default=1, help="Cascade attempt (surge step)")
+    q.add_argument("--workers", type=int, default=2)
+    q.add_argument("--floors", type=int, default=0, help="Origin + destination floors")
+    q.add_argument("--heavy-items", type=int, default=0)
+    q.add_argument("--walk-m", type=float, default=0.0, help="Walking distance in metres")
+    q.add_argument("--target", type=float, default=0.85, help="Target driver acceptance for the cost-model price")
+    q.add_argument("--json", action="store_true")
+
+    p = commands.add_parser("plot", help="Plot the acceptance sigmoid (matplotlib)")
+    p.add_argument("--output", default="acceptance_curve.png")
+
+    for name, script in SCRIPTS.items():
+        commands.add_parser(name, help=f"Run {script}.py with the remaining arguments")
+
+    args = parser.parse_args(argv)
+    if args.command == "quote":
+        return _quote(args)
+    if args.command == "plot":
+        from .visualize_model import generate_acceptance_curve_plot
+        generate_acceptance_curve_plot(args.output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+from typing import Dict, Hashable, NamedTuple, Optional, Tuple
+import copy
+import math
+
+import numpy as np
+
+from .cost_model import LogisticPricingModel
+
+class AcceptanceParams(NamedTuple):
+    """Sigmoid parameters P(accept | margin) = 1 / (1 + exp(-steepness * (margin - midpoint)))."""
+    steepness: float
+    midpoint: float
+    observations: int = 0
+
+def segment_key(vehicle_type, is_bad_weather: bool, zone: Hashable = None) -> tuple:
+    return (vehicle_type, bool(is_bad_weather), zone)
+
+class _Segment:
+    """Online state of one segment: theta = (a, b) with logit = a + b * margin, and its 2x2 covariance."""
+    __slots__ = ("a", "b", "p_aa", "p_ab", "p_bb", "n", "published")
+
+    def __init__(self, a: float, b: float, p_aa: float, p_ab: float, p_bb: float, n: int = 0,
+                 fallback: Optional[AcceptanceParams] = None):
+        self.a, self.b = a, b
+        self.p_aa, self.p_ab, self.p_bb = p_aa, p_ab, p_bb
+        self.n = n
+        self.published = _params(a, b, n, fallback)
+
+def _params(a: float, b: float, n: int, fallback: Optional[AcceptanceParams] = None) -> AcceptanceParams:
+    """
+    logit = a + b*m = k*(m - M0)  =>  k = b, M0 = -a / b.
+    A steepness <= 0 (acceptance not rising with margin, e.g. from noisy data)
+    is no usable sigmoid for pricing, so the fallback (the prior) is published instead.
+    """
+    if b <= 0 and fallback is not None:
+        return fallback._replace(observations=n)
+    return AcceptanceParams(b, -a / b if b else math.inf, n)
+
+def _sigmoid(z):
+    # Clipping keeps exp() off its (slow) underflow path; p is 1 or 0 to double precision beyond +-40 anyway
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -40.0, 40.0)))
+
+class AcceptanceEstimator:
+    """
+    Streaming per-segment estimate of the driver-acceptance sigmoid.
+
+    Each segment (e.g. segment_key(vehicle, weather, zone)) keeps a logistic
+    regression logit = a + b * margin updated by a recursive (extended Kalman
+    filter / online Newton) step per (margin, accepted) event: O(1) time and
+    five floats of state per segment. forgetting < 1 slowly inflates the
+    covariance so the estimate tracks drifting driver behaviour.
+
+    Pricing reads parameters(segment), an immutable AcceptanceParams that the
+    (single) writer republishes after every update, so readers need no lock.
+    Unseen segments start from the prior (the hard-coded model values), and so
+    does pricing for any segment whose estimated steepness is not positive.
+    """
+
+    def __init__(self, prior: Optional[LogisticPricingModel] = None, prior_std_a: float = 2.0,
+                 prior_std_b: float = 0.1, forgetting: float = 0.9999):
+        prior = prior or LogisticPricingModel()
+        self.prior_a = -prior.acceptance_steepness * prior.acceptance_midpoint
+        self.prior_b = prior.acceptance_steepness
+        self.prior_var_a = prior_std_a ** 2
+        self.prior_var_b = prior_std_b ** 2
+        self.forgetting = forgetting
+        self._segments: Dict[Hashable, _Segment] = {}
+        self._default = _params(self.prior_a, self.prior_b, 0)
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def segments(self):
+        return list(self._segments)
+
+    def parameters(self, segment: Hashable) -> AcceptanceParams:
+        state = self._segments.get(segment)
+        return state.published if state is not None else self._default
+
+    def pricing_model(self, segment: Hashable, base: Optional[LogisticPricingModel] = None) -> LogisticPricingModel:
+        """A copy of base whose acceptance_steepness / acceptance_midpoint are the segment's estimate."""
+        params = self.parameters(segment)
+        model = copy.copy(base or LogisticPricingModel())
+        model.acceptance_steepness, model.acceptance_midpoint = params.steepness, params.midpoint
+        return model
+
+    def _segment(self, segment: Hashable) -> _Segment:
+        state = self._segments.get(segment)
+        if state is None:
+            state = self._segments[segment] = _Segment(self.prior_a, self.prior_b,
+                                                       self.prior_var_a, 0.0, self.prior_var_b,
+                                                       fallback=self._default)
+        return state
+
+    def observe(self, segment: Hashable, margin: float, accepted: bool):
+        """One recursive update from an offer outcome."""
+        s = self._segment(segment)
+        m = float(margin)
+        z = s.a + s.b * m
+        p = 1 / (1 + math.exp(-z)) if z >= 0 else math.exp(z) / (1 + math.exp(z))
+        w = max(p * (1 - p), 1e-9)
+
+        # Forgetting: P <- P / lambda, then the rank-one information update P <- (P^-1 + w x x^T)^-1
+        inv_lambda = 1.0 / self.forgetting
+        p_aa, p_ab, p_bb = s.p_aa * inv_lambda, s.p_ab * inv_lambda, s.p_bb * inv_lambda
+        px_a, px_b = p_aa + p_ab * m, p_ab + p_bb * m           # P x, with x = (1, m)
+        denom = 1.0 + w * (px_a + px_b * m)                      # 1 + w x^T P x
+        p_aa -= w * px_a * px_a / denom
+        p_ab -= w * px_a * px_b / denom
+        p_bb -= w * px_b * px_b / denom
+
+        residual = (1.0 if accepted else 0.0) - p
+        s.a += (p_aa + p_ab * m) * residual
+        s.b += (p_ab + p_bb * m) * residual
+        s.p_aa, s.p_ab, s.p_bb = p_aa, p_ab, p_bb
+        s.n += 1
+        s.published = _params(s.a, s.b, s.n, self._default)
+
+    def observe_many(self, segments, margins, accepted):
+        """Sequential observe over an event stream (same result as one call per event)."""
+        for segment, margin, outcome in zip(segments, margins, accepted):
+            self.observe(segment, margin, outcome)
+
+    def refit(self, segments, margins, accepted, keys: Optional[list] = None,
+              iterations: int = 50, tol: float = 1e-7):
+        """
+        Batch refit from historical events, all segments at once: vectorized
+        Newton / IRLS on the prior-regularized log-likelihood, with per-segment
+        sums via np.bincount. Replaces the online state of every segment seen,
+        setting its covariance to the inverse Hessian so online updates resume
+        from an equally confident estimate.
+
+        segments: one segment key per event, or (faster for millions of events)
+        an integer array of positions into `keys`.
+        """
+        if keys is None:
+            keys, codes = _encode_segments(segments)
+        else:
+            codes = np.asarray(segments, dtype=np.intp)
+        margins = np.asarray(margins, dtype=np.float64)
+        y = np.asarray(accepted, dtype=np.float64)
+        theta, inv_h = fit_segments(codes, len(keys), margins, y, (self.prior_a, self.prior_b),
+                                    (self.prior_var_a, self.prior_var_b), iterations, tol)
+        counts = np.bincount(codes, minlength=len(keys))
+        for i, key in enumerate(keys):
+            self._segments[key] = _Segment(float(theta[i, 0]), float(theta[i, 1]), float(inv_h[i, 0, 0]),
+                                           float(inv_h[i, 0, 1]), float(inv_h[i, 1, 1]), int(counts[i]),
+                                           fallback=self._default)
+
+def _encode_segments(segments) -> Tuple[list, np.ndarray]:
+    """Hashable segment keys -> (unique keys, integer code per event)."""
+    index: Dict[Hashable, int] = {}
+    codes = np.fromiter((index.setdefault(s, len(index)) for s in segments), dtype=np.intp)
+    return list(index), codes
+
+def fit_segments(codes: np.ndarray, n_segments: int, margins: np.ndarray, y: np.ndarray,
+                 prior_theta: Tuple[float, float], prior_var: Tuple[float, float],
+                 iterations: int = 50, tol: float = 1e-7) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Newton / IRLS fit of logit = a + b * margin for every segment together.
+    Returns theta (n_segments, 2) and the inverse Hessian (n_segments, 2, 2).
+    """
+    theta = np.tile(np.array(prior_theta, dtype=np.float64), (n_segments, 1))
+    prior = np.array(prior_theta, dtype=np.float64)
+    prior_prec = 1.0 / np.array(prior_var, dtype=np.float64)
+
+    def sums(weights):
+        return np.bincount(codes, weights=weights, minlength=n_segments)
+
+    sign = 1.0 - 2.0 * y  # log sigmoid(+-z) = -logaddexp(0, -+z), without overflow
+
+    def objective(theta):
+        """Penalized log-likelihood per segment, and the logit of every event."""
+        z = theta[codes, 0] + theta[codes, 1] * margins
+        ll = sums(-np.logaddexp(0.0, sign * z))
+        return ll - 0.5 * ((theta - prior) ** 2 * prior_prec).sum(axis=1), z
+
+    current, z = objective(theta)
+    for _ in range(iterations):
+        p = _sigmoid(z)
+        w = p * (1 - p)
+        r = y - p
+        # Gradient and (negated) Hessian of the penalized log-likelihood, per segment
+        g = np.stack([sums(r), sums(r * margins)], axis=1) - prior_prec * (theta - prior)
+        h_aa = sums(w) + prior_prec[0]
+        h_ab = sums(w * margins)
+        h_bb = sums(w * margins * margins) + prior_prec[1]
+        det = h_aa * h_bb - h_ab * h_ab
+        step = np.stack([(h_bb * g[:, 0] - h_ab * g[:, 1]) / det,
+                         (h_aa * g[:, 1] - h_ab * g[:, 0]) / det], axis=1)
+        # Far from the optimum Newton can overshoot: halve the step of every segment whose objective drops
+        for _ in range(30):
+            candidate, z = objective(theta + step)
+            worse = candidate < current - 1e-9 * np.abs(current)  # relative slack for summation noise
+            if not worse.any():
+                break
+            step[worse] *= 0.5
+        else:
+            # Still no improvement after 30 halvings: those segments keep their current theta
+            step[worse] = 0.0
+            candidate, z = objective(theta + step)
+        theta += step
+        current = candidate
+        if np.abs(step).max() < tol:
+            break
+
+    inv_h = np.empty((n_segments, 2, 2))
+    inv_h[:, 0, 0] = h_bb / det
+    inv_h[:, 0, 1] = inv_h[:, 1, 0] = -h_ab / det
+    inv_h[:, 1, 1] = h_aa / det
+    return theta, inv_h
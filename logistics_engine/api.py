@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+from . import pricing_engine
+from .pricing_engine import PricingEngine, VehicleType
+from . import cost_model
+
+@dataclass
+class MoveRequest:
+    """
+    One move order for both pricing models: the market fields used by
+    PricingEngine (vehicle, weather, surge) and the job-complexity fields used
+    by the LogisticPricingModel cost model (cost_model).
+    """
+    distance_km: float
+    vehicle_type: VehicleType = VehicleType.VAN
+    is_bad_weather: bool = False
+    origin_km: Optional[Tuple[float, float]] = None
+    num_workers: int = 2
+    total_floors: int = 0          # Sum of origin and destination floors
+    num_heavy_items: int = 0
+    walking_distance_m: float = 0.0
+
+    @classmethod
+    def from_request(cls, req) -> "MoveRequest":
+        """Wraps either legacy request type (missing fields take the defaults above)."""
+        if isinstance(req, cls):
+            return req
+        if isinstance(req, pricing_engine.MoveRequest):
+            return cls(req.distance_km, req.vehicle_type, req.is_bad_weather, req.origin_km)
+        if isinstance(req, cost_model.MoveRequest):
+            return cls(req.distance_km, num_workers=req.num_workers, total_floors=req.total_floors,
+                       num_heavy_items=req.num_heavy_items, walking_distance_m=req.walking_distance_m)
+        raise TypeError(f"Cannot price a {type(req).__name__}.")
+
+    def for_market(self) -> pricing_engine.MoveRequest:
+        return pricing_engine.MoveRequest(self.distance_km, self.vehicle_type, self.is_bad_weather, self.origin_km)
+
+    def for_cost_model(self) -> cost_model.MoveRequest:
+        return cost_model.MoveRequest(self.distance_km, self.num_workers, self.total_floors,
+                                      self.num_heavy_items, self.walking_distance_m)
+
+AnyRequest = Union[MoveRequest, pricing_engine.MoveRequest, cost_model.MoveRequest]
+
+@dataclass
+class Quote:
+    price: float                 # Market price for this attempt (vehicle, weather, surge)
+    attempt_number: int
+    operational_cost: float      # Cost-model estimate of the job's cost
+    required_margin: float       # Margin giving target_acceptance under the acceptance sigmoid
+    target_price: float          # operational_cost + required_margin
+    target_acceptance: float
+
+class Pricer:
+    """
+    Both pricing models behind one API: PricingEngine for the market price of
+    an attempt, LogisticPricingModel for cost and the target-acceptance price.
+    Scalar quotes stay in pure Python; the *_batch methods load NumPy.
+    """
+
+    def __init__(self, engine: Optional[PricingEngine] = None,
+                 model: Optional[cost_model.LogisticPricingModel] = None):
+        self.engine = engine or PricingEngine()
+        self.model = model or cost_model.LogisticPricingModel()
+
+    def price(self, req: AnyRequest, attempt_number: int = 1) -> float:
+        return self.engine.calculate_price(MoveRequest.from_request(req).for_market(), attempt_number)
+
+    def quote(self, req: AnyRequest, attempt_number: int = 1, target_acceptance: float = 0.85) -> Quote:
+        req = MoveRequest.from_request(req)
+        target = self.model.optimize_price_for_target_acceptance(req.for_cost_model(), target_acceptance)
+        return Quote(
+            price=self.engine.calculate_price(req.for_market(), attempt_number),
+            attempt_number=attempt_number,
+            operational_cost=target["operational_cost"],
+            required_margin=target["required_margin"],
+            target_price=target["final_price"],
+            target_acceptance=target_acceptance,
+        )
+
+    def price_batch(self, distance_km, vehicle_codes, is_bad_weather, attempt_numbers=1):
+        """PricingEngine.calculate_prices_batch over columnar orders."""
+        return self.engine.calculate_prices_batch(distance_km, vehicle_codes, is_bad_weather, attempt_numbers)
+
+    def target_prices_batch(self, requests, target_acceptance=0.85):
+        """LogisticPricingModel.optimize_prices_for_target_acceptance_batch over a REQUEST_DTYPE table."""
+        return self.model.optimize_prices_for_target_acceptance_batch(requests, target_acceptance)
+
+_default_pricer: Optional[Pricer] = None
+
+def quote(req: AnyRequest, attempt_number: int = 1, target_acceptance: float = 0.85) -> Quote:
+    """Quote with a shared default Pricer."""
+    global _default_pricer
+    if _default_pricer is None:
+        _default_pricer = Pricer()
+    return _default_pricer.quote(req, attempt_number, target_acceptance)
@@ -0,0 +1,215 @@
+from typing import List, Optional, Union
+import numpy as np
+
+from .dispatch_engine import DispatchEngine, Driver
+from .driver_fleet import DriverFleet
+from .pricing_engine import MoveRequest
+
+def hungarian(cost: np.ndarray) -> np.ndarray:
+    """
+    Minimum-cost assignment (Hungarian / shortest augmenting path, O(n^2 m)).
+    Works on rectangular matrices; the inner column scan is vectorized.
+    Returns col_for_row: the column assigned to each row, -1 when there are
+    more rows than columns and the row is left out.
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    n, m = cost.shape
+    if n > m:
+        row_for_col = hungarian(cost.T)
+        col_for_row = np.full(n, -1)
+        col_for_row[row_for_col] = np.arange(m)
+        return col_for_row
+
+    # 1-based potentials / matching as in the classic formulation; index 0 is the virtual column
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    row_of = np.zeros(m + 1, dtype=np.intp)
+    way = np.zeros(m + 1, dtype=np.intp)
+    for i in range(1, n + 1):
+        row_of[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = row_of[j0]
+            free = ~used[1:]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = j0
+            j1 = int(np.argmin(np.where(free, minv[1:], np.inf))) + 1
+            delta = minv[j1]
+            u[row_of[used]] += delta
+            v[used] -= delta
+            minv[~used] -= delta
+            j0 = j1
+            if row_of[j0] == 0:
+                break
+        # Augment along the alternating path
+        while j0:
+            j1 = way[j0]
+            row_of[j0] = row_of[j1]
+            j0 = j1
+
+    col_for_row = np.full(n, -1)
+    assigned = np.flatnonzero(row_of[1:])
+    col_for_row[row_of[1:][assigned] - 1] = assigned
+    return col_for_row
+
+def auction(candidates: np.ndarray, benefit: np.ndarray, n_objects: int, eps: float = 1e-3) -> np.ndarray:
+    """
+    Sparse (candidate-limited) maximum-benefit assignment, Jacobi auction.
+    All unassigned bidders bid in the same NumPy round; each object goes to its
+    highest bidder. A bidder whose best net value drops to zero keeps the
+    outside option (stays unassigned). The result is within n * eps of optimal.
+
+    Args:
+        candidates: (n, c) object index per bidder, -1 for padding
+        benefit: (n, c) value of each candidate to the bidder
+        n_objects: number of objects (drivers)
+    Returns object_for_bidder, -1 when unassigned.
+    """
+    n, c = candidates.shape
+    benefit = np.where(candidates >= 0, benefit, -np.inf)
+    safe_candidates = np.where(candidates >= 0, candidates, 0)
+    prices = np.zeros(n_objects)
+    owner = np.full(n_objects, -1)
+    object_for_bidder = np.full(n, -1)
+    active = np.arange(n)
+
+    while active.size:
+        values = benefit[active] - prices[safe_candidates[active]]
+        best = np.argmax(values, axis=1)
+        rows = np.arange(active.size)
+        best_value = values[rows, best]
+        if c > 1:
+            values[rows, best] = -np.inf
+            second_value = np.maximum(values.max(axis=1), 0.0)
+        else:
+            second_value = np.zeros(active.size)
+
+        # Outside option: nothing left worth bidding for
+        bidding = best_value > 0
+        bidders = active[bidding]
+        targets = safe_candidates[bidders, best[bidding]]
+        bids = prices[targets] + best_value[bidding] - second_value[bidding] + eps
+
+        # Highest bid per object wins (sort by object, then bid descending)
+        order = np.lexsort((-bids, targets))
+        targets, bidders, bids = targets[order], bidders[order], bids[order]
+        first = np.ones(len(targets), dtype=bool)
+        first[1:] = targets[1:] != targets[:-1]
+        won_objects, winners = targets[first], bidders[first]
+
+        displaced = owner[won_objects]
+        displaced = displaced[displaced >= 0]
+        object_for_bidder[displaced] = -1
+        owner[won_objects] = winners
+        prices[won_objects] = bids[first]
+        object_for_bidder[winners] = won_objects
+
+        losers = bidders[~first]
+        active = np.concatenate([losers, displaced])
+    return object_for_bidder
+
+class AssignmentEngine:
+    """
+    Global multi-order dispatch: matches a window of open orders against the
+    free fleet at once instead of letting every order greedily grab the same
+    top-scored drivers.
+
+    Each round solves an assignment problem on the DispatchEngine score matrix
+    (rating / proximity / cold-start) and gives every order one more driver,
+    so the resulting cascades never share a driver.
+    """
+
+    def __init__(self, dispatcher: Optional[DispatchEngine] = None, cascade_depth: int = 3,
+                 candidates_per_order: int = 32, dense_limit: int = 250_000, eps: float = 1e-3):
+        self.dispatcher = dispatcher or DispatchEngine()
+        self.cascade_depth = cascade_depth
+        self.candidates_per_order = candidates_per_order
+        self.dense_limit = dense_limit  # N*M above which the sparse auction is used
+        self.eps = eps
+
+    def assign(self, orders: List[MoveRequest], drivers: Union[DriverFleet, List[Driver]],
+               method: str = "auto") -> List[List[str]]:
+        """
+        Returns, per order, the driver ids to offer in cascade order (best match first).
+
+        Orders need origin_km and drivers position_km. method: "dense" (Hungarian),
+        "sparse" (auction over candidates_per_order drivers per order) or "auto".
+        """
+        fleet = drivers if isinstance(drivers, DriverFleet) else DriverFleet.from_drivers(drivers)
+        free = fleet.available().indices
+        if not orders or free.size == 0:
+            return [[] for _ in orders]
+        origins = np.array([order.origin_km for order in orders], dtype=np.float64)
+        distance = np.hypot(fleet.x_km[free][None, :] - origins[:, :1], fleet.y_km[free][None, :] - origins[:, 1:])
+        # Existing heuristic with location_km = distance from each order's origin
+        scores = self.dispatcher.score_drivers(fleet.rating[free][None, :], distance,
+                                               fleet.days_in_system[free][None, :],
+                                               self.dispatcher.exposure_slots(fleet, free[None, :]))
+        if method == "auto":
+            method = "dense" if scores.size <= self.dense_limit else "sparse"
+        if method == "dense":
+            picks = self._dense_rounds(scores)
+        elif method == "sparse":
+            picks = self._sparse_rounds(scores, distance)
+        else:
+            raise ValueError(f"Unknown assignment method: {method}")
+
+        ids = fleet.ids[free]
+        return [[str(ids[j]) for j in row] for row in picks]
+
+    def _dense_rounds(self, scores: np.ndarray) -> List[List[int]]:
+        n, m = scores.shape
+        cascades = [[] for _ in range(n)]
+        remaining = np.arange(m)
+        for _ in range(self.cascade_depth):
+            if remaining.size == 0:
+                break
+            col_for_row = hungarian(-scores[:, remaining])
+            matched = np.flatnonzero(col_for_row >= 0)
+            for row in matched:
+                cascades[row].append(int(remaining[col_for_row[row]]))
+            keep = np.ones(remaining.size, dtype=bool)
+            keep[col_for_row[matched]] = False
+            remaining = remaining[keep]
+        return cascades
+
+    def _sparse_rounds(self, scores: np.ndarray, distance: np.ndarray) -> List[List[int]]:
+        n, m = scores.shape
+        candidates = self._candidates(scores, distance)
+        benefit = np.take_along_axis(scores, np.maximum(candidates, 0), axis=1)
+        cascades = [[] for _ in range(n)]
+        taken = np.zeros(m, dtype=bool)
+        for _ in range(self.cascade_depth):
+            pool = np.where((candidates < 0) | taken[np.maximum(candidates, 0)], -1, candidates)
+            object_for_order = auction(pool, benefit, m, self.eps)
+            matched = np.flatnonzero(object_for_order >= 0)
+            if matched.size == 0:
+                break
+            for row in matched:
+                cascades[row].append(int(object_for_order[row]))
+            taken[object_for_order[matched]] = True
+        return cascades
+
+    def _candidates(self, scores: np.ndarray, distance: np.ndarray) -> np.ndarray:
+        """
+        Per-order candidate list: half best-scored, half nearest drivers.
+        The best-scored half alone is nearly the same set for every order (the
+        cold-start bonus dominates), so the nearest half keeps the pools diverse.
+        Duplicates are padded out with -1.
+        """
+        n, m = scores.shape
+        if self.candidates_per_order >= m:
+            return np.tile(np.arange(m), (n, 1))
+        half = max(self.candidates_per_order // 2, 1)
+        by_score = np.argpartition(-scores, half - 1, axis=1)[:, :half]
+        by_distance = np.argpartition(distance, half - 1, axis=1)[:, :half]
+        candidates = np.sort(np.concatenate([by_score, by_distance], axis=1), axis=1)
+        duplicate = np.zeros(candidates.shape, dtype=bool)
+        duplicate[:, 1:] = candidates[:, 1:] == candidates[:, :-1]
+        candidates[duplicate] = -1
+        return candidates
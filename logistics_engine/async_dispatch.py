@@ -0,0 +1,227 @@
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+import asyncio
+
+import numpy as np
+
+from .dispatch_engine import DispatchEngine
+from .pricing_engine import PricingEngine, MoveRequest
+
+class OfferTransport:
+    """
+    How offers reach drivers (push notification, websocket, ...).
+
+    A transport implements either send_offer (one driver at a time; the default
+    offer_batch fans it out concurrently) or offer_batch directly when the
+    backend can broadcast a whole batch in one call. Either way the transport
+    tracks which offers of the order's current batch are still unanswered
+    (open_offers), so only those get withdrawn.
+    """
+
+    def __init__(self):
+        self._open: Dict[str, Set[str]] = {}   # order id -> drivers yet to answer the current batch
+
+    async def send_offer(self, driver_id: str, order_id: str, price: float) -> bool:
+        """Resolves True if the driver accepts, False if they decline."""
+        raise NotImplementedError
+
+    async def offer_batch(self, driver_ids: Sequence[str], order_id: str, price: float) -> AsyncIterator[str]:
+        """
+        Offers the order to every driver in the batch at once and yields the ids
+        of accepting drivers as their answers arrive. Ends when every driver has
+        answered; closing the iterator early withdraws the unanswered offers.
+        """
+        tasks = {asyncio.ensure_future(self.send_offer(driver_id, order_id, price)): driver_id
+                 for driver_id in driver_ids}
+        unanswered = self._open[order_id] = set(tasks.values())
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    unanswered.discard(tasks[task])
+                for task in done:
+                    if not task.cancelled() and task.exception() is None and task.result():
+                        yield tasks[task]
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def open_offers(self, order_id: str, driver_ids: Sequence[str]) -> List[str]:
+        """Those of driver_ids still due to answer the order's last batch; forgets the batch."""
+        unanswered = self._open.pop(order_id, set())
+        return [driver_id for driver_id in driver_ids if driver_id in unanswered]
+
+    async def cancel_offers(self, driver_ids: Sequence[str], order_id: str):
+        """Tells drivers the order is gone (default: nothing to notify)."""
+
+class FakeOfferTransport(OfferTransport):
+    """
+    In-process transport for tests and benchmarks. Each driver answers after a
+    random delay in [0, max_latency_s] and accepts with accept_probability(price).
+    A batch is sampled in one NumPy pass and only the acceptors are awaited, so
+    Panic Mode broadcasts to thousands of drivers cost no per-driver tasks.
+    """
+
+    def __init__(self, accept_probability: Callable[[float], float] = lambda price: 0.3,
+                 max_latency_s: float = 5.0, seed: int = 0):
+        super().__init__()
+        self._batches: Dict[str, tuple] = {}   # order id -> (sent at, driver ids, answer latencies)
+        self.accept_probability = accept_probability
+        self.max_latency_s = max_latency_s
+        self.rng = np.random.default_rng(seed)
+        self.sent = 0
+        self.cancelled = 0
+
+    async def send_offer(self, driver_id: str, order_id: str, price: float) -> bool:
+        self.sent += 1
+        accepts = self.rng.random() < self.accept_probability(price)
+        await asyncio.sleep(self.rng.uniform(0.0, self.max_latency_s))
+        return accepts
+
+    async def offer_batch(self, driver_ids: Sequence[str], order_id: str, price: float) -> AsyncIterator[str]:
+        n = len(driver_ids)
+        self.sent += n
+        if not n:
+            return
+        accepts = np.flatnonzero(self.rng.random(n) < self.accept_probability(price))
+        latency = self.rng.uniform(0.0, self.max_latency_s, n)
+        # Answer times instead of a per-driver set: open_offers compares them with the clock
+        self._batches[order_id] = (asyncio.get_running_loop().time(), np.asarray(driver_ids), latency)
+        accepts = accepts[np.argsort(latency[accepts], kind="stable")]
+        elapsed = 0.0
+        for i in accepts.tolist():
+            await asyncio.sleep(latency[i] - elapsed)
+            elapsed = latency[i]
+            yield str(driver_ids[i])
+        # The remaining drivers decline; the batch is over when the slowest answers
+        await asyncio.sleep(float(latency.max()) - elapsed)
+
+    def open_offers(self, order_id: str, driver_ids: Sequence[str]) -> List[str]:
+        batch = self._batches.pop(order_id, None)
+        if batch is None:
+            return []
+        started, batch_ids, latency = batch
+        elapsed = asyncio.get_running_loop().time() - started
+        unanswered = set(batch_ids[latency > elapsed].tolist())
+        return [driver_id for driver_id in np.asarray(driver_ids).tolist() if driver_id in unanswered]
+
+    async def cancel_offers(self, driver_ids: Sequence[str], order_id: str):
+        self.cancelled += len(driver_ids)
+
+@dataclass
+class CascadeResult:
+    order_id: str
+    driver_id: Optional[str]          # None when every batch expired
+    price: Optional[float]
+    attempt: int
+    elapsed_s: float
+    offers_sent: int = 0
+    escalation_latency_s: List[float] = field(default_factory=list)  # batch end -> next batch sent
+
+class CascadeOrchestrator:
+    """
+    Runs each order's cascading dispatch as an asyncio task.
+
+    A batch goes out in one OfferTransport.offer_batch call at
+    calculate_price(attempt_number=...) for that attempt. The first acceptance
+    from a still-free driver wins the order and the rest of the batch is
+    withdrawn; if the batch times out (batch_timeout_s) or everyone declines,
+    the cascade escalates to the next batch and price. Nothing blocks the
+    event loop while waiting, so thousands of cascades share one loop.
+
+    drivers: a List[Driver], a driver_fleet.DriverFleet, or a FleetView of
+    candidates (e.g. from DispatchEngine.nearby_drivers). Winners are marked
+    busy, so later batches of other orders skip them. Drivers are ranked when
+    the cascade starts, before the first await.
+    """
+
+    def __init__(self, dispatcher: Optional[DispatchEngine] = None, pricer: Optional[PricingEngine] = None,
+                 transport: Optional[OfferTransport] = None, batch_timeout_s: float = 10.0):
+        self.dispatcher = dispatcher or DispatchEngine()
+        self.pricer = pricer or PricingEngine()
+        self.transport = transport or FakeOfferTransport()
+        self.batch_timeout_s = batch_timeout_s
+
+    def _cascade(self, drivers):
+        """Yields (driver ids, claim) per batch; claim(driver_id) marks a free driver busy."""
+        if hasattr(drivers, "available"):
+            # DriverFleet / FleetView: ids and busy flags straight from the columns, no per-driver objects
+            fleet = getattr(drivers, "fleet", drivers)
+            is_busy = fleet.is_busy
+
+            def claim(driver_id: str) -> bool:
+                row = fleet.index_of(driver_id)
+                if is_busy[row]:
+                    return False
+                is_busy[row] = True
+                return True
+
+            for rows in self.dispatcher.iter_fleet_batches(drivers):
+                # Drivers claimed by other orders since ranking are skipped
+                yield fleet.ids[rows[~is_busy[rows]]], claim
+        else:
+            for batch in self.dispatcher.iter_batches(drivers):
+                by_id = {d.id: d for d in batch if not d.is_busy}
+
+                def claim(driver_id: str, by_id=by_id) -> bool:
+                    driver = by_id[driver_id]
+                    if driver.is_busy:
+                        return False
+                    driver.is_busy = True
+                    return True
+
+                yield list(by_id), claim
+
+    async def dispatch(self, order_id: str, order: MoveRequest, drivers) -> CascadeResult:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = CascadeResult(order_id, None, None, 0, 0.0)
+        batch_ended = None
+
+        for attempt, (driver_ids, claim) in enumerate(self._cascade(drivers), 1):
+            result.attempt = attempt
+            price = self.pricer.calculate_price(order, attempt_number=attempt)
+            result.offers_sent += len(driver_ids)
+            if batch_ended is not None:
+                result.escalation_latency_s.append(loop.time() - batch_ended)
+
+            winner = await self._await_batch(driver_ids, claim, order_id, price)
+            if winner is not None:
+                result.driver_id, result.price = str(winner), price
+                break
+            batch_ended = loop.time()
+
+        result.elapsed_s = loop.time() - started
+        return result
+
+    async def _await_batch(self, driver_ids: Sequence[str], claim, order_id: str, price: float) -> Optional[str]:
+        """Waits up to batch_timeout_s for the first claimable acceptance; withdraws the rest."""
+        offers = self.transport.offer_batch(driver_ids, order_id, price)
+
+        async def first_acceptance() -> Optional[str]:
+            async for driver_id in offers:
+                # No await between the busy check and the claim, so no other order can race us
+                if claim(driver_id):
+                    return driver_id
+            return None  # everyone declined (or was taken meanwhile)
+
+        winner = None
+        try:
+            winner = await asyncio.wait_for(first_acceptance(), self.batch_timeout_s)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            await offers.aclose()
+
+        # Only offers still awaiting an answer are withdrawn (not the winner, not drivers who answered)
+        outstanding = self.transport.open_offers(order_id, driver_ids)
+        if outstanding:
+            await self.transport.cancel_offers(outstanding, order_id)
+        return winner
+
+    async def dispatch_many(self, orders: Iterable[Tuple[str, MoveRequest]], drivers) -> List[CascadeResult]:
+        """Runs all cascades concurrently on the current event loop."""
+        return await asyncio.gather(*(self.dispatch(order_id, order, drivers) for order_id, order in orders))
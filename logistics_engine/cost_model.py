@@ -0,0 +1,229 @@
+from __future__ import annotations
+import math
+from dataclasses import dataclass, astuple
+from typing import List, Optional, Tuple
+
+from .lazy_import import LazyModule
+from .rounding import round_cents
+
+np = LazyModule("numpy")  # loaded by the first array operation, not by importing this module
+
+@dataclass
+class MoveRequest:
+    """Data Transfer Object for Move Request parameters."""
+    distance_km: float
+    num_workers: int
+    total_floors: int  # Sum of origin and destination floors
+    num_heavy_items: int
+    walking_distance_m: float
+
+# Columnar layout of a request table (one row per MoveRequest)
+_REQUEST_FIELDS = [
+    ('distance_km', 'f8'),
+    ('num_workers', 'i4'),
+    ('total_floors', 'i4'),
+    ('num_heavy_items', 'i4'),
+    ('walking_distance_m', 'f8'),
+]
+
+# Result rows of optimize_prices_for_target_acceptance_batch
+_QUOTE_FIELDS = [
+    ('operational_cost', 'f8'),
+    ('required_margin', 'f8'),
+    ('final_price', 'f8'),
+    ('target_acceptance', 'f8'),
+]
+
+_DTYPE_FIELDS = {"REQUEST_DTYPE": _REQUEST_FIELDS, "QUOTE_DTYPE": _QUOTE_FIELDS}
+
+def __getattr__(name: str):
+    """REQUEST_DTYPE / QUOTE_DTYPE are built on first use (module attribute or _dtype)."""
+    if name in _DTYPE_FIELDS:
+        dtype = globals()[name] = np.dtype(_DTYPE_FIELDS[name])
+        return dtype
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _dtype(name: str):
+    return globals()[name] if name in globals() else __getattr__(name)
+
+def requests_to_array(requests: List[MoveRequest]) -> np.ndarray:
+    """Packs MoveRequest objects into a REQUEST_DTYPE structured array."""
+    return np.array([astuple(r) for r in requests], dtype=_dtype("REQUEST_DTYPE"))
+
+@dataclass
+class DistanceGrid:
+    """
+    Distance cost tabulated on a quantized grid (grid_km[i] -> cost[i]),
+    evaluated with linear interpolation; distances past the end extrapolate
+    along the last segment.
+    """
+    grid_km: np.ndarray
+    cost: np.ndarray
+    distance_coeff: float   # Coefficient the table was built with (rebuild when it changes)
+
+    def __call__(self, distance_km) -> np.ndarray:
+        distance_km = np.asarray(distance_km, dtype=np.float64)
+        grid, cost = self.grid_km, self.cost
+        step = grid[1] - grid[0]
+        i = np.clip(((distance_km - grid[0]) // step).astype(np.intp), 0, len(grid) - 2)
+        t = (distance_km - grid[i]) / step
+        return cost[i] + t * (cost[i + 1] - cost[i])
+
+class LogisticPricingModel:
+    """
+    A variable pricing engine that optimizes for driver acceptance 
+    based on job complexity and operational costs.
+    """
+    
+    def __init__(self, base_rate: float = 50.0):
+        self.base_rate = base_rate
+        # Weights (Betas) derived from historical data or heuristic analysis
+        self.weights = {
+            'distance_coeff': 2.5,   # Cost per km
+            'worker_coeff': 30.0,    # Cost per worker
+            'floor_coeff': 10.0,     # Cost per floor level
+            'heavy_item_coeff': 15.0,# Cost per heavy item
+            'walk_coeff': 0.5        # Cost per meter of walking
+        }
+        # Logistic parameters for Driver Acceptance Probability
+        self.acceptance_steepness = 0.15  # 'k' in sigmoid function
+        self.acceptance_midpoint = 20.0   # The margin ($) where acceptance is 50%
+
+    def calculate_operational_cost(self, req: MoveRequest) -> float:
+        """Calculates the raw operational complexity cost (linear regression model)."""
+        cost = self.base_rate
+        cost += req.distance_km * self.weights['distance_coeff']
+        cost += req.num_workers * self.weights['worker_coeff']
+        cost += req.total_floors * self.weights['floor_coeff']
+        cost += req.num_heavy_items * self.weights['heavy_item_coeff']
+        cost += req.walking_distance_m * self.weights['walk_coeff']
+        return round(cost, 2)
+
+    def distance_grid(self, max_km: float = 200.0, step_km: float = 0.5) -> DistanceGrid:
+        """Tabulates the distance term of the cost model for calculate_operational_cost_batch(grid=...)."""
+        grid_km = np.arange(0.0, max_km + step_km, step_km)
+        return DistanceGrid(grid_km, grid_km * self.weights['distance_coeff'], self.weights['distance_coeff'])
+
+    def calculate_operational_cost_batch(self, requests: np.ndarray, grid: Optional[DistanceGrid] = None) -> np.ndarray:
+        """
+        Array version of calculate_operational_cost over a REQUEST_DTYPE table.
+        With a DistanceGrid the distance term is interpolated from the table
+        (exact up to float rounding while the distance cost is linear).
+        """
+        if grid is not None and grid.distance_coeff != self.weights['distance_coeff']:
+            raise ValueError("Distance grid is stale: distance_coeff changed since it was built.")
+        distance_cost = grid(requests['distance_km']) if grid is not None \
+            else requests['distance_km'] * self.weights['distance_coeff']
+        cost = self.base_rate + distance_cost
+        cost += requests['num_workers'] * self.weights['worker_coeff']
+        cost += requests['total_floors'] * self.weights['floor_coeff']
+        cost += requests['num_heavy_items'] * self.weights['heavy_item_coeff']
+        cost += requests['walking_distance_m'] * self.weights['walk_coeff']
+        return round_cents(cost)
+
+    def estimate_acceptance_probability(self, margin: float) -> float:
+        """
+        Models driver acceptance using a Sigmoid function.
+        As margin (profit for driver) increases, probability of acceptance approaches 1.
+        """
+        # Sigmoid function: 1 / (1 + e^-k(x - x0))
+        try:
+            prob = 1 / (1 + math.exp(-self.acceptance_steepness * (margin - self.acceptance_midpoint)))
+            return prob
+        except OverflowError:
+            return 0.0 if margin < self.acceptance_midpoint else 1.0
+
+    def estimate_acceptance_probability_batch(self, margins) -> np.ndarray:
+        """
+        Array version of estimate_acceptance_probability.
+        Evaluates exp() only on non-positive arguments, so it cannot overflow.
+        """
+        z = -self.acceptance_steepness * (np.asarray(margins, dtype=np.float64) - self.acceptance_midpoint)
+        e = np.exp(-np.abs(z))
+        return np.where(z > 0, e / (1 + e), 1 / (1 + e))
+
+    def required_margin_batch(self, target_prob) -> np.ndarray:
+        """Inverse sigmoid: margin giving each target acceptance probability."""
+        target_prob = np.asarray(target_prob, dtype=np.float64)
+        if np.any((target_prob <= 0) | (target_prob >= 1)):
+            raise ValueError("Target probability must be between 0 and 1 (exclusive).")
+        return self.acceptance_midpoint - (1 / self.acceptance_steepness) * np.log((1 / target_prob) - 1)
+
+    def optimize_prices_for_target_acceptance_batch(self, requests: np.ndarray, target_prob=0.85,
+                                                     grid: Optional[DistanceGrid] = None) -> np.ndarray:
+        """
+        Array version of optimize_price_for_target_acceptance.
+        target_prob may be a scalar or one probability per request.
+        Returns a QUOTE_DTYPE structured array (one row per request).
+        """
+        base_cost = self.calculate_operational_cost_batch(requests, grid)
+        required_margin = self.required_margin_batch(target_prob)
+
+        quotes = np.empty(len(requests), dtype=_dtype("QUOTE_DTYPE"))
+        quotes['operational_cost'] = base_cost
+        quotes['required_margin'] = round_cents(np.broadcast_to(required_margin, base_cost.shape).copy())
+        quotes['final_price'] = round_cents(base_cost + required_margin)
+        quotes['target_acceptance'] = target_prob
+        return quotes
+
+    def optimize_price_for_target_acceptance(self, req: MoveRequest, target_prob: float = 0.85) -> dict:
+        """
+        Reverse solves the logistic function to find the required price 
+        to achieve a specific driver acceptance rate (e.g., 85%).
+        """
+        base_cost = self.calculate_operational_cost(req)
+        
+        # Inverse Sigmoid (Logit) to find required margin for target probability
+        # margin = M0 - (1/k) * ln(1/P - 1)
+        if target_prob <= 0 or target_prob >= 1:
+            raise ValueError("Target probability must be between 0 and 1 (exclusive).")
+            
+        required_margin = self.acceptance_midpoint - (1 / self.acceptance_steepness) * math.log((1 / target_prob) - 1)
+        final_price = base_cost + required_margin
+
+        return {
+            "operational_cost": base_cost,
+            "required_margin": round(required_margin, 2),
+            "final_price": round(final_price, 2),
+            "target_acceptance_rate": f"{target_prob*100}%"
+        }
+
+def validate_distance_grid(model: LogisticPricingModel, grid: DistanceGrid, requests: np.ndarray,
+                           tolerance: float = 0.01) -> float:
+    """
+    Largest absolute difference between grid-interpolated and direct operational
+    costs over a REQUEST_DTYPE table; raises ValueError above tolerance (one cent).
+    """
+    direct = model.calculate_operational_cost_batch(requests)
+    interpolated = model.calculate_operational_cost_batch(requests, grid)
+    worst = float(np.abs(interpolated - direct).max()) if len(requests) else 0.0
+    if worst > tolerance + 1e-9:
+        raise ValueError(f"Distance grid deviates from the cost model by {worst:.4f} (> {tolerance}).")
+    return worst
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    # Simulate a difficult move
+    request = MoveRequest(
+        distance_km=15.5,
+        num_workers=3,
+        total_floors=4,      # e.g., 2 floors origin, 2 destination
+        num_heavy_items=2,   # Piano, Safe
+        walking_distance_m=150
+    )
+
+    model = LogisticPricingModel()
+    model_base_100= LogisticPricingModel(base_rate=100.0)
+    
+    # Calculate Optimal Price for 90% Driver Acceptance
+    result = model.optimize_price_for_target_acceptance(request, target_prob=0.90)
+    result_100 = model_base_100.optimize_price_for_target_acceptance(request, target_prob=0.99)
+    
+    print(f"--- Optimization Result ---")
+    print(f"Base Operational Cost: ${result_100['operational_cost']}")
+    print(f"Dynamic Margin Needed: ${result_100['required_margin']}")
+    print(f"Recommended Price:     ${result_100['final_price']}")
+    print(f"--- Optimization Result ---")
+    print(f"Base Operational Cost: ${result['operational_cost']}")
+    print(f"Dynamic Margin Needed: ${result['required_margin']}")
+    print(f"Recommended Price:     ${result['final_price']}")
\ No newline at end of file
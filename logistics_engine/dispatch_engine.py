@@ -0,0 +1,245 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+import math
+
+from .lazy_import import LazyModule
+
+np = LazyModule("numpy")
+
+@dataclass
+class Driver:
+    id: str
+    name: str
+    rating: float       # 0.0 to 5.0
+    location_km: float  # Distance from Origin
+    days_in_system: int # To identify "New" drivers
+    is_busy: bool = False
+    position_km: Optional[Tuple[float, float]] = None  # (x, y) in the metro grid, for spatial dispatch
+
+class NearbyDriver:
+    """
+    A Driver as seen from one order's origin: location_km is the distance
+    from that origin, every other attribute reads and writes the shared Driver
+    (so marking a candidate busy marks the driver busy).
+    """
+    __slots__ = ("driver", "location_km")
+
+    def __init__(self, driver, location_km: float):
+        object.__setattr__(self, "driver", driver)
+        object.__setattr__(self, "location_km", location_km)
+
+    def __getattr__(self, name: str):
+        return getattr(self.driver, name)
+
+    def __setattr__(self, name: str, value):
+        if name == "location_km":
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.driver, name, value)
+
+    def __repr__(self) -> str:
+        return f"NearbyDriver({self.driver!r}, location_km={self.location_km})"
+
+def top_k_order(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Returns the indices of the k highest scores, best first.
+    Uses argpartition instead of a full sort; ties are broken by index so the
+    result matches a stable descending sort of the whole array.
+    """
+    n = len(scores)
+    if k >= n:
+        return np.lexsort((np.arange(n), -scores))
+    # k-th best score; everything strictly above it is in, ties fill the rest by index
+    threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+    above = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[:k - len(above)]
+    chosen = np.concatenate([above, ties])
+    return chosen[np.lexsort((chosen, -scores[chosen]))]
+
+class DispatchEngine:
+    def __init__(self):
+        # Weights for the Ranking Function (Quality > Proximity)
+        self.w_quality = 0.7
+        self.w_proximity = 0.3
+        self.new_driver_bonus = 0.5 # Flat bonus to score for "Cold Start"
+        self.batch_size = 10
+        # Optional exposure.ExposureLedger: scales the bonus down with tenure and offers received
+        self.exposure = None
+
+    def _calculate_score(self, driver: Driver) -> float:
+        """
+        Heuristic Scoring Function:
+        Score = (w1 * Normalized_Rating) + (w2 * Normalized_Proximity) + Boost
+        """
+        # Normalize Rating (0-5 -> 0-1)
+        norm_rating = driver.rating / 5.0
+        
+        # Normalize Proximity (Closer is better). 
+        # Using 1 / (1 + distance) to prevent division by zero and invert value.
+        norm_prox = 1 / (1 + driver.location_km)
+
+        score = (self.w_quality * norm_rating) + (self.w_proximity * norm_prox)
+
+        # Cold Start Logic: If new (< 7 days), give artificial boost
+        if self.exposure is not None:
+            score += self.new_driver_bonus * self.exposure.driver_boost_factor(driver.id, driver.days_in_system)
+        elif driver.days_in_system < 7:
+            score += self.new_driver_bonus
+
+        return score
+
+    def score_drivers(self, rating: np.ndarray, location_km: np.ndarray, days_in_system: np.ndarray,
+                      slots: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Vectorized _calculate_score over struct-of-arrays driver data.
+        Same operations in the same order, so scores are bit-identical.
+        Inputs broadcast, e.g. an (orders x drivers) distance matrix gives a score matrix.
+        slots: the drivers' exposure ledger slots (see exposure_slots), needed when self.exposure is set.
+        """
+        norm_rating = rating / 5.0
+        norm_prox = 1 / (1 + location_km)
+        score = (self.w_quality * norm_rating) + (self.w_proximity * norm_prox)
+        return score + self.cold_start_boost(days_in_system, slots)
+
+    def cold_start_boost(self, days_in_system: np.ndarray, slots: Optional[np.ndarray] = None) -> np.ndarray:
+        """Flat new_driver_bonus for drivers under 7 days, or the exposure ledger's rate-limited share of it."""
+        if self.exposure is None:
+            return np.where(days_in_system < 7, self.new_driver_bonus, 0.0)
+        if slots is None:
+            raise ValueError("Scoring with an exposure ledger needs the drivers' ledger slots.")
+        return self.new_driver_bonus * self.exposure.boost_factor(days_in_system, slots)
+
+    def exposure_slots(self, fleet, rows: np.ndarray) -> Optional[np.ndarray]:
+        """Ledger slots of DriverFleet rows for score_drivers (None without a ledger); never registers drivers."""
+        if self.exposure is None:
+            return None
+        return self.exposure.fleet_slots(fleet)[rows]
+
+    def nearby_drivers(self, index, drivers_by_id, origin_km: Tuple[float, float],
+                       radius_km: Optional[float] = None, k: Optional[int] = None) -> List[Driver]:
+        """
+        Proximity-aware candidate retrieval through a spatial_index.GridIndex.
+        Returns the free drivers within radius_km of the order origin, or the k
+        nearest (both limits may be combined). Each candidate carries its distance
+        from this origin as location_km, so rank_drivers / iter_batches /
+        _calculate_score run unchanged on the local candidates only. Shared driver
+        state is never written, so queries do not affect each other or later
+        fleet-wide rankings.
+
+        drivers_by_id: a dict of id -> Driver (returns NearbyDriver handles), or a
+        DriverFleet (returns a FleetView holding its own location_km array).
+        """
+        if radius_km is None and k is None:
+            raise ValueError("Specify radius_km, k, or both.")
+        x, y = origin_km
+        max_radius = radius_km if radius_km is not None else math.inf
+
+        if hasattr(drivers_by_id, "index_of"):
+            # DriverFleet: busy check and distance write-back straight on its columns
+            fleet = drivers_by_id
+            is_busy, index_of = fleet.is_busy, fleet.index_of
+            is_free = lambda driver_id: not is_busy[index_of(driver_id)]
+        else:
+            is_free = lambda driver_id: not drivers_by_id[driver_id].is_busy
+
+        if k is None:
+            hits = index.query_radius(x, y, max_radius, accept=is_free)
+        else:
+            hits = index.nearest(x, y, k, max_radius_km=max_radius, accept=is_free)
+
+        if hasattr(drivers_by_id, "index_of"):
+            rows = np.array([index_of(driver_id) for driver_id, _ in hits], dtype=np.intp)
+            distances = np.array([distance for _, distance in hits], dtype=np.float64)
+            return fleet.view(rows, distances)
+
+        return [NearbyDriver(drivers_by_id[driver_id], distance) for driver_id, distance in hits]
+
+    def rank_drivers(self, all_drivers: List[Driver]) -> List[Driver]:
+        """
+        Filters busy drivers and sorts available ones by Algorithm Score.
+        """
+        available = [d for d in all_drivers if not d.is_busy]
+        # Sort descending (Higher score is better)
+        return sorted(available, key=self._calculate_score, reverse=True)
+
+    def create_batches(self, ranked_drivers: List[Driver]) -> List[List[Driver]]:
+        """
+        Implements the 'Cascading Dispatch' strategy.
+        Batch 1: Top 10
+        Batch 2: Next 10
+        Batch 3: Everyone Remaining (Panic Mode)
+        """
+        batch_size = self.batch_size
+        batches = []
+
+        # Batch 1
+        batches.append(ranked_drivers[:batch_size])
+        
+        # Batch 2
+        if len(ranked_drivers) > batch_size:
+            batches.append(ranked_drivers[batch_size : batch_size*2])
+        
+        # Batch 3 (All remaining)
+        if len(ranked_drivers) > batch_size*2:
+            batches.append(ranked_drivers[batch_size*2:])
+            
+        return batches
+
+    def iter_batches(self, all_drivers) -> Iterator[List[Driver]]:
+        """
+        Top-K variant of create_batches(rank_drivers(all_drivers)).
+        Scores the whole fleet in one NumPy pass and only orders the first two
+        batches (argpartition); the Panic Mode tail is sorted lazily, i.e. only
+        when the cascade actually asks for batch 3. Yields the same batches.
+        Accepts a List[Driver] or a driver_fleet.DriverFleet (yields DriverRow handles).
+        """
+        if hasattr(all_drivers, "available"):
+            # Columnar DriverFleet: score straight from its arrays
+            available = all_drivers.available()
+            scores = self.score_drivers(available.rating, available.location_km, available.days_in_system,
+                                        self.exposure_slots(available.fleet, available.indices))
+        else:
+            available = [d for d in all_drivers if not d.is_busy]
+            n = len(available)
+            scores = self.score_drivers(
+                np.fromiter((d.rating for d in available), dtype=np.float64, count=n),
+                np.fromiter((d.location_km for d in available), dtype=np.float64, count=n),
+                np.fromiter((d.days_in_system for d in available), dtype=np.int64, count=n),
+                None if self.exposure is None else self.exposure.lookup(d.id for d in available),
+            )
+        for positions in self.iter_ranked_batches(scores):
+            yield [available[i] for i in positions]
+
+    def iter_fleet_batches(self, fleet) -> Iterator[np.ndarray]:
+        """
+        iter_batches for a DriverFleet (or a FleetView), yielding fleet row indices
+        instead of DriverRow handles (no per-driver objects, even for the Panic Mode tail).
+        """
+        available = fleet.available()
+        scores = self.score_drivers(available.rating, available.location_km, available.days_in_system,
+                                    self.exposure_slots(available.fleet, available.indices))
+        for positions in self.iter_ranked_batches(scores):
+            yield available.indices[positions]
+
+    def iter_ranked_batches(self, scores: np.ndarray) -> Iterator[np.ndarray]:
+        """
+        Cascade batches as position arrays into `scores`, best first.
+        Only the first two batches are selected with argpartition; the tail is
+        sorted when (and if) the caller asks for batch 3.
+        """
+        n = len(scores)
+        head_size = self.batch_size * 2
+        head = top_k_order(scores, head_size)
+
+        # Batch 1 + Batch 2
+        yield head[:self.batch_size]
+        if n > self.batch_size:
+            yield head[self.batch_size:]
+
+        # Batch 3 (All remaining), ranked only on demand
+        if n > head_size:
+            tail_mask = np.ones(n, dtype=bool)
+            tail_mask[head] = False
+            tail = np.flatnonzero(tail_mask)
+            yield tail[np.lexsort((tail, -scores[tail]))]
@@ -0,0 +1,306 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+
+from .dispatch_engine import Driver
+
+def _fit_text(column: np.ndarray, value: str) -> np.ndarray:
+    """Widens a fixed-width text column when a longer value arrives."""
+    if len(value) > column.dtype.itemsize // 4:
+        return column.astype(f"U{len(value)}")
+    return column
+
+# Column names, in storage order
+COLUMNS = ("ids", "names", "rating", "location_km", "days_in_system", "is_busy", "x_km", "y_km")
+
+class DriverRow:
+    """
+    Lightweight Driver-like handle onto one row of a DriverFleet.
+    Exposes the same attributes as Driver, so rank_drivers / create_batches
+    and the simulation printers accept it unchanged. Writes go to the fleet.
+    Rows from a FleetView with its own distances carry their location_km
+    locally instead of reading (or writing) the shared column.
+    """
+    __slots__ = ("_fleet", "_index", "_location_km")
+
+    def __init__(self, fleet: "DriverFleet", index: int, location_km: Optional[float] = None):
+        self._fleet = fleet
+        self._index = index
+        self._location_km = location_km
+
+    @property
+    def id(self) -> str:
+        return str(self._fleet.ids[self._index])
+
+    @property
+    def name(self) -> str:
+        return str(self._fleet.names[self._index])
+
+    @property
+    def rating(self) -> float:
+        return float(self._fleet.rating[self._index])
+
+    @rating.setter
+    def rating(self, value: float):
+        self._fleet.rating[self._index] = value
+
+    @property
+    def location_km(self) -> float:
+        if self._location_km is not None:
+            return self._location_km
+        return float(self._fleet.location_km[self._index])
+
+    @location_km.setter
+    def location_km(self, value: float):
+        if self._location_km is not None:
+            self._location_km = float(value)
+        else:
+            self._fleet.location_km[self._index] = value
+
+    @property
+    def days_in_system(self) -> int:
+        return int(self._fleet.days_in_system[self._index])
+
+    @days_in_system.setter
+    def days_in_system(self, value: int):
+        self._fleet.days_in_system[self._index] = value
+
+    @property
+    def is_busy(self) -> bool:
+        return bool(self._fleet.is_busy[self._index])
+
+    @is_busy.setter
+    def is_busy(self, value: bool):
+        self._fleet.is_busy[self._index] = value
+
+    @property
+    def position_km(self) -> Optional[Tuple[float, float]]:
+        x = float(self._fleet.x_km[self._index])
+        if np.isnan(x):
+            return None
+        return (x, float(self._fleet.y_km[self._index]))
+
+    def to_driver(self) -> Driver:
+        return Driver(self.id, self.name, self.rating, self.location_km, self.days_in_system, self.is_busy,
+                      self.position_km)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, DriverRow):
+            return self._fleet is other._fleet and self._index == other._index
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._fleet), self._index))
+
+    def __repr__(self) -> str:
+        return (f"DriverRow(id={self.id!r}, name={self.name!r}, rating={self.rating}, "
+                f"location_km={self.location_km}, days_in_system={self.days_in_system}, is_busy={self.is_busy})")
+
+class FleetView:
+    """
+    Filtered view of a DriverFleet: a row-index array into the parent columns.
+    Creating one costs a single index array; columns are gathered on access.
+    location_km: optional per-row distances owned by the view (e.g. from one
+    order's origin), used instead of the fleet's shared location_km column.
+    """
+
+    def __init__(self, fleet: "DriverFleet", indices: np.ndarray, location_km: Optional[np.ndarray] = None):
+        self.fleet = fleet
+        self.indices = indices
+        self._location_km = location_km
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __iter__(self) -> Iterator[DriverRow]:
+        return (self[position] for position in range(len(self.indices)))
+
+    def __getitem__(self, position: int) -> DriverRow:
+        if self._location_km is None:
+            return DriverRow(self.fleet, int(self.indices[position]))
+        return DriverRow(self.fleet, int(self.indices[position]), float(self._location_km[position]))
+
+    @property
+    def rating(self) -> np.ndarray:
+        return self.fleet.rating[self.indices]
+
+    @property
+    def location_km(self) -> np.ndarray:
+        if self._location_km is not None:
+            return self._location_km
+        return self.fleet.location_km[self.indices]
+
+    @property
+    def days_in_system(self) -> np.ndarray:
+        return self.fleet.days_in_system[self.indices]
+
+    @property
+    def is_busy(self) -> np.ndarray:
+        return self.fleet.is_busy[self.indices]
+
+    def available(self) -> "FleetView":
+        free = ~self.is_busy
+        location_km = None if self._location_km is None else self._location_km[free]
+        return FleetView(self.fleet, self.indices[free], location_km)
+
+class DriverFleet:
+    """
+    Columnar (struct-of-arrays) driver store.
+    One contiguous typed array per Driver field, an id -> row map for O(1)
+    busy/free toggling, and DriverRow handles for code that expects Driver objects.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._size = 0
+        self._index_of: Optional[Dict[str, int]] = {}  # None for from_columns fleets until the first lookup (see _index)
+        self._ids = np.zeros(capacity, dtype="U8")
+        self._names = np.zeros(capacity, dtype="U16")
+        self._rating = np.zeros(capacity, dtype=np.float64)
+        self._location_km = np.zeros(capacity, dtype=np.float64)
+        self._days_in_system = np.zeros(capacity, dtype=np.int32)
+        self._is_busy = np.zeros(capacity, dtype=bool)
+        # Metro-grid coordinates; NaN when the driver has no known position
+        self._x_km = np.full(capacity, np.nan)
+        self._y_km = np.full(capacity, np.nan)
+
+    @classmethod
+    def from_drivers(cls, drivers: Iterable[Driver]) -> "DriverFleet":
+        drivers = list(drivers)
+        fleet = cls(capacity=max(len(drivers), 1))
+        n = len(drivers)
+        fleet._ids = np.array([d.id for d in drivers] or [""], dtype=str)
+        fleet._names = np.array([d.name for d in drivers] or [""], dtype=str)
+        fleet._rating[:n] = [d.rating for d in drivers]
+        fleet._location_km[:n] = [d.location_km for d in drivers]
+        fleet._days_in_system[:n] = [d.days_in_system for d in drivers]
+        fleet._is_busy[:n] = [d.is_busy for d in drivers]
+        positions = [d.position_km or (np.nan, np.nan) for d in drivers]
+        fleet._x_km[:n] = [p[0] for p in positions]
+        fleet._y_km[:n] = [p[1] for p in positions]
+        fleet._index_of = {d.id: i for i, d in enumerate(drivers)}
+        if len(fleet._index_of) != n:
+            raise ValueError("Driver ids must be unique.")
+        fleet._size = n
+        return fleet
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray]) -> "DriverFleet":
+        """
+        Fleet over existing column arrays (ids, names, rating, location_km,
+        days_in_system, is_busy, x_km, y_km), used as-is without copying.
+        The id -> row map is built on the first id lookup.
+        """
+        fleet = cls(capacity=1)
+        for name in COLUMNS:
+            setattr(fleet, "_" + name, columns[name])
+        fleet._size = len(columns["ids"])
+        fleet._index_of = None
+        return fleet
+
+    # --- Columns (views trimmed to the live rows) ---
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids[:self._size]
+
+    @property
+    def names(self) -> np.ndarray:
+        return self._names[:self._size]
+
+    @property
+    def rating(self) -> np.ndarray:
+        return self._rating[:self._size]
+
+    @property
+    def location_km(self) -> np.ndarray:
+        return self._location_km[:self._size]
+
+    @property
+    def days_in_system(self) -> np.ndarray:
+        return self._days_in_system[:self._size]
+
+    @property
+    def is_busy(self) -> np.ndarray:
+        return self._is_busy[:self._size]
+
+    @property
+    def x_km(self) -> np.ndarray:
+        return self._x_km[:self._size]
+
+    @property
+    def y_km(self) -> np.ndarray:
+        return self._y_km[:self._size]
+
+    # --- Mutation ---
+    def add(self, driver: Driver) -> DriverRow:
+        if driver.id in self._index():
+            raise ValueError(f"Driver {driver.id} already in fleet.")
+        if self._size == len(self._rating):
+            self._grow(max(2 * self._size, 1))
+        i = self._size
+        self._ids = _fit_text(self._ids, driver.id)
+        self._names = _fit_text(self._names, driver.name)
+        self._ids[i] = driver.id
+        self._names[i] = driver.name
+        self._rating[i] = driver.rating
+        self._location_km[i] = driver.location_km
+        self._days_in_system[i] = driver.days_in_system
+        self._is_busy[i] = driver.is_busy
+        self._x_km[i], self._y_km[i] = driver.position_km or (np.nan, np.nan)
+        self._index()[driver.id] = i
+        self._size += 1
+        return DriverRow(self, i)
+
+    def _grow(self, capacity: int):
+        for attr in ("_" + name for name in COLUMNS):
+            old = getattr(self, attr)
+            new = np.full(capacity, np.nan) if attr in ("_x_km", "_y_km") else np.zeros(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, attr, new)
+
+    def _index(self) -> Dict[str, int]:
+        """id -> row map; fleets loaded from a snapshot build it on first lookup."""
+        if self._index_of is None:
+            self._index_of = {driver_id: i for i, driver_id in enumerate(self.ids.tolist())}
+        return self._index_of
+
+    def index_of(self, driver_id: str) -> int:
+        return self._index()[driver_id]
+
+    def set_busy(self, driver_id: str, busy: bool = True):
+        """O(1) busy/free toggle by driver id."""
+        self._is_busy[self._index()[driver_id]] = busy
+
+    def set_free(self, driver_id: str):
+        self.set_busy(driver_id, False)
+
+    def set_position(self, driver_id: str, x_km: float, y_km: float):
+        i = self._index()[driver_id]
+        self._x_km[i] = x_km
+        self._y_km[i] = y_km
+
+    # --- Access ---
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[DriverRow]:
+        return (DriverRow(self, i) for i in range(self._size))
+
+    def __getitem__(self, index: int) -> DriverRow:
+        if not -self._size <= index < self._size:
+            raise IndexError("fleet index out of range")
+        return DriverRow(self, index % self._size)
+
+    def row(self, driver_id: str) -> DriverRow:
+        return DriverRow(self, self._index()[driver_id])
+
+    def view(self, mask_or_indices, location_km: Optional[np.ndarray] = None) -> FleetView:
+        """View of some rows, optionally with its own location_km per selected row."""
+        selector = np.asarray(mask_or_indices)
+        indices = np.flatnonzero(selector) if selector.dtype == bool else selector.astype(np.intp)
+        return FleetView(self, indices, location_km)
+
+    def available(self) -> FleetView:
+        """View of the drivers that are not busy."""
+        return FleetView(self, np.flatnonzero(~self.is_busy))
+
+    def to_drivers(self) -> List[Driver]:
+        return [row.to_driver() for row in self]
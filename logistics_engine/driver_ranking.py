@@ -0,0 +1,177 @@
+from typing import Dict, Iterable, Iterator, List, Optional
+import heapq
+
+from .dispatch_engine import DispatchEngine
+
+class DriverRanking:
+    """
+    Persistent ranking of the available drivers as an indexed binary heap.
+
+    Keys are (-score, seq), where score is DispatchEngine._calculate_score and
+    seq is the registration order, so the order matches rank_drivers' stable
+    descending sort over the registered list. Every delta (busy/free, rating,
+    location, cold-start expiry) re-scores one driver and sifts it in O(log n);
+    top_k walks the heap in O(k log k) without touching the rest.
+
+    Works on Driver objects or DriverRow handles; updates write through to them.
+    """
+
+    def __init__(self, dispatcher: Optional[DispatchEngine] = None):
+        self.dispatcher = dispatcher or DispatchEngine()
+        self._drivers: Dict[str, object] = {}
+        self._seq: Dict[str, int] = {}
+        self._key: Dict[str, tuple] = {}
+        self._slot: Dict[str, int] = {}   # id -> position in _heap, only for available drivers
+        self._heap: List[str] = []
+        self._next_seq = 0
+
+    @classmethod
+    def from_drivers(cls, drivers: Iterable, dispatcher: Optional[DispatchEngine] = None) -> "DriverRanking":
+        """Registers a List[Driver] or a DriverFleet (as DriverRow handles), in order."""
+        ranking = cls(dispatcher)
+        for driver in drivers:
+            ranking.add(driver)
+        return ranking
+
+    def __len__(self) -> int:
+        """Number of available (ranked) drivers."""
+        return len(self._heap)
+
+    def __contains__(self, driver_id: str) -> bool:
+        return driver_id in self._drivers
+
+    def score(self, driver_id: str) -> float:
+        return -self._key[driver_id][0]
+
+    # --- Heap primitives ---
+    def _swap(self, i: int, j: int):
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._slot[heap[i]] = i
+        self._slot[heap[j]] = j
+
+    def _sift_up(self, i: int):
+        heap, key = self._heap, self._key
+        while i:
+            parent = (i - 1) >> 1
+            if key[heap[i]] >= key[heap[parent]]:
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i: int):
+        heap, key = self._heap, self._key
+        n = len(heap)
+        while True:
+            best = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n and key[heap[child]] < key[heap[best]]:
+                    best = child
+            if best == i:
+                return
+            self._swap(i, best)
+            i = best
+
+    def _push(self, driver_id: str):
+        self._slot[driver_id] = len(self._heap)
+        self._heap.append(driver_id)
+        self._sift_up(len(self._heap) - 1)
+
+    def _pop_slot(self, driver_id: str):
+        i = self._slot.pop(driver_id)
+        last = self._heap.pop()
+        if last != driver_id:
+            self._heap[i] = last
+            self._slot[last] = i
+            self._sift_up(i)
+            self._sift_down(self._slot[last])
+
+    def _rescore(self, driver_id: str):
+        old = self._key[driver_id]
+        new = (-self.dispatcher._calculate_score(self._drivers[driver_id]), old[1])
+        if new == old:
+            return  # e.g. days_in_system ticked without crossing the cold-start threshold
+        self._key[driver_id] = new
+        if driver_id in self._slot:
+            i = self._slot[driver_id]
+            self._sift_up(i)
+            self._sift_down(self._slot[driver_id])
+
+    # --- Deltas ---
+    def add(self, driver):
+        if driver.id in self._drivers:
+            raise ValueError(f"Driver {driver.id} already ranked.")
+        self._drivers[driver.id] = driver
+        self._seq[driver.id] = self._next_seq
+        self._next_seq += 1
+        self._key[driver.id] = (-self.dispatcher._calculate_score(driver), self._seq[driver.id])
+        if not driver.is_busy:
+            self._push(driver.id)
+
+    def remove(self, driver_id: str):
+        if driver_id in self._slot:
+            self._pop_slot(driver_id)
+        del self._drivers[driver_id], self._seq[driver_id], self._key[driver_id]
+
+    def set_busy(self, driver_id: str, busy: bool = True):
+        self._drivers[driver_id].is_busy = busy
+        if busy and driver_id in self._slot:
+            self._pop_slot(driver_id)
+        elif not busy and driver_id not in self._slot:
+            self._push(driver_id)
+
+    def set_free(self, driver_id: str):
+        self.set_busy(driver_id, False)
+
+    def update(self, driver_id: str, rating: Optional[float] = None, location_km: Optional[float] = None,
+               days_in_system: Optional[int] = None):
+        """
+        Writes the changed fields to the driver and moves it to its new rank.
+        With no fields it only re-scores, e.g. after offers to the driver were
+        recorded in the dispatcher's exposure ledger.
+        """
+        driver = self._drivers[driver_id]
+        if rating is not None:
+            driver.rating = rating
+        if location_km is not None:
+            driver.location_km = location_km
+        if days_in_system is not None:
+            driver.days_in_system = days_in_system
+        self._rescore(driver_id)
+
+    def rebuild(self):
+        """Re-scores everyone, e.g. after changing the dispatcher's weights. O(n)."""
+        for driver_id, driver in self._drivers.items():
+            self._key[driver_id] = (-self.dispatcher._calculate_score(driver), self._seq[driver_id])
+        self._heap.sort(key=self._key.__getitem__)  # a sorted array is a valid heap
+        self._slot = {driver_id: i for i, driver_id in enumerate(self._heap)}
+
+    # --- Queries ---
+    def top_k(self, k: int) -> List:
+        """The k best available drivers, best first (== rank_drivers(...)[:k])."""
+        heap, key = self._heap, self._key
+        n = len(heap)
+        result = []
+        frontier = [(key[heap[0]], 0)] if n else []
+        while frontier and len(result) < k:
+            _, i = heapq.heappop(frontier)
+            result.append(self._drivers[heap[i]])
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n:
+                    heapq.heappush(frontier, (key[heap[child]], child))
+        return result
+
+    def iter_batches(self) -> Iterator[List]:
+        """
+        Cascade batches from the live ranking (same batches as
+        create_batches(rank_drivers(...))). The first two come from top_k;
+        the Panic Mode tail is sorted only if the cascade gets there.
+        """
+        batch_size = self.dispatcher.batch_size
+        head = self.top_k(2 * batch_size)
+        yield head[:batch_size]
+        if len(self._heap) > batch_size:
+            yield head[batch_size:]
+        if len(self._heap) > 2 * batch_size:
+            ranked = sorted(self._heap, key=self._key.__getitem__)
+            yield [self._drivers[driver_id] for driver_id in ranked[2 * batch_size:]]
@@ -0,0 +1,225 @@
+from typing import Dict, Iterable, Optional
+import argparse
+
+import numpy as np
+
+class ExposureLedger:
+    """
+    Offers received per driver over a sliding time window.
+
+    Counts live in a ring buffer of `buckets` time buckets per driver slot
+    (buckets x capacity uint32, so a bucket cannot wrap) plus running window
+    and all-time totals per slot (int64). Recording an offer is O(1) per
+    driver, and memory stays fixed at (4 * buckets + 16) bytes per driver,
+    e.g. ~6.4 MB for 100k drivers with 12 buckets. When a bucket ages out, one
+    vectorized subtraction removes it from the window totals.
+
+    Slots are dense integers: slots() maps driver ids to them, registering
+    new ids (recording offers), while lookup() and fleet_slots() only read
+    the map, so scoring a driver the ledger has never seen (slot -1, zero
+    offers) leaves it untouched. for_fleet registers a DriverFleet's ids in
+    row order.
+
+    The ledger also defines the cold-start boost that replaces the flat
+    new_driver_bonus in DispatchEngine (see boost_factor): it fades with
+    tenure and shrinks to zero once a driver has had offer_budget offers in
+    the window. offer_budget=None and half_life_days=None give the flat bonus,
+    i.e. tracking only.
+    """
+
+    def __init__(self, capacity: int = 1024, window_s: float = 3600.0, buckets: int = 12,
+                 offer_budget: Optional[int] = 10, half_life_days: Optional[float] = 3.0,
+                 cold_start_days: int = 7):
+        if buckets < 1 or window_s <= 0:
+            raise ValueError("window_s and buckets must be positive.")
+        if offer_budget is not None and offer_budget < 1:
+            raise ValueError("offer_budget must be at least 1 (or None for no rate limit).")
+        self.window_s = window_s
+        self.bucket_s = window_s / buckets
+        self.offer_budget = offer_budget
+        self.half_life_days = half_life_days
+        self.cold_start_days = cold_start_days
+        self._counts = np.zeros((buckets, capacity), dtype=np.uint32)
+        self._window = np.zeros(capacity, dtype=np.int64)     # sum of _counts over the buckets
+        self._total = np.zeros(capacity, dtype=np.int64)      # offers since the ledger started
+        self._slot: Dict[str, int] = {}
+        self._size = 0
+        self._bucket = 0              # ring position of the current bucket
+        self._bucket_end = self.bucket_s
+        self._fleet_slots = None      # (fleet, rows, registered ids, row -> slot) for fleet_slots
+
+    @classmethod
+    def for_fleet(cls, fleet, **kwargs) -> "ExposureLedger":
+        """Ledger whose slots are the fleet's row indices."""
+        ledger = cls(capacity=max(len(fleet), 1), **kwargs)
+        ledger.slots(fleet.ids.tolist())
+        return ledger
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        return self._counts.nbytes + self._window.nbytes + self._total.nbytes
+
+    def _grow(self, capacity: int):
+        counts = np.zeros((self._counts.shape[0], capacity), dtype=self._counts.dtype)
+        counts[:, :self._size] = self._counts[:, :self._size]
+        self._counts = counts
+        for name in ("_window", "_total"):
+            column = np.zeros(capacity, dtype=np.int64)
+            column[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, column)
+
+    def slot(self, driver_id: str) -> int:
+        """Slot of a driver id, registering it on first sight."""
+        slot = self._slot.get(driver_id)
+        if slot is None:
+            if self._size == self._window.size:
+                self._grow(2 * self._window.size)
+            slot = self._slot[driver_id] = self._size
+            self._size += 1
+        return slot
+
+    def slots(self, driver_ids: Iterable[str]) -> np.ndarray:
+        return np.array([self.slot(driver_id) for driver_id in driver_ids], dtype=np.intp)
+
+    def lookup(self, driver_ids: Iterable[str]) -> np.ndarray:
+        """Slots of driver ids without registering them: -1 for ids the ledger has not seen."""
+        get = self._slot.get
+        return np.fromiter((get(driver_id, -1) for driver_id in driver_ids), dtype=np.intp)
+
+    def fleet_slots(self, fleet) -> np.ndarray:
+        """
+        Slot per row of a DriverFleet (-1 for unregistered drivers), via lookup.
+        Cached until the fleet gains rows or the ledger registers new ids.
+        """
+        cached = self._fleet_slots
+        if cached is None or cached[0] is not fleet or cached[1] != len(fleet) or cached[2] != self._size:
+            cached = self._fleet_slots = (fleet, len(fleet), self._size, self.lookup(fleet.ids.tolist()))
+        return cached[3]
+
+    # --- Window ---
+    def advance(self, now_s: float):
+        """Moves the window to now_s, expiring the buckets that fell out of it."""
+        if now_s < self._bucket_end:
+            return
+        n, n_buckets = self._size, self._counts.shape[0]
+        steps = int((now_s - self._bucket_end) // self.bucket_s) + 1
+        for _ in range(min(steps, n_buckets)):
+            self._bucket = (self._bucket + 1) % n_buckets
+            self._window[:n] -= self._counts[self._bucket, :n]
+            self._counts[self._bucket, :n] = 0
+        self._bucket_end += steps * self.bucket_s
+
+    def record(self, slots: np.ndarray, now_s: float):
+        """One offer per entry of slots (e.g. a cascade batch of fleet rows) at time now_s; repeated slots count each time."""
+        self.advance(now_s)
+        # add.at, not fancy-index +=, so a slot listed twice gets both offers in every counter
+        np.add.at(self._counts[self._bucket], slots, 1)
+        np.add.at(self._window, slots, 1)
+        np.add.at(self._total, slots, 1)
+
+    def record_offer(self, driver_id: str, now_s: float):
+        self.record(np.array([self.slot(driver_id)]), now_s)
+
+    def offers(self, slots=None) -> np.ndarray:
+        """Offers in the current window, for the given slots (default: all)."""
+        return self._window[:self._size] if slots is None else self._window[slots]
+
+    def total_offers(self, slots=None) -> np.ndarray:
+        return self._total[:self._size] if slots is None else self._total[slots]
+
+    # --- Boost ---
+    def boost_factor(self, days_in_system, slots) -> np.ndarray:
+        """
+        Share of DispatchEngine.new_driver_bonus each driver gets, in [0, 1]:
+            0.5 ** (days / half_life_days) * max(0, 1 - window_offers / offer_budget)
+        for drivers under cold_start_days, 0 otherwise. slots has the shape of days_in_system.
+        Only the (few) cold-start drivers are evaluated; slot -1 (unregistered) means no offers yet.
+        """
+        days = np.asarray(days_in_system)
+        new = days < self.cold_start_days
+        factor = new.astype(np.float64)
+        if self.half_life_days is None and self.offer_budget is None:
+            return factor
+        new_factor = factor[new]
+        if self.half_life_days is not None:
+            new_factor = 0.5 ** (days[new] / self.half_life_days)
+        if self.offer_budget is not None:
+            new_slots = np.asarray(slots)[new]
+            offers = np.where(new_slots >= 0, self._window[new_slots], 0)
+            new_factor = new_factor * np.maximum(0.0, 1.0 - offers / self.offer_budget)
+        factor[new] = new_factor
+        return factor
+
+    def driver_boost_factor(self, driver_id: str, days_in_system: int) -> float:
+        """Scalar boost_factor for one driver (unregistered drivers have had no offers)."""
+        if days_in_system >= self.cold_start_days:
+            return 0.0
+        factor = 1.0
+        if self.half_life_days is not None:
+            factor = 0.5 ** (days_in_system / self.half_life_days)
+        slot = self._slot.get(driver_id)
+        if self.offer_budget is not None and slot is not None:
+            factor *= max(0.0, 1.0 - int(self._window[slot]) / self.offer_budget)
+        return factor
+
+    # --- Fairness metrics ---
+    def fairness(self, days_in_system: Optional[np.ndarray] = None, window: bool = False) -> Dict[str, float]:
+        """
+        How evenly offers are spread over the registered drivers (all offers
+        since the start, or only the current window). days_in_system (per slot)
+        adds the new vs established split.
+        """
+        offers = (self._window if window else self._total)[:self._size].astype(np.float64)
+        n = offers.size
+        total = offers.sum()
+        result = {"drivers": n, "offers": int(total)}
+        if not n or not total:
+            return {**result, "gini": 0.0, "coverage": 0.0, "top_1pct_share": 0.0, "max_offers": 0}
+        ranked = np.sort(offers)
+        result["gini"] = float(2.0 * np.dot(np.arange(1, n + 1), ranked) / (n * total) - (n + 1) / n)
+        result["coverage"] = float(np.count_nonzero(offers) / n)
+        result["top_1pct_share"] = float(ranked[-max(1, n // 100):].sum() / total)
+        result["max_offers"] = int(ranked[-1])
+        if days_in_system is not None:
+            new = np.asarray(days_in_system)[:n] < self.cold_start_days
+            result["new_mean_offers"] = float(offers[new].mean()) if new.any() else 0.0
+            result["established_mean_offers"] = float(offers[~new].mean()) if (~new).any() else 0.0
+        return result
+
+def format_fairness(metrics: Dict[str, float]) -> str:
+    lines = [
+        f"Drivers: {metrics['drivers']:,}  Offers: {metrics['offers']:,}",
+        f"Gini: {metrics['gini']:.3f}  Coverage: {metrics['coverage']:.1%}  "
+        f"Top 1% share: {metrics['top_1pct_share']:.1%}  Max offers: {metrics['max_offers']:,}",
+    ]
+    if "new_mean_offers" in metrics:
+        lines.append(f"Mean offers: new drivers {metrics['new_mean_offers']:.1f}, "
+                     f"established {metrics['established_mean_offers']:.1f}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    from .market_simulator import MarketConfig, MarketSimulator, format_report, synthetic_fleet
+    from .dispatch_engine import DispatchEngine
+
+    parser = argparse.ArgumentParser(description="Market day with exposure tracking and a rate-limited cold-start boost")
+    parser.add_argument("--drivers", type=int, default=10_000)
+    parser.add_argument("--hours", type=float, default=4.0)
+    parser.add_argument("--rate", type=float, default=0.25)
+    parser.add_argument("--budget", type=int, default=10, help="Boosted offers per window (0 = flat bonus)")
+    parser.add_argument("--window-min", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    fleet = synthetic_fleet(args.drivers, args.seed)
+    flat = args.budget == 0
+    dispatcher = DispatchEngine()
+    dispatcher.exposure = ExposureLedger.for_fleet(fleet, window_s=args.window_min * 60.0,
+                                                   offer_budget=None if flat else args.budget,
+                                                   half_life_days=None if flat else 3.0)
+    config = MarketConfig(n_drivers=args.drivers, duration_s=args.hours * 3600.0,
+                          order_rate_per_s=args.rate, seed=args.seed)
+    print(format_report(MarketSimulator(config, fleet=fleet, dispatcher=dispatcher).run()))
+    print(format_fairness(dispatcher.exposure.fairness(fleet.days_in_system)))
@@ -0,0 +1,27 @@
+from types import ModuleType
+import importlib
+
+class LazyModule(ModuleType):
+    """
+    Stand-in for a heavy module (NumPy, matplotlib) that imports it on first
+    attribute access. After loading, the real module's namespace is copied in,
+    so later lookups are plain attribute reads with no extra indirection.
+
+        np = LazyModule("numpy")   # nothing imported yet
+        np.zeros(3)                # imports numpy here
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_loaded"] = False
+
+    def _load(self) -> ModuleType:
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        self.__dict__["_lazy_loaded"] = True
+        return module
+
+    def __getattr__(self, attr: str):
+        # Only reached for names not copied in yet (everything, before the first load)
+        return getattr(self._load() if not self.__dict__["_lazy_loaded"] else
+                       importlib.import_module(self.__name__), attr)
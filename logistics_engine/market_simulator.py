@@ -0,0 +1,252 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import argparse
+import heapq
+import time
+
+import numpy as np
+
+from .dispatch_engine import DispatchEngine, Driver
+from .driver_fleet import DriverFleet
+from .pricing_engine import PricingEngine, MoveRequest, VehicleType
+from .cost_model import LogisticPricingModel
+
+# Event kinds (ordered so simultaneous releases free drivers before new work is dispatched)
+RELEASE, ACCEPT, EXPIRE, ARRIVAL = range(4)
+
+@dataclass
+class MarketConfig:
+    """Parameters of a simulated market day."""
+    n_drivers: int = 10_000
+    duration_s: float = 24 * 3600.0
+    order_rate_per_s: float = 0.25       # Poisson arrival rate (~21.6k orders/day)
+    batch_timeout_s: float = 10.0        # A batch expires after 10 s without acceptance
+    driver_cost_share: float = 0.85      # Driver's own cost as a share of the attempt-1 price
+    mean_job_minutes: float = 90.0       # Mean time a driver stays busy after accepting
+    mean_distance_km: float = 15.0
+    bad_weather_share: float = 0.2
+    seed: int = 0
+
+@dataclass
+class MarketReport:
+    """Outcome of one simulated run."""
+    orders: int
+    accepted: int
+    unfilled: int
+    time_to_accept_s: np.ndarray
+    accepted_attempt: np.ndarray
+    accepted_price: np.ndarray
+    wall_time_s: float = 0.0
+    events: int = 0
+
+    def summary(self) -> Dict[str, float]:
+        tta = self.time_to_accept_s
+        result = {
+            "orders": self.orders,
+            "accepted": self.accepted,
+            "unfilled": self.unfilled,
+            "acceptance_rate": self.accepted / self.orders if self.orders else 0.0,
+            "mean_price": float(self.accepted_price.mean()) if self.accepted else 0.0,
+            "wall_time_s": self.wall_time_s,
+            "events": self.events,
+        }
+        for q in (50, 90, 99):
+            result[f"tta_p{q}_s"] = float(np.percentile(tta, q)) if tta.size else float("nan")
+        for attempt in (1, 2, 3):
+            result[f"accepted_attempt_{attempt}"] = int(np.count_nonzero(self.accepted_attempt == attempt))
+        return result
+
+    def histogram(self, bin_s: float = 5.0) -> List[tuple]:
+        """Time-to-acceptance distribution as (bin_start_s, count) pairs."""
+        if not self.time_to_accept_s.size:
+            return []
+        edges = np.arange(0.0, self.time_to_accept_s.max() + bin_s, bin_s)
+        counts, edges = np.histogram(self.time_to_accept_s, bins=edges)
+        return list(zip(edges[:-1].tolist(), counts.tolist()))
+
+@dataclass
+class _OrderState:
+    order: MoveRequest
+    arrived_at: float
+    cascade: object                      # iterator of fleet-row batches (DispatchEngine.iter_fleet_batches)
+    attempt: int = 0
+    price: float = 0.0
+    offered_at: float = 0.0              # when the current batch went out
+    batch: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.intp))
+    done: bool = False
+
+def synthetic_fleet(n: int, seed: int = 0) -> DriverFleet:
+    """Random city fleet: ratings 3-5, exponential distance to demand, mixed tenure."""
+    rng = np.random.default_rng(seed)
+    ratings = np.round(rng.uniform(3.0, 5.0, n), 1)
+    locations = np.round(rng.exponential(6.0, n), 2)
+    days = rng.integers(0, 400, n)
+    return DriverFleet.from_drivers(
+        Driver(f"D{i}", f"Driver {i}", float(r), float(l), int(d))
+        for i, (r, l, d) in enumerate(zip(ratings, locations, days))
+    )
+
+class MarketSimulator:
+    """
+    Discrete-event market simulation on a priority-queue clock (virtual time).
+
+    Orders arrive as a Poisson process and run the cascading dispatch from
+    DispatchEngine: each batch is offered at PricingEngine.calculate_price for
+    its attempt, every driver in it accepts with the logistic probability from
+    LogisticPricingModel.estimate_acceptance_probability, and the batch expires
+    after batch_timeout_s. Accepting drivers are busy until their job ends.
+    When the dispatcher has an exposure ledger, the ranked batches offered
+    are recorded in it (by driver id, so drivers added later are registered).
+    """
+
+    def __init__(self, config: Optional[MarketConfig] = None, fleet: Optional[DriverFleet] = None,
+                 dispatcher: Optional[DispatchEngine] = None, pricer: Optional[PricingEngine] = None,
+                 acceptance_model: Optional[LogisticPricingModel] = None):
+        self.config = config or MarketConfig()
+        self.rng = np.random.default_rng(self.config.seed)
+        self.fleet = fleet if fleet is not None else synthetic_fleet(self.config.n_drivers, self.config.seed)
+        self.dispatcher = dispatcher or DispatchEngine()
+        self.pricer = pricer or PricingEngine()
+        self.acceptance_model = acceptance_model or LogisticPricingModel()
+        self._events = []
+        self._seq = 0
+
+    def _schedule(self, at: float, kind: int, payload):
+        self._seq += 1
+        heapq.heappush(self._events, (at, kind, self._seq, payload))
+
+    def _random_order(self) -> MoveRequest:
+        cfg = self.config
+        vehicles = list(VehicleType)
+        return MoveRequest(
+            distance_km=round(float(self.rng.exponential(cfg.mean_distance_km)) + 0.5, 1),
+            vehicle_type=vehicles[int(self.rng.integers(len(vehicles)))],
+            is_bad_weather=bool(self.rng.random() < cfg.bad_weather_share),
+        )
+
+    def acceptance_probability(self, order: MoveRequest, price: float) -> float:
+        """Per-driver acceptance chance for an offer: sigmoid of the driver's margin."""
+        driver_cost = self.config.driver_cost_share * self.pricer.calculate_price(order, attempt_number=1)
+        return self.acceptance_model.estimate_acceptance_probability(price - driver_cost)
+
+    def run(self) -> MarketReport:
+        cfg = self.config
+        started = time.perf_counter()
+        is_busy = self.fleet.is_busy
+        tta, attempts, prices = [], [], []
+        orders = unfilled = events = 0
+
+        self._schedule(self.rng.exponential(1.0 / cfg.order_rate_per_s), ARRIVAL, None)
+        while self._events:
+            now, kind, _, payload = heapq.heappop(self._events)
+            events += 1
+
+            if kind == ARRIVAL:
+                if now > cfg.duration_s:
+                    continue  # stop generating demand; in-flight cascades still finish
+                orders += 1
+                state = _OrderState(self._random_order(), now, self.dispatcher.iter_fleet_batches(self.fleet))
+                self._offer_next_batch(state, now)
+                self._schedule(now + self.rng.exponential(1.0 / cfg.order_rate_per_s), ARRIVAL, None)
+
+            elif kind == ACCEPT:
+                state = payload
+                if state.done:
+                    continue
+                free = state.batch[~is_busy[state.batch]]
+                if not free.size:
+                    # The accepting driver was taken by another order meanwhile: the batch runs to its timeout
+                    self._schedule(state.offered_at + cfg.batch_timeout_s, EXPIRE, state)
+                    continue
+                winner = int(free[self.rng.integers(free.size)])
+                is_busy[winner] = True
+                state.done = True
+                tta.append(now - state.arrived_at)
+                attempts.append(state.attempt)
+                prices.append(state.price)
+                job_s = self.rng.exponential(cfg.mean_job_minutes * 60.0)
+                self._schedule(now + job_s, RELEASE, winner)
+
+            elif kind == EXPIRE:
+                state = payload
+                if state.done:
+                    continue
+                if not self._offer_next_batch(state, now):
+                    state.done = True
+                    unfilled += 1
+
+            elif kind == RELEASE:
+                is_busy[payload] = False
+
+        if orders != len(tta) + unfilled:
+            raise RuntimeError(f"{orders - len(tta) - unfilled} orders ended neither accepted nor unfilled.")
+        return MarketReport(
+            orders=orders,
+            accepted=len(tta),
+            unfilled=unfilled,
+            time_to_accept_s=np.array(tta),
+            accepted_attempt=np.array(attempts, dtype=np.int64),
+            accepted_price=np.array(prices),
+            wall_time_s=time.perf_counter() - started,
+            events=events,
+        )
+
+    def _offer_next_batch(self, state: _OrderState, now: float) -> bool:
+        """Broadcasts the next batch of the cascade; False when the cascade is exhausted."""
+        cfg = self.config
+        is_busy = self.fleet.is_busy
+        exposure = self.dispatcher.exposure
+        if exposure is not None:
+            exposure.advance(now)  # before the cascade scores the fleet for a new order
+        for batch in state.cascade:
+            state.attempt += 1
+            state.offered_at = now
+            # Drivers that became busy since the order was ranked are skipped
+            state.batch = batch[~is_busy[batch]]
+            if exposure is not None and state.attempt < 3:
+                # Panic Mode reaches every free driver regardless of score, so only ranked batches count
+                exposure.record(exposure.slots(self.fleet.ids[state.batch].tolist()), now)
+            state.price = self.pricer.calculate_price(state.order, attempt_number=state.attempt)
+            p = self.acceptance_probability(state.order, state.price)
+            acceptors = int(self.rng.binomial(state.batch.size, p)) if state.batch.size else 0
+            if acceptors:
+                # Response times ~ U(0, timeout); the earliest of `acceptors` wins
+                first_response = cfg.batch_timeout_s * (1.0 - self.rng.random() ** (1.0 / acceptors))
+                self._schedule(now + first_response, ACCEPT, state)
+            else:
+                self._schedule(now + cfg.batch_timeout_s, EXPIRE, state)
+            return True
+        return False
+
+def format_report(report: MarketReport) -> str:
+    s = report.summary()
+    lines = [
+        f"Orders: {s['orders']:,}  Accepted: {s['accepted']:,} ({s['acceptance_rate']:.1%})  Unfilled: {s['unfilled']:,}",
+        f"Time to acceptance: p50={s['tta_p50_s']:.1f}s  p90={s['tta_p90_s']:.1f}s  p99={s['tta_p99_s']:.1f}s",
+        f"Accepted by attempt: 1={s['accepted_attempt_1']:,}  2={s['accepted_attempt_2']:,}  3={s['accepted_attempt_3']:,}",
+        f"Mean accepted price: ${s['mean_price']:.2f}",
+        f"Simulated {s['events']:,} events in {s['wall_time_s']:.2f}s wall time",
+        "Time-to-acceptance histogram:",
+    ]
+    hist = report.histogram()
+    peak = max((count for _, count in hist), default=1) or 1
+    for start, count in hist:
+        lines.append(f"   {start:5.0f}s {'#' * int(40 * count / peak):<40} {count}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Discrete-event simulation of a market day")
+    parser.add_argument("--drivers", type=int, default=10_000)
+    parser.add_argument("--hours", type=float, default=24.0)
+    parser.add_argument("--rate", type=float, default=0.25, help="Order arrivals per second")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fleet", type=str, help="Driver fleet snapshot (snapshot.py) instead of a synthetic fleet")
+    args = parser.parse_args()
+
+    fleet = None
+    if args.fleet:
+        from .snapshot import load_fleet
+        fleet = load_fleet(args.fleet)
+    config = MarketConfig(n_drivers=args.drivers if fleet is None else len(fleet), duration_s=args.hours * 3600.0,
+                          order_rate_per_s=args.rate, seed=args.seed)
+    print(format_report(MarketSimulator(config, fleet=fleet).run()))
@@ -0,0 +1,171 @@
+from dataclasses import dataclass
+from typing import IO, Iterator, List, Optional, Tuple
+import argparse
+import csv
+import gzip
+import itertools
+import json
+import sys
+import time
+
+import numpy as np
+
+from .dispatch_engine import DispatchEngine
+from .driver_fleet import DriverFleet
+from .pricing_engine import PricingEngine, MoveRequest, VehicleType, VEHICLE_CODES
+
+OUTPUT_FIELDS = ("id", "distance_km", "vehicle_type", "is_bad_weather", "price", "batch_1")
+
+@dataclass
+class IngestStats:
+    records: int = 0
+    chunks: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def records_per_s(self) -> float:
+        return self.records / self.elapsed_s if self.elapsed_s else 0.0
+
+def open_text(path: str, mode: str = "r") -> IO[str]:
+    """
+    Opens plain or gzip'd text by extension; '-' is stdin/stdout, opened on
+    its file descriptor with closefd=False so closing it leaves the process's stdio open.
+    """
+    if path == "-":
+        stream = sys.stdin if "r" in mode else sys.stdout
+        stream.flush()
+        return open(stream.fileno(), mode, encoding="utf-8", newline="", closefd=False)
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+def parse_move_request(record: dict) -> MoveRequest:
+    """
+    Builds a MoveRequest from one JSON record, e.g.
+    {"id": "o1", "distance_km": 12.5, "vehicle_type": "VAN", "is_bad_weather": false, "origin_km": [3.1, 4.2]}
+    """
+    origin = record.get("origin_km")
+    return MoveRequest(
+        distance_km=float(record["distance_km"]),
+        vehicle_type=VehicleType[record["vehicle_type"]],
+        is_bad_weather=bool(record.get("is_bad_weather", False)),
+        origin_km=tuple(origin) if origin is not None else None,
+    )
+
+def read_move_requests(path: str) -> Iterator[Tuple[str, MoveRequest]]:
+    """Streams (order_id, MoveRequest) pairs from JSONL, one line at a time."""
+    with open_text(path) as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                yield str(record.get("id", line_no)), parse_move_request(record)
+            except (ValueError, KeyError, TypeError) as exc:
+                raise ValueError(f"{path}:{line_no}: invalid move request ({exc})") from exc
+
+class _ResultWriter:
+    """Incremental CSV or JSONL writer (format picked from the file name)."""
+
+    def __init__(self, f: IO[str], as_csv: bool):
+        self.f = f
+        self.csv = csv.writer(f) if as_csv else None
+        if self.csv:
+            self.csv.writerow(OUTPUT_FIELDS)
+
+    def write(self, row: tuple):
+        if self.csv:
+            self.csv.writerow(row[:-1] + (" ".join(row[-1]),))
+        else:
+            self.f.write(json.dumps(dict(zip(OUTPUT_FIELDS, row))) + "\n")
+
+def process_stream(input_path: str, output_path: str, fleet: DriverFleet,
+                   chunk_size: int = 10_000, pricer: Optional[PricingEngine] = None,
+                   dispatcher: Optional[DispatchEngine] = None, index=None) -> IngestStats:
+    """
+    Prices and dispatches a JSONL order stream in fixed-size chunks.
+
+    Each chunk is priced with calculate_prices_batch and gets its first dispatch
+    batch: via nearby_drivers when the order has an origin and a spatial index
+    is given, otherwise the fleet-wide ranking (computed once per chunk).
+    Only one chunk is held in memory, so memory use does not grow with the input.
+
+    batch_1 is a ranking, not an assignment: offers and acceptances are not
+    simulated, so no driver is marked busy and orders without an origin all
+    get the same fleet-wide top batch. The fleet is left unchanged (the nearby
+    path ranks on its own per-order distances). Use market_simulator or
+    async_dispatch to replay who actually takes each order.
+    """
+    pricer = pricer or PricingEngine()
+    dispatcher = dispatcher or DispatchEngine()
+    stats = IngestStats()
+    started = time.perf_counter()
+    requests = read_move_requests(input_path)
+
+    with open_text(output_path, "w") as out:
+        writer = _ResultWriter(out, as_csv=".csv" in output_path)
+        while True:
+            chunk: List[Tuple[str, MoveRequest]] = list(itertools.islice(requests, chunk_size))
+            if not chunk:
+                break
+            orders = [order for _, order in chunk]
+            prices = pricer.calculate_prices_batch(
+                np.fromiter((o.distance_km for o in orders), dtype=np.float64, count=len(orders)),
+                np.fromiter((VEHICLE_CODES[o.vehicle_type] for o in orders), dtype=np.intp, count=len(orders)),
+                np.fromiter((o.is_bad_weather for o in orders), dtype=bool, count=len(orders)),
+            )
+            fleet_batch = None
+            for (order_id, order), price in zip(chunk, prices.tolist()):
+                if index is not None and order.origin_km is not None:
+                    nearby = dispatcher.nearby_drivers(index, fleet, order.origin_km, k=dispatcher.batch_size)
+                    batch = [str(fleet.ids[i]) for i in next(dispatcher.iter_fleet_batches(nearby))]
+                else:
+                    if fleet_batch is None:
+                        fleet_batch = [str(fleet.ids[i]) for i in next(dispatcher.iter_fleet_batches(fleet))]
+                    batch = fleet_batch
+                writer.write((order_id, order.distance_km, order.vehicle_type.name,
+                              order.is_bad_weather, price, batch))
+            stats.records += len(chunk)
+            stats.chunks += 1
+
+    stats.elapsed_s = time.perf_counter() - started
+    return stats
+
+def write_synthetic_requests(path: str, n: int, seed: int = 0, metro_km: Optional[float] = None):
+    """Writes n random move requests as JSONL (for replay tests and benchmarks)."""
+    rng = np.random.default_rng(seed)
+    vehicles = [v.name for v in VehicleType]
+    with open_text(path, "w") as f:
+        for start in range(0, n, 100_000):
+            m = min(100_000, n - start)
+            distance = np.round(rng.exponential(15.0, m) + 0.5, 1)
+            vehicle = rng.integers(len(vehicles), size=m)
+            weather = rng.random(m) < 0.2
+            origins = rng.uniform(0.0, metro_km, (m, 2)).round(3) if metro_km else None
+            for i in range(m):
+                record = {"id": f"o{start + i}", "distance_km": float(distance[i]),
+                          "vehicle_type": vehicles[vehicle[i]], "is_bad_weather": bool(weather[i])}
+                if origins is not None:
+                    record["origin_km"] = origins[i].tolist()
+                f.write(json.dumps(record) + "\n")
+
+if __name__ == "__main__":
+    from .market_simulator import synthetic_fleet
+
+    parser = argparse.ArgumentParser(description="Stream JSONL move requests through pricing and dispatch")
+    parser.add_argument("input", help="JSONL or JSONL.gz file of move requests ('-' for stdin)")
+    parser.add_argument("--output", "-o", default="-", help="Output .csv or .jsonl (optionally .gz)")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--drivers", type=int, default=1_000, help="Size of the synthetic driver fleet")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--generate", type=int, metavar="N",
+                        help="Write N synthetic requests to INPUT instead of processing it")
+    args = parser.parse_args()
+
+    if args.generate:
+        write_synthetic_requests(args.input, args.generate, args.seed)
+    else:
+        stats = process_stream(args.input, args.output, synthetic_fleet(args.drivers, args.seed), args.chunk_size)
+        print(f"Processed {stats.records:,} records in {stats.chunks} chunks, {stats.elapsed_s:.2f}s "
+              f"({stats.records_per_s:,.0f} records/s)", file=sys.stderr)
@@ -0,0 +1,238 @@
+from __future__ import annotations
+from enum import Enum
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Optional, Tuple
+
+from .lazy_import import LazyModule
+from .rounding import round_cents  # array round(x, 2), shared with cost_model
+
+np = LazyModule("numpy")  # imported by the first batch / surface call, not by calculate_price
+
+class VehicleType(Enum):
+    MINI_TRUCK = 1.0  # Base multiplier
+    VAN = 1.5
+    TRUCK = 2.2
+
+# Integer codes used by the columnar (batch) pricing path: code = position in VehicleType
+VEHICLE_CODES = {vehicle: code for code, vehicle in enumerate(VehicleType)}
+
+@dataclass
+class MoveRequest:
+    distance_km: float
+    vehicle_type: VehicleType
+    is_bad_weather: bool = False
+    origin_km: Optional[Tuple[float, float]] = None  # (x, y) pickup point in the metro grid
+    # ... other fields from previous code ...
+
+class _RateTable(dict):
+    """base_rates dict that notifies its PricingEngine whenever a rate changes."""
+
+    def __init__(self, on_change, rates):
+        super().__init__(rates)
+        self._on_change = on_change
+
+    def __reduce__(self):
+        return (_RateTable, (self._on_change, dict(self)))
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._on_change()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._on_change()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._on_change()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._on_change()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._on_change()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._on_change()
+        return value
+
+    def clear(self):
+        super().clear()
+        self._on_change()
+
+# Cascade attempts covered by the precomputed price surface (later attempts are computed directly)
+SURFACE_ATTEMPTS = 8
+
+@dataclass
+class PriceSurface:
+    """
+    Precomputed pricing factors per vehicle, weather and attempt - 1.
+
+    Every pricing path computes round((base + 2 * distance_km) * weather * surge, 2)
+    from these tables, so scalar and batch prices agree to the bit. The plain
+    float tables serve calculate_price without loading NumPy; the array forms
+    are built on first batch use.
+    """
+    rates_version: int
+    base_rate: Dict[VehicleType, float]
+    weather: Tuple[float, float]      # 1.0 or the weather multiplier
+    surge: Tuple[float, ...]          # surge_rate ** (attempt - 1), attempts 1..SURFACE_ATTEMPTS
+
+    @cached_property
+    def base(self) -> np.ndarray:
+        """(vehicles,) base rates by vehicle code."""
+        return np.array([self.base_rate[vehicle] for vehicle in VehicleType])
+
+    @cached_property
+    def weather_factor(self) -> np.ndarray:
+        return np.array(self.weather)
+
+    @cached_property
+    def surge_factor(self) -> np.ndarray:
+        return np.array(self.surge)
+
+class PricingEngine:
+    def __init__(self):
+        self.rates_version = 0  # Bumped on any change to base_rates / weather_multiplier / surge_rate
+        self._surface: Optional[PriceSurface] = None
+        self.base_rates = {
+            VehicleType.MINI_TRUCK: 30.0,
+            VehicleType.VAN: 50.0,
+            VehicleType.TRUCK: 90.0
+        }
+        self.weather_multiplier = 1.4  # 40% increase for bad weather
+        self.surge_rate = 1.15  # Price step per failed batch
+
+    def _rates_changed(self):
+        self.rates_version += 1
+        self._surface = None  # rebuilt on next use
+
+    def price_surface(self) -> PriceSurface:
+        """The precomputed factor tables for the current rates (built once per rate change)."""
+        surface = self._surface
+        if surface is None:
+            surface = self._surface = PriceSurface(
+                rates_version=self.rates_version,
+                base_rate=dict(self._base_rates),
+                weather=(1.0, self._weather_multiplier),
+                surge=tuple(self._surge_rate ** (attempt - 1) for attempt in range(1, SURFACE_ATTEMPTS + 1)),
+            )
+        return surface
+
+    @property
+    def base_rates(self) -> dict:
+        return self._base_rates
+
+    @base_rates.setter
+    def base_rates(self, rates: dict):
+        self._base_rates = _RateTable(self._rates_changed, rates)
+        self._rates_changed()
+
+    @property
+    def weather_multiplier(self) -> float:
+        return self._weather_multiplier
+
+    @weather_multiplier.setter
+    def weather_multiplier(self, value: float):
+        self._weather_multiplier = value
+        self._rates_changed()
+
+    @property
+    def surge_rate(self) -> float:
+        return self._surge_rate
+
+    @surge_rate.setter
+    def surge_rate(self, value: float):
+        self._surge_rate = value
+        self._rates_changed()
+
+    def calculate_price(self, req: MoveRequest, attempt_number: int = 1) -> float:
+        """
+        Calculates price based on vehicle, weather, and iteration attempt.
+        Factors come from price_surface(): table lookups plus a multiply-add.
+        """
+        surface = self._surface or self.price_surface()
+
+        # 1. Base Price by Vehicle
+        price = surface.base_rate[req.vehicle_type] + (req.distance_km * 2.0)
+
+        # 2. Weather Penalty (x 1.0 for good weather is exact)
+        price *= surface.weather[1 if req.is_bad_weather else 0]
+
+        # 3. Dynamic Repricing (Increase price by 15% for every failed batch)
+        # Attempt 1 = 1.0x, Attempt 2 = 1.15x, Attempt 3 = 1.32x
+        if 1 <= attempt_number <= SURFACE_ATTEMPTS:
+            surge_factor = surface.surge[attempt_number - 1]
+        else:
+            surge_factor = self._surge_rate ** (attempt_number - 1)
+
+        return round(price * surge_factor, 2)
+
+    def calculate_prices_batch(self, distance_km, vehicle_codes, is_bad_weather, attempt_numbers=1) -> np.ndarray:
+        """
+        Vectorized calculate_price over columnar order data.
+
+        Args:
+            distance_km: array of distances
+            vehicle_codes: array of VEHICLE_CODES values
+            is_bad_weather: array of weather flags
+            attempt_numbers: array of attempts (or a single attempt for all orders)
+
+        Returns the same rounded prices as calling calculate_price row by row.
+        """
+        distance_km = np.asarray(distance_km, dtype=np.float64)
+        vehicle_codes = np.asarray(vehicle_codes, dtype=np.intp)
+        is_bad_weather = np.asarray(is_bad_weather, dtype=bool)
+
+        surface = self.price_surface()
+        attempt_numbers = np.asarray(attempt_numbers, dtype=np.int64)
+
+        # 1. Base Price by Vehicle (rate table indexed by vehicle code)
+        price = surface.base[vehicle_codes] + (distance_km * 2.0)
+
+        # 2. Weather Penalty (x 1.0 for good weather is exact)
+        price = price * surface.weather_factor[is_bad_weather.astype(np.intp)]
+
+        # 3. Dynamic Repricing, from the precomputed surge factors
+        if attempt_numbers.size and (attempt_numbers.min() < 1 or attempt_numbers.max() > SURFACE_ATTEMPTS):
+            # Beyond the table: same scalar power as calculate_price, once per distinct attempt
+            attempts, inverse = np.unique(attempt_numbers, return_inverse=True)
+            surge_table = np.array([self.surge_rate ** (int(a) - 1) for a in attempts])
+            surge_factor = surge_table[inverse].reshape(attempt_numbers.shape)
+        else:
+            surge_factor = surface.surge_factor[attempt_numbers - 1]
+
+        return round_cents(price * surge_factor)
+
+def validate_price_surface(engine: PricingEngine, distance_km: Optional[np.ndarray] = None,
+                           tolerance: float = 0.0) -> float:
+    """
+    Checks the price-surface paths (calculate_price and calculate_prices_batch)
+    against the direct computation from the engine's rates on every
+    (vehicle, weather, attempt) cell over a distance grid. Returns the largest
+    absolute difference; raises ValueError if it exceeds tolerance (default: exact).
+    """
+    if distance_km is None:
+        distance_km = np.round(np.arange(0.0, 200.0, 0.1), 1)
+    worst = 0.0
+    for code, vehicle in enumerate(VehicleType):
+        for weather in (False, True):
+            for attempt in range(1, SURFACE_ATTEMPTS + 1):
+                price = engine.base_rates[vehicle] + (distance_km * 2.0)
+                if weather:
+                    price = price * engine.weather_multiplier
+                direct = round_cents(price * engine.surge_rate ** (attempt - 1))
+                scalar = np.array([engine.calculate_price(MoveRequest(float(d), vehicle, weather), attempt)
+                                   for d in distance_km])
+                batch = engine.calculate_prices_batch(distance_km, np.full(len(distance_km), code),
+                                                      np.full(len(distance_km), weather), attempt)
+                worst = max(worst, float(np.abs(scalar - direct).max()), float(np.abs(batch - direct).max()))
+    if worst > tolerance + 1e-9:
+        raise ValueError(f"Price surface deviates from the direct computation by {worst:.4f} (> {tolerance}).")
+    return worst
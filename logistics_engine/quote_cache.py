@@ -0,0 +1,147 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+import time
+
+from .pricing_engine import PricingEngine, MoveRequest
+from .cost_model import LogisticPricingModel, MoveRequest as CostRequest
+
+_MISSING = object()
+
+class QuoteCache:
+    """
+    Bounded LRU cache with a per-entry TTL and version-based invalidation.
+
+    Every lookup passes the current version of the rate tables it depends on;
+    when the version differs from the one the entries were computed under,
+    the whole cache is dropped before the lookup.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl_s: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive.")
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self._version: Hashable = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _check_version(self, version: Hashable):
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self._version = version
+
+    def get(self, key: Hashable, version: Hashable = None, default=None):
+        if version != self._version:
+            self._check_version(version)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self.clock():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+            self.expirations += 1
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value, version: Hashable = None):
+        if version != self._version:
+            self._check_version(version)
+        self._entries[key] = (self.clock() + self.ttl_s, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, version: Hashable, compute: Callable[[], object]):
+        value = self.get(key, version, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value, version)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+class CachedPricingEngine:
+    """
+    PricingEngine front-end that memoizes calculate_price.
+
+    Quotes are keyed on the request (distance, vehicle, weather) plus the
+    attempt number, and are invalidated automatically when
+    PricingEngine.rates_version changes. By default the exact distance is the
+    key, so every price equals PricingEngine.calculate_price. Setting
+    distance_decimals opts into coarser keys (more hits): the price is then
+    computed for the rounded distance, which can differ by a few cents.
+
+    Note: calculate_price is already about as cheap as a dict lookup, so this
+    front-end is mainly useful for its hit/miss counters (how much repeat
+    traffic there is); the cost model is where the cache saves time.
+    """
+
+    def __init__(self, engine: Optional[PricingEngine] = None, cache: Optional[QuoteCache] = None,
+                 distance_decimals: Optional[int] = None):
+        self.engine = engine or PricingEngine()
+        self.cache = cache or QuoteCache()
+        self.distance_decimals = distance_decimals
+
+    def calculate_price(self, req: MoveRequest, attempt_number: int = 1) -> float:
+        distance = req.distance_km if self.distance_decimals is None else round(req.distance_km, self.distance_decimals)
+        key = (distance, req.vehicle_type, req.is_bad_weather, attempt_number)
+        value = self.cache.get(key, self.engine.rates_version, _MISSING)
+        if value is _MISSING:
+            normalized = MoveRequest(distance, req.vehicle_type, req.is_bad_weather)
+            value = self.engine.calculate_price(normalized, attempt_number)
+            self.cache.put(key, value, self.engine.rates_version)
+        return value
+
+class CachedCostModel:
+    """
+    Memoizing front-end for the cost_model LogisticPricingModel.
+    The version is a snapshot of base_rate, weights and the sigmoid parameters,
+    so changing any of them drops the cached quotes.
+    """
+
+    def __init__(self, model: Optional[LogisticPricingModel] = None, cache: Optional[QuoteCache] = None):
+        self.model = model or LogisticPricingModel()
+        self.cache = cache or QuoteCache()
+
+    def _version(self) -> tuple:
+        m = self.model
+        return (m.base_rate, m.acceptance_steepness, m.acceptance_midpoint, *m.weights.values())
+
+    @staticmethod
+    def _request_key(req: CostRequest) -> tuple:
+        return (req.distance_km, req.num_workers, req.total_floors, req.num_heavy_items, req.walking_distance_m)
+
+    def calculate_operational_cost(self, req: CostRequest) -> float:
+        return self.cache.get_or_compute(("cost",) + self._request_key(req), self._version(),
+                                         lambda: self.model.calculate_operational_cost(req))
+
+    def optimize_price_for_target_acceptance(self, req: CostRequest, target_prob: float = 0.85) -> dict:
+        quote = self.cache.get_or_compute((target_prob,) + self._request_key(req), self._version(),
+                                          lambda: self.model.optimize_price_for_target_acceptance(req, target_prob))
+        return dict(quote)
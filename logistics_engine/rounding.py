@@ -0,0 +1,18 @@
+from __future__ import annotations
+from .lazy_import import LazyModule
+
+np = LazyModule("numpy")
+
+def round_cents(values: np.ndarray) -> np.ndarray:
+    """
+    Rounds an array to 2 decimals exactly like the builtin round(x, 2).
+    np.round scales by 100 first, which can flip values sitting on a half cent,
+    so those few ambiguous entries are re-rounded with the builtin.
+    Shared by the market pricing engine and the cost model.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100.0
+    ambiguous = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if ambiguous.any():
+        rounded[ambiguous] = [round(float(v), 2) for v in values[ambiguous]]
+    return rounded
@@ -0,0 +1,359 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import argparse
+import heapq
+import math
+import multiprocessing
+import time
+
+import numpy as np
+
+from .dispatch_engine import DispatchEngine
+from .driver_fleet import COLUMNS as FLEET_COLUMNS, DriverFleet
+from .pricing_engine import PricingEngine, MoveRequest, VehicleType
+from .spatial_index import GridIndex
+from .cost_model import LogisticPricingModel
+
+class RegionMap:
+    """
+    Partitions the metro square [0, metro_km)^2 into cols x rows equal
+    rectangles, one per shard (shard = row * cols + col). Positions outside
+    the square are clamped to the nearest edge region.
+    """
+
+    def __init__(self, metro_km: float, cols: int, rows: int):
+        if cols < 1 or rows < 1:
+            raise ValueError("A region map needs at least one column and one row.")
+        self.metro_km = metro_km
+        self.cols = cols
+        self.rows = rows
+
+    @classmethod
+    def for_shards(cls, n_shards: int, metro_km: float = 50.0) -> "RegionMap":
+        """The most square cols x rows grid with exactly n_shards regions."""
+        rows = max(r for r in range(1, int(math.isqrt(n_shards)) + 1) if n_shards % r == 0)
+        return cls(metro_km, n_shards // rows, rows)
+
+    def __len__(self) -> int:
+        return self.cols * self.rows
+
+    def shard_of(self, x_km, y_km) -> np.ndarray:
+        """Shard of each (x, y); accepts scalars or arrays."""
+        col = np.clip(np.floor(np.asarray(x_km) / self.metro_km * self.cols), 0, self.cols - 1).astype(np.intp)
+        row = np.clip(np.floor(np.asarray(y_km) / self.metro_km * self.rows), 0, self.rows - 1).astype(np.intp)
+        return row * self.cols + col
+
+    def bounds(self, shard: int):
+        """(x0, y0, x1, y1) of a shard's region."""
+        row, col = divmod(shard, self.cols)
+        w, h = self.metro_km / self.cols, self.metro_km / self.rows
+        return col * w, row * h, (col + 1) * w, (row + 1) * h
+
+    def neighbours(self, shard: int, x_km: float, y_km: float) -> List[int]:
+        """Adjacent shards (8-neighbourhood), closest region to (x, y) first."""
+        row, col = divmod(shard, self.cols)
+        found = []
+        for r in range(max(row - 1, 0), min(row + 2, self.rows)):
+            for c in range(max(col - 1, 0), min(col + 2, self.cols)):
+                other = r * self.cols + c
+                if other != shard:
+                    x0, y0, x1, y1 = self.bounds(other)
+                    gap = math.hypot(max(x0 - x_km, 0.0, x_km - x1), max(y0 - y_km, 0.0, y_km - y1))
+                    found.append((gap, other))
+        return [other for _, other in sorted(found)]
+
+@dataclass
+class ShardConfig:
+    """Per-shard dispatch and market parameters (shared by every worker)."""
+    candidates: int = 60                 # Nearest free drivers ranked per order (local cascade / borrowed batch)
+    cell_km: float = 1.0                 # GridIndex cell size
+    driver_cost_share: float = 0.85      # Driver's own cost as a share of the attempt-1 price
+    mean_job_s: float = 90 * 60.0        # Mean time a driver stays busy after accepting
+    order_rate_per_s: float = 50.0       # Arrival rate used when dispatch() gets no arrival times
+    chunk_size: int = 256                # Orders per queue message
+    seed: int = 0
+
+# --- Worker process ---
+class _Shard:
+    """
+    State owned by one worker: its region's drivers (a DriverFleet), a
+    GridIndex of the free ones, and unmodified DispatchEngine / PricingEngine instances. Only
+    this process ever changes these drivers, borrowed offers included.
+    """
+
+    def __init__(self, shard: int, columns: Dict[str, np.ndarray], config: ShardConfig):
+        self.shard = shard
+        self.config = config
+        self.fleet = DriverFleet.from_columns(columns)
+        self.index = GridIndex(config.cell_km)
+        free = ~self.fleet.is_busy
+        for driver_id, x, y in zip(self.fleet.ids[free].tolist(), self.fleet.x_km[free].tolist(),
+                                   self.fleet.y_km[free].tolist()):
+            self.index.update(driver_id, x, y)
+        self.dispatcher = DispatchEngine()
+        self.pricer = PricingEngine()
+        self.acceptance_model = LogisticPricingModel()
+        self.rng = np.random.default_rng((config.seed, shard))
+        self._releases = []  # (release time, fleet row) heap
+        self.busy_s = 0.0
+        self.processed = 0
+
+    def _advance(self, now: float):
+        """Frees every driver whose job ended by `now` (virtual time)."""
+        releases, fleet = self._releases, self.fleet
+        while releases and releases[0][0] <= now:
+            row = heapq.heappop(releases)[1]
+            fleet.is_busy[row] = False
+            self.index.update(str(fleet.ids[row]), float(fleet.x_km[row]), float(fleet.y_km[row]))
+
+    def _offer(self, order: MoveRequest, rows: np.ndarray, attempt: int, now: float):
+        """Offers one batch; returns (driver id, price) of the winner or None."""
+        price = self.pricer.calculate_price(order, attempt_number=attempt)
+        if not rows.size:
+            return None
+        driver_cost = self.config.driver_cost_share * self.pricer.calculate_price(order, attempt_number=1)
+        p = self.acceptance_model.estimate_acceptance_probability(price - driver_cost)
+        accepted = rows[self.rng.random(rows.size) < p]
+        if not accepted.size:
+            return None
+        winner = int(accepted[self.rng.integers(accepted.size)])
+        driver_id = str(self.fleet.ids[winner])
+        self.fleet.is_busy[winner] = True
+        # Busy drivers leave the index, so drained areas do not slow down nearest-driver queries
+        self.index.remove(driver_id)
+        heapq.heappush(self._releases, (now + self.rng.exponential(self.config.mean_job_s), winner))
+        return driver_id, price
+
+    def run_chunk(self, chunk: dict, borrowed: bool) -> dict:
+        """
+        Local orders run the usual cascade over the nearest free candidates.
+        Borrowed orders (escalated by a neighbour) get one Panic Mode batch of
+        this shard's candidates at the next attempt's price.
+        """
+        started = time.process_time()  # CPU time: shards sharing a core do not inflate each other
+        vehicles = list(VehicleType)
+        filled, escalated = [], []
+        for i in range(len(chunk["pos"])):
+            now = float(chunk["t"][i])
+            self._advance(now)
+            origin = (float(chunk["x_km"][i]), float(chunk["y_km"][i]))
+            order = MoveRequest(float(chunk["distance_km"][i]), vehicles[int(chunk["vehicle_code"][i])],
+                                bool(chunk["is_bad_weather"][i]), origin)
+            candidates = self.dispatcher.nearby_drivers(self.index, self.fleet, origin, k=self.config.candidates)
+            attempt = int(chunk["attempt"][i]) if borrowed else 0
+            result = None
+            if borrowed:
+                attempt += 1
+                result = self._offer(order, candidates.indices, attempt, now)
+            else:
+                for batch in self.dispatcher.iter_fleet_batches(candidates):
+                    attempt += 1
+                    result = self._offer(order, batch, attempt, now)
+                    if result is not None:
+                        break
+            if result is None:
+                escalated.append((int(chunk["pos"][i]), attempt))
+            else:
+                filled.append((int(chunk["pos"][i]), result[0], result[1], attempt))
+        self.processed += len(chunk["pos"])
+        self.busy_s += time.process_time() - started
+        return {"filled": filled, "escalated": escalated}
+
+def _shard_main(shard: int, columns: Dict[str, np.ndarray], config: ShardConfig, inbox, outbox):
+    state = _Shard(shard, columns, config)
+    outbox.put(("ready", shard, None))
+    while True:
+        kind, payload = inbox.get()
+        if kind == "stop":
+            return
+        if kind == "stats":
+            # Counters cover the work since the previous stats request
+            outbox.put(("stats", shard, {"busy_s": state.busy_s, "processed": state.processed}))
+            state.busy_s, state.processed = 0.0, 0
+            continue
+        outbox.put(("result", shard, {**state.run_chunk(payload, kind == "borrow"), "borrow": kind == "borrow"}))
+
+# --- Router (parent process) ---
+@dataclass
+class ShardedReport:
+    """Outcome of ShardedDispatcher.dispatch, one entry per order in input order."""
+    driver_ids: np.ndarray               # "" when unfilled
+    prices: np.ndarray                   # NaN when unfilled
+    attempts: np.ndarray                 # Attempt that was accepted (or the last one offered)
+    home_shard: np.ndarray               # Shard the order was routed to by origin
+    served_by: np.ndarray                # Shard whose driver took it (-1 when unfilled)
+    wall_time_s: float = 0.0
+    shard_busy_s: List[float] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, float]:
+        n = len(self.driver_ids)
+        filled = self.served_by >= 0
+        borrowed = filled & (self.served_by != self.home_shard)
+        critical_s = max(self.shard_busy_s, default=0.0)
+        return {
+            "orders": n,
+            "filled": int(filled.sum()),
+            "borrowed": int(borrowed.sum()),
+            "unfilled": int(n - filled.sum()),
+            "orders_per_s": n / self.wall_time_s if self.wall_time_s else 0.0,
+            # Throughput if every shard had its own core: bounded by the busiest shard
+            "critical_path_orders_per_s": n / critical_s if critical_s else 0.0,
+            "wall_time_s": self.wall_time_s,
+        }
+
+class ShardedDispatcher:
+    """
+    Region-sharded dispatch runtime: one worker process per region of a
+    RegionMap, each owning that region's drivers and running the existing
+    nearby_drivers / iter_fleet_batches / calculate_price path on them.
+
+    The router sends every order to the shard of its origin (in chunks over
+    multiprocessing queues). When a shard's local cascade is exhausted without
+    an acceptance, the router forwards the order to the neighbouring shards,
+    closest region first, each of which offers its nearest free drivers as the
+    Panic Mode batch at the next attempt's price. Driver state is never shared:
+    a borrowed driver is marked busy by the shard that owns it.
+
+        with ShardedDispatcher(fleet, n_shards=4) as service:
+            report = service.dispatch(order_book)
+    """
+
+    def __init__(self, fleet: DriverFleet, n_shards: int, metro_km: float = 50.0,
+                 config: Optional[ShardConfig] = None, start_method: Optional[str] = None):
+        if np.isnan(fleet.x_km).any():
+            raise ValueError("Every driver needs a position_km to be assigned to a region.")
+        self.regions = RegionMap.for_shards(n_shards, metro_km)
+        self.config = config or ShardConfig()
+        self._context = multiprocessing.get_context(start_method)
+        owner = self.regions.shard_of(fleet.x_km, fleet.y_km)
+        self._partitions = [{name: np.ascontiguousarray(getattr(fleet, name)[owner == shard])
+                             for name in FLEET_COLUMNS} for shard in range(len(self.regions))]
+        self.drivers_per_shard = [len(p["ids"]) for p in self._partitions]
+        self._workers = []
+
+    def start(self):
+        if self._workers:
+            return self
+        self._outbox = self._context.Queue()
+        self._inboxes = [self._context.Queue() for _ in range(len(self.regions))]
+        for shard, columns in enumerate(self._partitions):
+            worker = self._context.Process(target=_shard_main, daemon=True,
+                                           args=(shard, columns, self.config, self._inboxes[shard], self._outbox))
+            worker.start()
+            self._workers.append(worker)
+        self._partitions = None  # each worker owns its drivers from now on
+        for _ in self._workers:
+            self._expect("ready")
+        return self
+
+    def _expect(self, kind: str):
+        got, shard, payload = self._outbox.get()
+        if got != kind:
+            raise RuntimeError(f"Shard {shard} sent '{got}' while '{kind}' was expected.")
+        return shard, payload
+
+    def shard_stats(self) -> List[dict]:
+        """Compute time and orders handled per shard since the previous call."""
+        for inbox in self._inboxes:
+            inbox.put(("stats", None))
+        stats = [None] * len(self._workers)
+        for _ in self._workers:
+            shard, payload = self._expect("stats")
+            stats[shard] = payload
+        return stats
+
+    def close(self):
+        for inbox in self._inboxes if self._workers else ():
+            inbox.put(("stop", None))
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _send(self, shard: int, kind: str, columns: dict, rows: np.ndarray) -> int:
+        """Sends the given order rows to a shard in chunks; returns the number of messages."""
+        messages = 0
+        for start in range(0, len(rows), self.config.chunk_size):
+            part = rows[start:start + self.config.chunk_size]
+            self._inboxes[shard].put((kind, {name: values[part] for name, values in columns.items()}))
+            messages += 1
+        return messages
+
+    def dispatch(self, book, arrival_s: Optional[np.ndarray] = None) -> ShardedReport:
+        """
+        Dispatches every order of a snapshot.OrderBook (origins required).
+        arrival_s: virtual arrival time per order (drives job completions);
+        defaults to a steady config.order_rate_per_s stream.
+        """
+        self.start()
+        n = len(book)
+        if np.isnan(book.origin_x_km).any():
+            raise ValueError("Sharded dispatch routes by origin: every order needs origin_km.")
+        if arrival_s is None:
+            arrival_s = np.arange(n) / self.config.order_rate_per_s
+        columns = {
+            "pos": np.arange(n), "t": np.asarray(arrival_s, dtype=np.float64),
+            "distance_km": np.asarray(book.distance_km), "vehicle_code": np.asarray(book.vehicle_code),
+            "is_bad_weather": np.asarray(book.is_bad_weather),
+            "x_km": np.asarray(book.origin_x_km), "y_km": np.asarray(book.origin_y_km),
+            "attempt": np.zeros(n, dtype=np.int64),
+        }
+        home = self.regions.shard_of(columns["x_km"], columns["y_km"])
+        driver_ids = np.full(n, "", dtype=object)
+        prices = np.full(n, np.nan)
+        attempts = np.zeros(n, dtype=np.int64)
+        served_by = np.full(n, -1, dtype=np.intp)
+        tried = [0] * n  # neighbours already asked, per order
+
+        self.shard_stats()  # zero the counters
+        started = time.perf_counter()
+        in_flight = sum(self._send(shard, "orders", columns, np.flatnonzero(home == shard))
+                        for shard in range(len(self.regions)))
+        while in_flight:
+            shard, result = self._expect("result")
+            in_flight -= 1
+            for pos, driver_id, price, attempt in result["filled"]:
+                driver_ids[pos], prices[pos], attempts[pos], served_by[pos] = driver_id, price, attempt, shard
+            forward: Dict[int, List[int]] = {}
+            for pos, attempt in result["escalated"]:
+                attempts[pos] = columns["attempt"][pos] = attempt
+                neighbours = self.regions.neighbours(int(home[pos]), columns["x_km"][pos], columns["y_km"][pos])
+                if tried[pos] < len(neighbours):
+                    forward.setdefault(neighbours[tried[pos]], []).append(pos)
+                    tried[pos] += 1
+            for target, rows in forward.items():
+                in_flight += self._send(target, "borrow", columns, np.array(rows))
+        wall = time.perf_counter() - started
+
+        busy = [stats["busy_s"] for stats in self.shard_stats()]
+        return ShardedReport(driver_ids.astype(str), prices, attempts, home, served_by, wall, busy)
+
+def format_report(report: ShardedReport) -> str:
+    s = report.summary()
+    return (f"Orders: {s['orders']:,}  Filled: {s['filled']:,} ({s['borrowed']:,} by a neighbour's driver)  "
+            f"Unfilled: {s['unfilled']:,}\n"
+            f"Wall {s['wall_time_s']:.2f}s -> {s['orders_per_s']:,.0f} orders/s  |  "
+            f"busiest shard {max(report.shard_busy_s, default=0):.2f}s -> "
+            f"{s['critical_path_orders_per_s']:,.0f} orders/s with one core per shard")
+
+if __name__ == "__main__":
+    from .snapshot import OrderBook, synthetic_fleet_columns, synthetic_order_columns
+
+    parser = argparse.ArgumentParser(description="Region-sharded multi-process dispatch")
+    parser.add_argument("--shards", type=int, default=4)
+    parser.add_argument("--drivers", type=int, default=100_000)
+    parser.add_argument("--orders", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    fleet = DriverFleet.from_columns(synthetic_fleet_columns(args.drivers, args.seed))
+    book = OrderBook(**synthetic_order_columns(args.orders, args.seed + 1))
+    with ShardedDispatcher(fleet, args.shards, config=ShardConfig(seed=args.seed)) as service:
+        print(f"{args.shards} shards ({service.regions.cols}x{service.regions.rows}), "
+              f"drivers per shard: {service.drivers_per_shard}")
+        print(format_report(service.dispatch(book)))
@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+import argparse
+import json
+import struct
+import time
+
+import numpy as np
+
+from .driver_fleet import COLUMNS as FLEET_COLUMNS, DriverFleet
+from .pricing_engine import PricingEngine, MoveRequest, VehicleType, VEHICLE_CODES
+
+# File layout: MAGIC | u32 format version | u32 header length | JSON header | columns.
+# Every column is a raw little-endian array starting on an ALIGNMENT boundary,
+# so the reader maps each one straight from the file with numpy.memmap.
+MAGIC = b"PESNAP\x00\x00"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+_PREAMBLE = struct.Struct("<8sII")
+
+ORDER_COLUMNS = ("ids", "distance_km", "vehicle_code", "is_bad_weather", "origin_x_km", "origin_y_km")
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def write_snapshot(path: str, kind: str, columns: Dict[str, np.ndarray], meta: Optional[dict] = None):
+    """Writes equally long 1-D columns as one versioned snapshot file."""
+    columns = {name: np.ascontiguousarray(values) for name, values in columns.items()}
+    rows = {len(values) for values in columns.values()}
+    if len(rows) > 1:
+        raise ValueError("Snapshot columns must all have the same length.")
+    specs = [{"name": name, "dtype": values.dtype.newbyteorder("<").str} for name, values in columns.items()]
+    header = {"kind": kind, "rows": rows.pop() if rows else 0, "columns": specs, "meta": meta or {}}
+
+    # Offsets depend on the header size, which depends on the offsets: reserve room, then fill in
+    for spec in specs:
+        spec["offset"] = 0
+    reserve = len(json.dumps(header)) + 32 * len(specs) + ALIGNMENT
+    offset = _aligned(_PREAMBLE.size + reserve)
+    for spec, values in zip(specs, columns.values()):
+        spec["offset"] = offset
+        offset = _aligned(offset + values.nbytes)
+    header_bytes = json.dumps(header).encode().ljust(reserve)
+
+    with open(path, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for spec, values in zip(specs, columns.values()):
+            f.seek(spec["offset"])
+            f.write(values.astype(spec["dtype"], copy=False).tobytes())
+        f.truncate(max(offset, f.tell()))
+
+def read_header(path: str) -> dict:
+    with open(path, "rb") as f:
+        magic, version, header_len = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a snapshot file.")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"{path} has snapshot format v{version}; this reader supports up to v{FORMAT_VERSION}.")
+        return json.loads(f.read(header_len))
+
+def read_snapshot(path: str, kind: Optional[str] = None, mode: str = "c") -> Tuple[dict, Dict[str, np.ndarray]]:
+    """
+    Maps every column of a snapshot without reading it. mode is the numpy.memmap
+    mode: "c" (default) gives writable copy-on-write arrays that never touch
+    the file, "r" read-only ones, "r+" writes through to the file.
+    """
+    header = read_header(path)
+    if kind is not None and header["kind"] != kind:
+        raise ValueError(f"{path} holds a '{header['kind']}' snapshot, expected '{kind}'.")
+    rows = header["rows"]
+    columns = {}
+    for spec in header["columns"]:
+        if rows:
+            columns[spec["name"]] = np.memmap(path, dtype=np.dtype(spec["dtype"]), mode=mode,
+                                              offset=spec["offset"], shape=(rows,))
+        else:
+            columns[spec["name"]] = np.empty(0, dtype=np.dtype(spec["dtype"]))
+    return header, columns
+
+# --- Driver fleets ---
+def save_fleet(fleet: DriverFleet, path: str):
+    write_snapshot(path, "fleet", {name: getattr(fleet, name) for name in FLEET_COLUMNS})
+
+def load_fleet(path: str, mode: str = "c") -> DriverFleet:
+    """
+    DriverFleet whose columns are memory-mapped from the snapshot: no per-driver
+    objects, and the id -> row map is only built on the first id lookup.
+    """
+    _, columns = read_snapshot(path, "fleet", mode)
+    return DriverFleet.from_columns(columns)
+
+# --- Order books ---
+@dataclass
+class OrderBook:
+    """Columnar MoveRequests (vehicle_code = VEHICLE_CODES value; NaN origin when unknown)."""
+    ids: np.ndarray
+    distance_km: np.ndarray
+    vehicle_code: np.ndarray
+    is_bad_weather: np.ndarray
+    origin_x_km: np.ndarray
+    origin_y_km: np.ndarray
+
+    @classmethod
+    def from_requests(cls, orders: Iterable[Tuple[str, MoveRequest]]) -> "OrderBook":
+        orders = list(orders)
+        origins = [o.origin_km or (np.nan, np.nan) for _, o in orders]
+        return cls(
+            ids=np.array([order_id for order_id, _ in orders], dtype=str),
+            distance_km=np.array([o.distance_km for _, o in orders], dtype=np.float64),
+            vehicle_code=np.array([VEHICLE_CODES[o.vehicle_type] for _, o in orders], dtype=np.int8),
+            is_bad_weather=np.array([o.is_bad_weather for _, o in orders], dtype=bool),
+            origin_x_km=np.array([p[0] for p in origins], dtype=np.float64),
+            origin_y_km=np.array([p[1] for p in origins], dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.distance_km)
+
+    def request(self, i: int) -> MoveRequest:
+        """Materializes one row as a MoveRequest."""
+        x = float(self.origin_x_km[i])
+        return MoveRequest(float(self.distance_km[i]), list(VehicleType)[int(self.vehicle_code[i])],
+                           bool(self.is_bad_weather[i]),
+                           None if np.isnan(x) else (x, float(self.origin_y_km[i])))
+
+    def prices(self, pricer: PricingEngine, attempt_numbers=1, rows=slice(None)) -> np.ndarray:
+        """calculate_prices_batch straight from the (mapped) columns."""
+        return pricer.calculate_prices_batch(self.distance_km[rows], self.vehicle_code[rows],
+                                             self.is_bad_weather[rows], attempt_numbers)
+
+def save_orders(book: OrderBook, path: str):
+    write_snapshot(path, "orders", {name: getattr(book, name) for name in ORDER_COLUMNS})
+
+def load_orders(path: str, mode: str = "r") -> OrderBook:
+    _, columns = read_snapshot(path, "orders", mode)
+    return OrderBook(**{name: columns[name] for name in ORDER_COLUMNS})
+
+# --- Synthetic data (columnar, no per-row objects) ---
+def _labels(prefix: str, n: int) -> np.ndarray:
+    """prefix0 .. prefix{n-1} as the narrowest fixed-width string column."""
+    width = len(prefix) + len(str(max(n - 1, 0)))
+    return np.char.add(prefix, np.arange(n).astype(f"U{width}")).astype(f"U{width}")
+
+def synthetic_fleet_columns(n: int, seed: int = 0, metro_km: float = 50.0) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return {
+        "ids": _labels("D", n),
+        "names": _labels("Driver ", n),
+        "rating": np.round(rng.uniform(3.0, 5.0, n), 1),
+        "location_km": np.round(rng.exponential(6.0, n), 2),
+        "days_in_system": rng.integers(0, 400, n).astype(np.int32),
+        "is_busy": rng.random(n) < 0.3,
+        "x_km": rng.uniform(0.0, metro_km, n),
+        "y_km": rng.uniform(0.0, metro_km, n),
+    }
+
+def synthetic_order_columns(n: int, seed: int = 0, metro_km: float = 50.0) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return {
+        "ids": _labels("o", n),
+        "distance_km": np.round(rng.exponential(15.0, n) + 0.5, 1),
+        "vehicle_code": rng.integers(0, len(VehicleType), n).astype(np.int8),
+        "is_bad_weather": rng.random(n) < 0.2,
+        "origin_x_km": rng.uniform(0.0, metro_km, n),
+        "origin_y_km": rng.uniform(0.0, metro_km, n),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write or inspect fleet / order-book snapshots")
+    parser.add_argument("kind", choices=["fleet", "orders", "info"])
+    parser.add_argument("path")
+    parser.add_argument("--generate", type=int, help="Write a synthetic snapshot with this many rows")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.kind == "info":
+        header = read_header(args.path)
+        print(f"{header['kind']} snapshot, {header['rows']:,} rows")
+        for spec in header["columns"]:
+            print(f"   {spec['name']:<16} {spec['dtype']:<6} @ {spec['offset']:,}")
+    elif args.generate is None:
+        parser.error("--generate N is required to write a snapshot")
+    else:
+        make = synthetic_fleet_columns if args.kind == "fleet" else synthetic_order_columns
+        start = time.perf_counter()
+        write_snapshot(args.path, args.kind, make(args.generate, args.seed))
+        print(f"Wrote {args.generate:,} {args.kind} rows to {args.path} in {time.perf_counter() - start:.2f}s")
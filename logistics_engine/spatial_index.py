@@ -0,0 +1,149 @@
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+import heapq
+import math
+
+class GridIndex:
+    """
+    Uniform grid (bucket) spatial index over 2D positions in km.
+    Updates are O(1) (move an id between two buckets); radius and k-nearest
+    queries only visit the cells around the query point, so their cost
+    scales with local density instead of the total number of indexed items.
+    """
+
+    def __init__(self, cell_km: float = 1.0):
+        if cell_km <= 0:
+            raise ValueError("cell_km must be positive.")
+        self.cell_km = cell_km
+        self._cells: Dict[Tuple[int, int], Set[str]] = defaultdict(set)
+        self._positions: Dict[str, Tuple[float, float]] = {}
+        self._cell_of: Dict[str, Tuple[int, int]] = {}
+
+    @classmethod
+    def from_drivers(cls, drivers: Iterable, cell_km: float = 1.0) -> "GridIndex":
+        """Indexes every driver that has a position_km."""
+        index = cls(cell_km)
+        for driver in drivers:
+            if driver.position_km is not None:
+                index.update(driver.id, *driver.position_km)
+        return index
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_km), math.floor(y / self.cell_km))
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._positions
+
+    def position(self, item_id: str) -> Tuple[float, float]:
+        return self._positions[item_id]
+
+    def update(self, item_id: str, x: float, y: float):
+        """Inserts an id or moves it to a new position."""
+        cell = self._cell(x, y)
+        old_cell = self._cell_of.get(item_id)
+        if old_cell != cell:
+            if old_cell is not None:
+                self._discard(item_id, old_cell)
+            self._cells[cell].add(item_id)
+            self._cell_of[item_id] = cell
+        self._positions[item_id] = (x, y)
+
+    def remove(self, item_id: str):
+        cell = self._cell_of.pop(item_id)
+        del self._positions[item_id]
+        self._discard(item_id, cell)
+
+    def _discard(self, item_id: str, cell: Tuple[int, int]):
+        bucket = self._cells[cell]
+        bucket.discard(item_id)
+        if not bucket:
+            del self._cells[cell]
+
+    def _ring(self, cx: int, cy: int, r: int) -> Iterable[Tuple[int, int]]:
+        """Cells at Chebyshev distance exactly r from (cx, cy)."""
+        if r == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-r, r + 1):
+            yield (cx + dx, cy - r)
+            yield (cx + dx, cy + r)
+        for dy in range(-r + 1, r):
+            yield (cx - r, cy + dy)
+            yield (cx + r, cy + dy)
+
+    def query_radius(self, x: float, y: float, radius_km: float,
+                     accept: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, float]]:
+        """All (id, distance_km) within radius_km of (x, y), closest first."""
+        reach = radius_km / self.cell_km
+        if (2 * reach + 3) ** 2 > len(self._cells):
+            # Window wider than the occupied cells (radius_km=inf included): visit those instead
+            buckets = list(self._cells.values())
+        else:
+            cx, cy = self._cell(x, y)
+            reach = math.ceil(reach)
+            buckets = [self._cells.get((gx, gy)) for gx in range(cx - reach, cx + reach + 1)
+                       for gy in range(cy - reach, cy + reach + 1)]
+        found = []
+        for bucket in buckets:
+            if not bucket:
+                continue
+            for item_id in bucket:
+                px, py = self._positions[item_id]
+                dist = math.hypot(px - x, py - y)
+                if dist <= radius_km and (accept is None or accept(item_id)):
+                    found.append((dist, item_id))
+        found.sort()
+        return [(item_id, dist) for dist, item_id in found]
+
+    def nearest(self, x: float, y: float, k: int, max_radius_km: float = math.inf,
+                accept: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, float]]:
+        """
+        The k closest (id, distance_km) to (x, y), closest first.
+        Expands ring by ring; stops once the k-th best distance is closer than
+        anything an unvisited ring could contain.
+        """
+        if k <= 0 or not self._positions:
+            return []
+        cx, cy = self._cell(x, y)
+        best: List[Tuple[float, str]] = []  # max-heap via negated distances
+        seen = 0
+        r = 0
+        while True:
+            for cell in self._ring(cx, cy, r):
+                bucket = self._cells.get(cell)
+                if not bucket:
+                    continue
+                seen += len(bucket)
+                for item_id in bucket:
+                    px, py = self._positions[item_id]
+                    dist = math.hypot(px - x, py - y)
+                    if dist > max_radius_km or (len(best) == k and dist >= -best[0][0]):
+                        continue
+                    if accept is not None and not accept(item_id):
+                        continue
+                    if len(best) < k:
+                        heapq.heappush(best, (-dist, item_id))
+                    else:
+                        heapq.heapreplace(best, (-dist, item_id))
+            # Anything in ring r+1 or beyond is at least r cells away from the query point
+            frontier_km = r * self.cell_km
+            if seen >= len(self._positions) or frontier_km > max_radius_km:
+                break
+            if len(best) == k and -best[0][0] <= frontier_km:
+                break
+            r += 1
+            if (2 * r + 1) ** 2 > 4 * len(self._cells):
+                # Sparse index: walking empty rings costs more than a scan
+                return self._scan_nearest(x, y, k, max_radius_km, accept)
+        return [(item_id, -neg) for neg, item_id in sorted(best, key=lambda e: (-e[0], e[1]))]
+
+    def _scan_nearest(self, x, y, k, max_radius_km, accept) -> List[Tuple[str, float]]:
+        found = []
+        for item_id, (px, py) in self._positions.items():
+            dist = math.hypot(px - x, py - y)
+            if dist <= max_radius_km and (accept is None or accept(item_id)):
+                found.append((dist, item_id))
+        return [(item_id, dist) for dist, item_id in heapq.nsmallest(k, found)]
@@ -0,0 +1,307 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+import argparse
+import time
+
+import numpy as np
+
+from .dispatch_engine import DispatchEngine
+from .pricing_engine import PricingEngine, MoveRequest, VehicleType, VEHICLE_CODES
+from .cost_model import LogisticPricingModel
+
+# Candidate-pool sizes the policies are solved for; a lookup uses the largest bucket <= the actual count
+CANDIDATE_BUCKETS = (0, 1, 2, 3, 5, 8, 10, 12, 15, 20, 25, 30, 40, 60, 100, 200, 500, 1000)
+
+@dataclass
+class EscalationPolicy:
+    """Solved schedule of one segment: surge multiplier per attempt, applied to the attempt-1 price."""
+    multipliers: Tuple[float, ...]
+    batch_sizes: Tuple[int, ...]
+    expected_cost: float        # Expected price paid plus the unfilled penalty ($)
+    expected_tta_s: float       # Expected time until acceptance (or until the cascade runs out)
+    fill_probability: float
+    feasible: bool              # False when even the highest multipliers miss the target time
+
+@dataclass
+class Segment:
+    """The table cell a lookup lands in: what the policy was solved for."""
+    vehicle_type: VehicleType
+    is_bad_weather: bool
+    distance_km: Tuple[float, float]          # Distance bucket [low, high)
+    model_distance_km: float                  # Bucket midpoint the schedule was solved at
+    candidates: Tuple[int, Optional[int]]     # Candidate-pool bucket [low, high], high None for the last one
+
+def batch_sizes(dispatcher: DispatchEngine, n_candidates: int) -> List[int]:
+    """Sizes of the batches create_batches makes out of n ranked candidates."""
+    return [len(batch) for batch in dispatcher.create_batches(range(n_candidates))]
+
+def _attempt_tables(base_price, sizes, k, midpoint, grid, cost_share, timeout_s):
+    """
+    Per (segment, attempt, multiplier): probability q that the batch accepts and
+    q * E[time to the first acceptance | accepted]. Each driver accepts
+    independently with the sigmoid of their margin and answers at a uniform time
+    in [0, timeout_s], so with A ~ Binomial(n, p) acceptors the first answer
+    comes after timeout_s / (A + 1) on average.
+    """
+    margin = base_price[:, None, None] * (grid[None, None, :] - cost_share)
+    p = 1 / (1 + np.exp(-np.clip(k[:, None, None] * (margin - midpoint[:, None, None]), -40.0, 40.0)))
+    p = np.clip(p, 1e-12, 1 - 1e-12)
+    n = sizes[:, :, None].astype(np.float64)
+    none_accept = np.exp(n * np.log1p(-p))                         # (1 - p)^n
+    q = 1 - none_accept
+    mean_inverse = -np.expm1((n + 1) * np.log1p(-p)) / ((n + 1) * p)  # E[1 / (A + 1)]
+    return q, timeout_s * (mean_inverse - none_accept)
+
+def _evaluate(choice, base_price, grid, q, q_time, sizes, timeout_s, unfilled_penalty):
+    """Expected cost, time and fill probability of the chosen multiplier indices (S, attempts)."""
+    s = np.arange(len(base_price))
+    reach = np.ones(len(base_price))
+    cost = np.zeros(len(base_price))
+    tta = np.zeros(len(base_price))
+    for a in range(choice.shape[1]):
+        present = sizes[:, a] > 0
+        qa, ta = q[s, a, choice[:, a]], q_time[s, a, choice[:, a]]
+        cost += np.where(present, reach * qa * grid[choice[:, a]] * base_price, 0.0)
+        tta += np.where(present, reach * (ta + (1 - qa) * timeout_s), 0.0)
+        reach = np.where(present, reach * (1 - qa), reach)
+    return cost + reach * unfilled_penalty, tta, 1 - reach
+
+def _solve_lagrangian(lam, base_price, grid, q, q_time, sizes, timeout_s, unfilled_penalty):
+    """
+    Backward DP over attempts minimizing E[cost] + lam * E[time], with
+    non-decreasing multipliers (state = previous multiplier index). Returns
+    the chosen multiplier index per (segment, attempt).
+    """
+    n_seg, n_att, n_grid = q.shape
+    value = np.broadcast_to(unfilled_penalty[:, None], (n_seg, n_grid)).copy()  # after the last attempt
+    stage = np.empty((n_att, n_seg, n_grid))
+    for a in range(n_att - 1, -1, -1):
+        f = (q[:, a] * (grid[None, :] * base_price[:, None]) + lam[:, None] * q_time[:, a]
+             + (1 - q[:, a]) * (lam[:, None] * timeout_s + value))
+        # Empty batch: nothing is offered, the state passes through unchanged
+        f = np.where(sizes[:, a, None] > 0, f, value)
+        stage[a] = f
+        value = np.minimum.accumulate(f[:, ::-1], axis=1)[:, ::-1]   # best choice i >= previous index j
+
+    choice = np.empty((n_seg, n_att), dtype=np.intp)
+    previous = np.zeros(n_seg, dtype=np.intp)
+    columns = np.arange(n_grid)
+    for a in range(n_att):
+        masked = np.where(columns[None, :] >= previous[:, None], stage[a], np.inf)
+        choice[:, a] = np.where(sizes[:, a] > 0, masked.argmin(axis=1), previous)
+        previous = choice[:, a]
+    return choice
+
+def solve_schedules(base_price: np.ndarray, sizes: np.ndarray, steepness: np.ndarray, midpoint: np.ndarray,
+                    target_tta_s, grid: np.ndarray, cost_share: float = 0.85, timeout_s: float = 10.0,
+                    unfilled_penalty=None, iterations: int = 30):
+    """
+    Price schedules for many segments at once.
+
+    For each segment (attempt-1 price, batch sizes per attempt, acceptance
+    sigmoid) finds the non-decreasing multipliers from `grid` that minimize the
+    expected cost subject to E[time to acceptance] <= target_tta_s. The
+    constraint is handled by bisection on a Lagrange multiplier for time, each
+    step being one vectorized backward DP over attempts.
+
+    Returns (multiplier indices (S, attempts), expected cost, expected time,
+    fill probability, feasible), all per segment.
+    """
+    base_price = np.asarray(base_price, dtype=np.float64)
+    n_seg = len(base_price)
+    target = np.broadcast_to(np.asarray(target_tta_s, dtype=np.float64), (n_seg,))
+    penalty = 2.0 * base_price if unfilled_penalty is None else \
+        np.broadcast_to(np.asarray(unfilled_penalty, dtype=np.float64), (n_seg,))
+    q, q_time = _attempt_tables(base_price, sizes, np.asarray(steepness, dtype=np.float64),
+                                np.asarray(midpoint, dtype=np.float64), grid, cost_share, timeout_s)
+
+    def policy(lam, rows=slice(None)):
+        args = (base_price[rows], grid, q[rows], q_time[rows], sizes[rows], timeout_s, penalty[rows])
+        choice = _solve_lagrangian(lam, *args)
+        return (choice,) + _evaluate(choice, *args)
+
+    # lam = 0 is the cheapest schedule; lam_hi makes a second of waiting worth more than any price step
+    choice, cost, tta, fill = policy(np.zeros(n_seg))
+    lam_hi = np.full(n_seg, 100.0 * (grid[-1] * base_price.max() + penalty.max()) / timeout_s)
+    fast = policy(lam_hi)
+    feasible = fast[2] <= target + 1e-9
+    # No schedule is fast enough: take the fastest one
+    choice[~feasible] = fast[0][~feasible]
+    for values, fastest in zip((cost, tta, fill), fast[1:]):
+        values[~feasible] = fastest[~feasible]
+
+    rows = np.flatnonzero((tta > target) & feasible)
+    if rows.size:
+        # Geometric bisection on lam, only for the segments whose cheapest schedule is too slow
+        lo, hi = lam_hi[rows] * 1e-9, lam_hi[rows]
+        for _ in range(iterations):
+            mid = np.sqrt(lo * hi)
+            ok = policy(mid, rows)[2] <= target[rows]
+            hi = np.where(ok, mid, hi)
+            lo = np.where(ok, lo, mid)
+        resolved = policy(hi, rows)
+        choice[rows] = resolved[0]
+        for values, new in zip((cost, tta, fill), resolved[1:]):
+            values[rows] = new
+    return choice, cost, tta, fill, feasible
+
+class SurgePolicyTable:
+    """
+    Surge-escalation policies solved ahead of time, replacing the fixed
+    surge_rate ** (attempt - 1) step with a per-segment schedule.
+
+    A segment is (vehicle, weather, distance bucket, candidate-pool bucket):
+    the distance sets the attempt-1 price (from PricingEngine), the pool size
+    sets the batch sizes (from DispatchEngine.create_batches), and the vehicle
+    / weather pick the acceptance sigmoid (a cost_model LogisticPricingModel, or an
+    acceptance_estimator.AcceptanceEstimator's per-segment estimate). Every
+    segment's schedule comes out of one vectorized solve_schedules call and is
+    stored in a dense table, so pricing an attempt is an index computation
+    plus one lookup. The table is rebuilt when the pricer's rates change.
+    """
+
+    def __init__(self, pricer: Optional[PricingEngine] = None, dispatcher: Optional[DispatchEngine] = None,
+                 acceptance=None, target_tta_s: float = 15.0, batch_timeout_s: float = 10.0,
+                 driver_cost_share: float = 0.85, unfilled_penalty_share: float = 2.0,
+                 distance_step_km: float = 5.0, max_distance_km: float = 200.0,
+                 candidate_buckets: Sequence[int] = CANDIDATE_BUCKETS,
+                 max_multiplier: float = 2.5, multiplier_step: float = 0.01):
+        self.pricer = pricer or PricingEngine()
+        self.dispatcher = dispatcher or DispatchEngine()
+        self.acceptance = acceptance or LogisticPricingModel()
+        self.target_tta_s = target_tta_s
+        self.batch_timeout_s = batch_timeout_s
+        self.driver_cost_share = driver_cost_share
+        self.unfilled_penalty_share = unfilled_penalty_share  # Cost of an unfilled order, in attempt-1 prices
+        self.distance_step_km = distance_step_km
+        self.distance_buckets = int(np.ceil(max_distance_km / distance_step_km))
+        self.candidate_buckets = np.asarray(candidate_buckets, dtype=np.int64)
+        if self.candidate_buckets[0] != 0 or np.any(np.diff(self.candidate_buckets) <= 0):
+            raise ValueError("candidate_buckets must start at 0 and increase.")
+        self.grid = np.round(np.arange(1.0, max_multiplier + multiplier_step / 2, multiplier_step), 6)
+        self.rates_version = None
+        self.solve_time_s = 0.0
+
+    def acceptance_params(self, vehicle: VehicleType, is_bad_weather: bool) -> Tuple[float, float]:
+        """(steepness, midpoint) of the acceptance sigmoid the segment is solved with."""
+        if hasattr(self.acceptance, "parameters"):
+            from .acceptance_estimator import segment_key
+            params = self.acceptance.parameters(segment_key(vehicle, is_bad_weather))
+            return params.steepness, params.midpoint
+        return self.acceptance.acceptance_steepness, self.acceptance.acceptance_midpoint
+
+    def solve(self) -> "SurgePolicyTable":
+        """Solves every segment; lookups call this lazily after a rate change."""
+        started = time.perf_counter()
+        vehicles = list(VehicleType)
+        n_att = max(len(batch_sizes(self.dispatcher, int(self.candidate_buckets[-1]))), 1)
+        sizes = np.zeros((len(self.candidate_buckets), n_att), dtype=np.int64)
+        for c, n in enumerate(self.candidate_buckets):
+            row = batch_sizes(self.dispatcher, int(n))
+            sizes[c, :len(row)] = row
+
+        # Segment axes: vehicle x weather x distance bucket x candidate bucket
+        v, w, d, c = np.meshgrid(np.arange(len(vehicles)), [0, 1], np.arange(self.distance_buckets),
+                                 np.arange(len(self.candidate_buckets)), indexing="ij")
+        v, w, d, c = v.ravel(), w.ravel(), d.ravel(), c.ravel()
+        distance = (d + 0.5) * self.distance_step_km  # bucket midpoint
+        base_price = self.pricer.calculate_prices_batch(distance, v, w.astype(bool), 1)
+        params = {(code, weather): self.acceptance_params(vehicle, bool(weather))
+                  for code, vehicle in enumerate(vehicles) for weather in (0, 1)}
+        steepness = np.array([params[key][0] for key in zip(v.tolist(), w.tolist())])
+        midpoint = np.array([params[key][1] for key in zip(v.tolist(), w.tolist())])
+
+        choice, cost, tta, fill, feasible = solve_schedules(
+            base_price, sizes[c], steepness, midpoint, self.target_tta_s, self.grid,
+            self.driver_cost_share, self.batch_timeout_s, self.unfilled_penalty_share * base_price)
+
+        # Baseline: the fixed surge_rate ** (attempt - 1) schedule under the same model
+        surge = np.array([self.pricer.surge_rate ** a for a in range(n_att)])
+        q, q_time = _attempt_tables(base_price, sizes[c], steepness, midpoint, surge,
+                                    self.driver_cost_share, self.batch_timeout_s)
+        fixed = _evaluate(np.broadcast_to(np.arange(n_att), (len(c), n_att)), base_price, surge, q, q_time,
+                          sizes[c], self.batch_timeout_s, self.unfilled_penalty_share * base_price)
+
+        shape = (len(vehicles), 2, self.distance_buckets, len(self.candidate_buckets))
+        self.fixed_cost, self.fixed_tta_s, self.fixed_fill = (values.reshape(shape) for values in fixed)
+        self.multipliers = self.grid[choice].reshape(shape + (n_att,))
+        # Plain-Python copies for the online path: a lookup is a few list indexings, no NumPy scalars
+        self._schedules = self.multipliers.tolist()
+        self._bucket_of = (np.searchsorted(self.candidate_buckets, np.arange(self.candidate_buckets[-1] + 1),
+                                           side="right") - 1).tolist()
+        self.sizes = sizes
+        self.expected_cost = cost.reshape(shape)
+        self.expected_tta_s = tta.reshape(shape)
+        self.fill_probability = fill.reshape(shape)
+        self.feasible = feasible.reshape(shape)
+        self.rates_version = self.pricer.rates_version
+        self.solve_time_s = time.perf_counter() - started
+        return self
+
+    def _cell(self, req: MoveRequest, n_candidates: int) -> tuple:
+        if n_candidates < 0:
+            raise ValueError("n_candidates must be non-negative.")
+        if self.rates_version != self.pricer.rates_version:
+            self.solve()
+        d = min(int(req.distance_km // self.distance_step_km), self.distance_buckets - 1)
+        last = len(self._bucket_of) - 1
+        c = self._bucket_of[n_candidates] if n_candidates <= last else self._bucket_of[last]
+        return VEHICLE_CODES[req.vehicle_type], int(bool(req.is_bad_weather)), max(d, 0), c
+
+    def segment(self, req: MoveRequest, n_candidates: int) -> Segment:
+        """The segment (table cell) whose schedule prices this request."""
+        _, w, d, c = self._cell(req, n_candidates)
+        step, pool = self.distance_step_km, self.candidate_buckets
+        return Segment(req.vehicle_type, bool(w), (d * step, (d + 1) * step), (d + 0.5) * step,
+                       (int(pool[c]), int(pool[c + 1]) - 1 if c + 1 < len(pool) else None))
+
+    def multiplier(self, req: MoveRequest, attempt_number: int, n_candidates: int) -> float:
+        """Surge multiplier for an attempt (attempts past the schedule keep its last step)."""
+        v, w, d, c = self._cell(req, n_candidates)
+        schedule = self._schedules[v][w][d][c]
+        return schedule[min(max(attempt_number, 1), len(schedule)) - 1]
+
+    def calculate_price(self, req: MoveRequest, attempt_number: int = 1, n_candidates: int = 30) -> float:
+        """Policy price: attempt-1 price from the PricingEngine times the segment's multiplier."""
+        base = self.pricer.calculate_price(req, attempt_number=1)
+        return round(base * self.multiplier(req, attempt_number, n_candidates), 2)
+
+    def policy(self, req: MoveRequest, n_candidates: int) -> EscalationPolicy:
+        cell = self._cell(req, n_candidates)
+        sizes = self.sizes[cell[-1]]
+        present = sizes > 0
+        return EscalationPolicy(tuple(self.multipliers[cell][present].tolist()), tuple(sizes[present].tolist()),
+                                float(self.expected_cost[cell]), float(self.expected_tta_s[cell]),
+                                float(self.fill_probability[cell]), bool(self.feasible[cell]))
+
+    def evaluate_fixed_surge(self, req: MoveRequest, n_candidates: int) -> Dict[str, float]:
+        """Expected cost / time / fill of the fixed surge_rate schedule on the same segment."""
+        cell = self._cell(req, n_candidates)
+        return {"expected_cost": float(self.fixed_cost[cell]), "expected_tta_s": float(self.fixed_tta_s[cell]),
+                "fill_probability": float(self.fixed_fill[cell])}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solve surge-escalation policies and show one segment")
+    parser.add_argument("--distance", type=float, default=15.0)
+    parser.add_argument("--vehicle", choices=[v.name for v in VehicleType], default="VAN")
+    parser.add_argument("--weather", action="store_true")
+    parser.add_argument("--candidates", type=int, default=30)
+    parser.add_argument("--target-tta", type=float, default=15.0)
+    args = parser.parse_args()
+
+    table = SurgePolicyTable(target_tta_s=args.target_tta).solve()
+    req = MoveRequest(args.distance, VehicleType[args.vehicle], args.weather)
+    policy = table.policy(req, args.candidates)
+    fixed = table.evaluate_fixed_surge(req, args.candidates)
+    print(f"Solved {table.multipliers[..., 0].size:,} segments in {table.solve_time_s:.2f}s")
+    print(f"Batches {policy.batch_sizes}: multipliers {policy.multipliers} "
+          f"-> prices {[table.calculate_price(req, a, args.candidates) for a in range(1, len(policy.batch_sizes) + 1)]}")
+    segment = table.segment(req, args.candidates)
+    low, high = segment.candidates
+    print(f"Segment: {segment.vehicle_type.name}, {'bad' if segment.is_bad_weather else 'clear'} weather, "
+          f"{segment.distance_km[0]:g}-{segment.distance_km[1]:g} km (modelled at {segment.model_distance_km:g} km), "
+          f"{low}{'+' if high is None else f'-{high}'} candidates")
+    print(f"Policy: expected cost ${policy.expected_cost:.2f}, E[TTA] {policy.expected_tta_s:.1f}s, "
+          f"fill {policy.fill_probability:.1%}{'' if policy.feasible else ' (target not reachable)'}")
+    print(f"Fixed surge {table.pricer.surge_rate}: expected cost ${fixed['expected_cost']:.2f}, "
+          f"E[TTA] {fixed['expected_tta_s']:.1f}s, fill {fixed['fill_probability']:.1%}")
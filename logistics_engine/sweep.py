@@ -0,0 +1,122 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional
+import argparse
+import csv
+import itertools
+import os
+import time
+
+import numpy as np
+
+from .dispatch_engine import DispatchEngine
+from .market_simulator import MarketConfig, MarketSimulator
+from .pricing_engine import PricingEngine
+
+# Tunable parameters and the engine that owns each of them
+DISPATCH_PARAMS = ("w_quality", "w_proximity", "new_driver_bonus")
+PRICING_PARAMS = ("weather_multiplier", "surge_rate")
+METRICS = ("acceptance_rate", "mean_price", "tta_mean_s", "tta_p50_s", "tta_p90_s")
+
+def expand_grid(grid: Dict[str, Iterable[float]]) -> List[Dict[str, float]]:
+    """Cartesian product of a parameter grid, e.g. {"surge_rate": [1.1, 1.15]}."""
+    unknown = set(grid) - set(DISPATCH_PARAMS) - set(PRICING_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {', '.join(sorted(unknown))}")
+    names = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+def run_replications(point: Dict[str, float], market: MarketConfig, base_seed: int,
+                     point_index: int, replications: List[int]) -> np.ndarray:
+    """
+    Runs replications of one parameter point (executes inside a worker process).
+    Each replication is seeded from SeedSequence(base_seed, spawn_key=(point, rep)),
+    so results do not depend on which worker runs it or in what order.
+    Returns a (len(replications), len(METRICS)) array.
+    """
+    results = np.empty((len(replications), len(METRICS)))
+    for row, rep in enumerate(replications):
+        seed = np.random.SeedSequence(base_seed, spawn_key=(point_index, rep)).generate_state(1)[0]
+        dispatcher, pricer = DispatchEngine(), PricingEngine()
+        for name, value in point.items():
+            setattr(dispatcher if name in DISPATCH_PARAMS else pricer, name, value)
+        config = MarketConfig(**{**market.__dict__, "seed": int(seed)})
+        report = MarketSimulator(config, dispatcher=dispatcher, pricer=pricer).run()
+        summary = report.summary()
+        tta = report.time_to_accept_s
+        results[row] = (
+            summary["acceptance_rate"],
+            summary["mean_price"],
+            float(tta.mean()) if tta.size else np.nan,
+            summary["tta_p50_s"],
+            summary["tta_p90_s"],
+        )
+    return results
+
+def run_sweep(grid: Dict[str, Iterable[float]], replications: int, output_path: str,
+              market: Optional[MarketConfig] = None, workers: Optional[int] = None,
+              reps_per_task: int = 10, base_seed: int = 0) -> float:
+    """
+    Fans the replications of every grid point out over a process pool and
+    streams one aggregated CSV row per point as soon as all its replications
+    are done. Returns the wall time in seconds.
+    """
+    market = market or MarketConfig(n_drivers=500, duration_s=3600.0, order_rate_per_s=0.05)
+    points = expand_grid(grid)
+    param_names = sorted(grid)
+    started = time.perf_counter()
+
+    pending = {i: [] for i in range(len(points))}
+    with ProcessPoolExecutor(max_workers=workers) as pool, open(output_path, "w", newline="") as out:
+        writer = csv.writer(out)
+        writer.writerow(param_names + ["replications"]
+                        + [f"{m}_{stat}" for m in METRICS for stat in ("mean", "std")])
+        futures = {}
+        for i, point in enumerate(points):
+            for start in range(0, replications, reps_per_task):
+                reps = list(range(start, min(start + reps_per_task, replications)))
+                futures[pool.submit(run_replications, point, market, base_seed, i, reps)] = (i, start)
+
+        for future in as_completed(futures):
+            i, start = futures[future]
+            pending[i].append((start, future.result()))
+            # Aggregate in replication order so the output is identical for any worker count
+            done = np.concatenate([chunk for _, chunk in sorted(pending[i], key=lambda c: c[0])])
+            if len(done) < replications:
+                continue
+            stats = []
+            for col in range(len(METRICS)):
+                stats += [np.nanmean(done[:, col]), np.nanstd(done[:, col])]
+            writer.writerow([points[i][n] for n in param_names] + [replications]
+                            + [f"{v:.6g}" for v in stats])
+            out.flush()
+            del pending[i]
+    return time.perf_counter() - started
+
+def parse_grid(items: List[str]) -> Dict[str, List[float]]:
+    """Parses CLI grid specs like "surge_rate=1.1,1.15,1.2"."""
+    grid = {}
+    for item in items:
+        name, _, values = item.partition("=")
+        grid[name] = [float(v) for v in values.split(",")]
+    return grid
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel Monte Carlo parameter sweep")
+    parser.add_argument("--grid", nargs="+", required=True,
+                        help="Parameter values, e.g. w_quality=0.6,0.7 surge_rate=1.1,1.15")
+    parser.add_argument("--replications", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--reps-per-task", type=int, default=10)
+    parser.add_argument("--output", type=str, default="sweep_results.csv")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--drivers", type=int, default=500)
+    parser.add_argument("--hours", type=float, default=1.0)
+    parser.add_argument("--rate", type=float, default=0.05, help="Order arrivals per second")
+    args = parser.parse_args()
+
+    grid = parse_grid(args.grid)
+    market = MarketConfig(n_drivers=args.drivers, duration_s=args.hours * 3600.0, order_rate_per_s=args.rate)
+    wall = run_sweep(grid, args.replications, args.output, market, args.workers, args.reps_per_task, args.seed)
+    total = len(expand_grid(grid)) * args.replications
+    print(f"{total:,} replications on {args.workers} workers in {wall:.1f}s "
+          f"({total / wall:.1f} replications/s) -> {args.output}")
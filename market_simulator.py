@@ -0,0 +1,9 @@
+"""Alias of logistics_engine.market_simulator, so existing imports and `python market_simulator.py` keep working."""
+import importlib
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("logistics_engine.market_simulator", run_name="__main__", alter_sys=True)
+else:
+    sys.modules[__name__] = importlib.import_module("logistics_engine.market_simulator")
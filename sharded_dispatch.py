@@ -0,0 +1,9 @@
+"""Alias of logistics_engine.sharded_dispatch, so existing imports and `python sharded_dispatch.py` keep working."""
+import importlib
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("logistics_engine.sharded_dispatch", run_name="__main__", alter_sys=True)
+else:
+    sys.modules[__name__] = importlib.import_module("logistics_engine.sharded_dispatch")
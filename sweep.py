@@ -0,0 +1,9 @@
+"""Alias of logistics_engine.sweep, so existing imports and `python sweep.py` keep working."""
+import importlib
+import sys
+
+if __name__ == "__main__":
+    import runpy
+    runpy.run_module("logistics_engine.sweep", run_name="__main__", alter_sys=True)
+else:
+    sys.modules[__name__] = importlib.import_module("logistics_engine.sweep")
@@ -0,0 +1,62 @@
+"""
+Exposure-ledger scoring: the list, DriverFleet and scalar paths must read the
+same driver's offers, whatever order the ledger registered the ids in.
+"""
+import numpy as np
+
+from logistics_engine.dispatch_engine import DispatchEngine, Driver
+from logistics_engine.driver_fleet import DriverFleet
+from logistics_engine.exposure import ExposureLedger
+
+def make_drivers():
+    return [Driver(f"d{i}", f"Driver {i}", 4.0 + 0.1 * i, 1.0 + i, days) for i, days in enumerate([1, 2, 0, 3, 30])]
+
+def engine_with_offers(ids_order, offers) -> DispatchEngine:
+    ledger = ExposureLedger(capacity=2, offer_budget=10)
+    ledger.slots(ids_order)
+    for driver_id, count in offers.items():
+        for _ in range(count):
+            ledger.record_offer(driver_id, 0.0)
+    engine = DispatchEngine()
+    engine.exposure = ledger
+    return engine
+
+def fleet_scores(engine: DispatchEngine, fleet: DriverFleet) -> np.ndarray:
+    rows = np.arange(len(fleet))
+    return engine.score_drivers(fleet.rating, fleet.location_km, fleet.days_in_system,
+                                engine.exposure_slots(fleet, rows))
+
+def test_list_and_fleet_paths_give_the_same_scores():
+    drivers = make_drivers()
+    fleet = DriverFleet.from_drivers(drivers)
+    # Registered in reverse: slot numbers differ from fleet rows
+    engine = engine_with_offers(["d4", "d3", "d2", "d1", "d0"], {"d0": 8, "d2": 1, "d3": 5})
+
+    scalar = np.array([engine._calculate_score(driver) for driver in drivers])
+    np.testing.assert_allclose(fleet_scores(engine, fleet), scalar, rtol=0, atol=1e-12)
+
+    list_batches = [[d.id for d in batch] for batch in engine.iter_batches(drivers)]
+    fleet_batches = [[d.id for d in batch] for batch in engine.iter_batches(fleet)]
+    row_batches = [fleet.ids[rows].tolist() for rows in engine.iter_fleet_batches(fleet)]
+    assert list_batches == fleet_batches == row_batches
+
+def test_fleet_can_grow_after_the_ledger_is_built():
+    drivers = make_drivers()
+    fleet = DriverFleet.from_drivers(drivers[:3])
+    engine = DispatchEngine()
+    engine.exposure = ExposureLedger.for_fleet(fleet)
+    fleet.add(drivers[3])
+    fleet.add(drivers[4])
+
+    ranked = [fleet.ids[rows].tolist() for rows in engine.iter_fleet_batches(fleet)]
+    assert sorted(sum(ranked, [])) == [d.id for d in drivers]
+    scalar = np.array([engine._calculate_score(driver) for driver in drivers])
+    np.testing.assert_allclose(fleet_scores(engine, fleet), scalar, rtol=0, atol=1e-12)
+
+def test_ranking_does_not_register_drivers():
+    drivers = make_drivers()
+    engine = engine_with_offers(["d0"], {"d0": 3})
+    list(engine.iter_batches(drivers))
+    list(engine.iter_fleet_batches(DriverFleet.from_drivers(drivers)))
+    assert len(engine.exposure) == 1
+    assert engine.exposure.fairness()["drivers"] == 1
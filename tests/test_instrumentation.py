@@ -0,0 +1,29 @@
+from logistics_engine.dispatch_engine import DispatchEngine, Driver
+from logistics_engine.driver_fleet import DriverFleet
+from logistics_engine.instrumentation import Instrumentation
+
+def make_fleet(n: int = 40) -> DriverFleet:
+    return DriverFleet.from_drivers(Driver(f"D{i}", f"Driver {i}", 3.5 + (i % 15) / 10, float(i % 7), i % 20)
+                                    for i in range(n))
+
+def test_cascade_generators_are_timed_per_iteration():
+    instrumentation = Instrumentation()
+    dispatcher = instrumentation.instrument_dispatcher(DispatchEngine())
+    fleet = make_fleet()
+    plain = [rows.tolist() for rows in DispatchEngine().iter_fleet_batches(fleet)]
+
+    assert [rows.tolist() for rows in dispatcher.iter_fleet_batches(fleet)] == plain
+    cascade = dispatcher.iter_batches(fleet.to_drivers())
+    next(cascade)
+    cascade.close()  # abandoned after batch 1, as an accepted order does
+
+    stages = instrumentation.snapshot()
+    assert stages["dispatch.iter_fleet_batches"]["calls"] == 1
+    assert stages["dispatch.iter_batches"]["calls"] == 1
+    assert stages["dispatch.iter_fleet_batches"]["max_size"] == len(fleet)
+    # score_drivers runs inside both cascades and is recorded as its own stage
+    assert stages["dispatch.score_drivers"]["calls"] == 2
+    assert stages["dispatch.score_drivers"]["items"] == 2 * len(fleet)
+
+    instrumentation.uninstrument()
+    assert "iter_fleet_batches" not in vars(dispatcher)
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+import logistics_engine as le
+
+def test_top_level_modules_alias_the_package():
+    import pricing_engine
+    import sharded_dispatch
+    from ver1 import pricing_engine as ver1_pricing
+    from logistics_engine import cost_model, pricing_engine as engine
+
+    assert pricing_engine is engine
+    assert sharded_dispatch.ShardedDispatcher is le.ShardedDispatcher
+    assert ver1_pricing is cost_model
+    assert le.LogisticPricingModel is cost_model.LogisticPricingModel
+
+def test_every_export_resolves():
+    for name in le.__all__:
+        assert getattr(le, name).__module__.startswith("logistics_engine.")
+
+def test_quote_path_does_not_load_numpy():
+    code = ("import sys, logistics_engine as le\n"
+            "le.quote(le.MoveRequest(15.0, le.VehicleType.VAN), attempt_number=2)\n"
+            "print('numpy' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
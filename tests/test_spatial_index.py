@@ -0,0 +1,27 @@
+import math
+import random
+
+from logistics_engine.spatial_index import GridIndex
+
+def make_index(n: int = 500, seed: int = 0) -> GridIndex:
+    rng = random.Random(seed)
+    index = GridIndex(cell_km=1.0)
+    for i in range(n):
+        index.update(f"d{i}", rng.uniform(0.0, 30.0), rng.uniform(0.0, 30.0))
+    return index
+
+def brute_force(index: GridIndex, x: float, y: float, radius_km: float):
+    found = sorted((math.hypot(px - x, py - y), item_id) for item_id, (px, py) in index._positions.items())
+    return [(item_id, dist) for dist, item_id in found if dist <= radius_km]
+
+def test_query_radius_matches_a_full_scan():
+    index = make_index()
+    for radius_km in (0.0, 0.7, 2.5, 12.0, 45.0, 1e6):
+        assert index.query_radius(10.0, 20.0, radius_km) == brute_force(index, 10.0, 20.0, radius_km)
+
+def test_query_radius_accepts_an_infinite_radius():
+    index = make_index()
+    hits = index.query_radius(0.0, 0.0, math.inf)
+    assert hits == brute_force(index, 0.0, 0.0, math.inf)
+    assert len(hits) == len(index)
+    assert GridIndex().query_radius(0.0, 0.0, math.inf) == []